@@ -0,0 +1,95 @@
+import json
+import time
+import asyncio
+import pandas as pd
+import numpy as np
+from abdmf import ABDMF
+from abdmf.scoring_service import ScoringService, serve_http
+
+def generate_sample_data(n_samples: int = 5000):
+    """Generate sample hiring data for the load test."""
+    np.random.seed(42)
+    
+    return pd.DataFrame({
+        'gender': np.random.choice(['M', 'F'], n_samples),
+        'race': np.random.choice(['A', 'B', 'C'], n_samples),
+        'age': np.random.randint(22, 65, n_samples),
+        'experience': np.random.randint(0, 30, n_samples),
+        'education_score': np.random.uniform(0, 100, n_samples),
+        'interview_score': np.random.uniform(0, 100, n_samples),
+        'selected': np.random.choice([0, 1], n_samples, p=[0.7, 0.3])
+    })
+
+async def client(port: int, candidates: list, latencies: list):
+    """Send candidates one after another over a keep-alive connection."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    
+    for candidate in candidates:
+        body = json.dumps(candidate).encode()
+        start = time.perf_counter()
+        writer.write(
+            f"POST /evaluate HTTP/1.1\r\nHost: localhost\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+        
+        await reader.readline()
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line == b'\r\n':
+                break
+            if line.lower().startswith(b'content-length'):
+                length = int(line.split(b':')[1])
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+        
+    writer.close()
+
+async def run_load(system, max_batch_size: int, concurrency: int, requests_per_client: int):
+    """Measure throughput and latency through the HTTP stand-in."""
+    candidates = generate_sample_data(concurrency * requests_per_client).drop(
+        columns='selected'
+    ).to_dict('records')
+    candidates = [{k: (v.item() if hasattr(v, 'item') else v) for k, v in c.items()} for c in candidates]
+    
+    async with ScoringService(system, max_batch_size=max_batch_size, max_wait_ms=5) as service:
+        server = await serve_http(service, port=0)
+        port = server.sockets[0].getsockname()[1]
+        latencies = []
+        
+        start = time.perf_counter()
+        await asyncio.gather(*[
+            client(port, candidates[i::concurrency], latencies)
+            for i in range(concurrency)
+        ])
+        elapsed = time.perf_counter() - start
+        
+        server.close()
+        await server.wait_closed()
+        
+    return {
+        'max_batch_size': max_batch_size,
+        'throughput_rps': len(latencies) / elapsed,
+        'p50_ms': np.percentile(latencies, 50) * 1000,
+        'p99_ms': np.percentile(latencies, 99) * 1000,
+        'mean_batch_size': service.stats['requests'] / max(service.stats['batches'], 1)
+    }
+
+def main():
+    system = ABDMF()
+    system.scan_historical_data(generate_sample_data())
+    
+    for max_batch_size in [1, 64]:
+        result = asyncio.run(run_load(
+            system, max_batch_size, concurrency=64, requests_per_client=20
+        ))
+        print(
+            f"max_batch_size={result['max_batch_size']:>3}: "
+            f"{result['throughput_rps']:8.1f} req/s, "
+            f"p50 {result['p50_ms']:7.1f} ms, p99 {result['p99_ms']:7.1f} ms, "
+            f"mean batch {result['mean_batch_size']:.1f}"
+        )
+
+if __name__ == "__main__":
+    main()
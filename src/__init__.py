@@ -1,7 +1,18 @@
+import os
+import copy
+import pandas as pd
+from typing import Dict, List, Any
 from .bias_detector import BiasDetector
+from .bias_monitor import BiasMonitor
+from .cache import ResultCache
 from .decision_analyzer import DecisionAnalyzer
 from .feedback_system import FeedbackSystem
-from .utils import load_config, validate_data
+from .parallel_scan import ParallelBiasScanner
+from .scoring_service import ScoringService
+from .model_registry import ModelRegistry
+from .model_selection import CrossValidator
+from .threshold_mitigator import ThresholdMitigator
+from .utils import load_config, validate_data, iter_data_chunks, ReservoirSample, fingerprint_data
 
 class ABDMF:
     def __init__(self, config_path: str = None):
@@ -9,21 +20,248 @@ class ABDMF:
         self.bias_detector = BiasDetector(self.config.get('bias_detector', {}))
         self.decision_analyzer = DecisionAnalyzer(self.config.get('decision_analyzer', {}))
         self.feedback_system = FeedbackSystem(self.config.get('feedback_system', {}))
+        self.bias_monitor = BiasMonitor(self.bias_detector)
+        self.scan_cache = ResultCache(**self.config.get('cache', {}))
+        self.mitigator = None
+        self.mitigation_attribute = None
         
-    def scan_historical_data(self, data):
-        """Scan historical hiring data for bias patterns."""
-        validate_data(data, required_columns=['selected'])
+    def scan_historical_data(self, data, chunksize: int = 100000,
+                             training_sample_size: int = 100000, n_jobs: int = 1):
+        """Scan historical hiring data for bias patterns.
         
-        bias_scan = self.bias_detector.generate_bias_report(data)
+        ``data`` may be a DataFrame, a path to a CSV or Parquet file, or an
+        iterable of DataFrame chunks. Files and iterables are scanned chunk
+        by chunk: group counts are merged into the bias report and the
+        decision analyzer is trained on a reservoir sample of at most
+        ``training_sample_size`` rows, so memory use does not grow with the
+        size of the input. With ``n_jobs`` other than 1, DataFrames are
+        scanned over a process pool (``None`` uses every CPU).
         
-        features = data.drop(['selected'] + self.bias_detector.config['protected_attributes'], axis=1)
-        model_metrics = self.decision_analyzer.train(features, data['selected'])
+        Results for DataFrames and files are cached by a fingerprint of the
+        input and configuration; rescanning unchanged data returns the
+        cached result and restores the model trained for it.
+        """
+        cache_key = self._scan_cache_key(data, chunksize, training_sample_size)
+        if cache_key is not None:
+            cached = self.scan_cache.get(cache_key)
+            if cached is not None:
+                self._restore_scan(cached)
+                return copy.deepcopy(cached['result'])
+                
+        if isinstance(data, pd.DataFrame):
+            validate_data(data, required_columns=['selected'])
+            if n_jobs == 1:
+                bias_scan = self.bias_detector.generate_bias_report(data)
+            else:
+                bias_scan = ParallelBiasScanner(
+                    self.bias_detector, n_jobs=n_jobs
+                ).generate_bias_report(data)
+            training_data = data
+        else:
+            bias_scan, training_data = self._scan_chunks(
+                iter_data_chunks(data, chunksize), training_sample_size
+            )
         
-        return {
+        features = self._training_features(training_data)
+        
+        # Features standing in for protected attributes survive their removal
+        proxies = self.bias_detector.detect_proxies(training_data, features.columns.tolist())
+        bias_scan['proxy_variables'] = proxies['flagged']
+        bias_scan['recommendations'] = bias_scan['recommendations'] + proxies['recommendations']
+        
+        model_metrics = self.decision_analyzer.train(features, training_data['selected'])
+        # Saved with the model, so that monitoring after loading it bins like this scan
+        self.decision_analyzer.bin_edges = dict(self.bias_detector.bin_edges)
+        
+        result = {
             'bias_scan': bias_scan,
             'model_metrics': model_metrics,
             'timestamp': pd.Timestamp.now()
         }
+        
+        if cache_key is not None:
+            self.scan_cache.put(cache_key, {
+                'result': copy.deepcopy(result),
+                'model': self.decision_analyzer.model,
+                'feature_names': self.decision_analyzer.feature_names,
+                'preprocessing': self.decision_analyzer.preprocessing,
+                'holdout': self.decision_analyzer.holdout,
+                'bin_edges': dict(self.bias_detector.bin_edges)
+            })
+            
+        return result
+    
+    def use_analyzer(self, analyzer: DecisionAnalyzer):
+        """Score with ``analyzer``, e.g. loaded from a ModelRegistry.
+        
+        Protected attributes are then binned with the edges of the scan the
+        model was trained in, for monitoring and mitigation alike.
+        """
+        self.decision_analyzer = analyzer
+        self.bias_detector.set_bin_edges(analyzer.bin_edges)
+        
+    def update_model(self, data: pd.DataFrame) -> Dict[str, Any]:
+        """Refresh the decision model with recently labeled decisions.
+        
+        Only ``data`` is trained on (see ``DecisionAnalyzer.update``); use
+        ``scan_historical_data`` for a full bias scan and retraining.
+        """
+        validate_data(data, required_columns=['selected'])
+        
+        features = self._training_features(data)
+        return self.decision_analyzer.update(features, data['selected'])
+    
+    def cross_validate_model(self, data: pd.DataFrame, n_folds: int = 5,
+                             n_jobs: int = None) -> Dict[str, Any]:
+        """Cross-validate the decision model with per-fold accuracy and disparate impact.
+        
+        Folds are fitted over a process pool (``None`` uses every CPU); see
+        ``CrossValidator``. The trained model is left unchanged.
+        """
+        validate_data(data, required_columns=['selected'])
+        
+        return CrossValidator(
+            self.decision_analyzer, self.bias_detector, n_folds=n_folds, n_jobs=n_jobs
+        ).cross_validate(
+            self._training_features(data), data['selected'], self._protected_columns(data)
+        )
+    
+    def tune_model(self, data: pd.DataFrame, param_grid: Dict[str, List[Any]],
+                   n_folds: int = 3, time_budget: float = None,
+                   n_jobs: int = None) -> Dict[str, Any]:
+        """Search ``param_grid`` by successive halving and retrain with the best parameters."""
+        validate_data(data, required_columns=['selected'])
+        
+        features = self._training_features(data)
+        search = CrossValidator(
+            self.decision_analyzer, self.bias_detector, n_folds=n_folds, n_jobs=n_jobs
+        ).successive_halving(
+            features, data['selected'], param_grid,
+            self._protected_columns(data), time_budget=time_budget
+        )
+        search['model_metrics'] = self.decision_analyzer.train(features, data['selected'])
+        
+        return search
+    
+    def fit_mitigation(self, data: pd.DataFrame, attribute: str = None,
+                       target_disparate_impact: float = None) -> Dict[str, Any]:
+        """Fit per-group decision thresholds for ``attribute`` on validation data.
+        
+        ``data`` should be labeled decisions the model was not trained on.
+        Afterwards, ``evaluate_candidate`` and ``evaluate_candidates`` select
+        candidates by the threshold of their group (see ``ThresholdMitigator``).
+        """
+        settings = self.config.get('mitigation', {})
+        attribute = attribute or settings.get('attribute')
+        if attribute is None:
+            raise ValueError("No protected attribute to mitigate bias for")
+        if target_disparate_impact is None:
+            target_disparate_impact = settings.get('target_disparate_impact', 0.8)
+            
+        validate_data(data, required_columns=['selected', attribute])
+        self.bias_detector.fit_bins(data)
+        
+        mitigator = ThresholdMitigator(
+            target_disparate_impact,
+            min_group_size=self.bias_detector.config['minimum_sample_size']
+        ).fit(
+            self.decision_analyzer.score(self._training_features(data)),
+            data['selected'],
+            self.bias_detector.group_labels(data, attribute)
+        )
+        self.mitigator = mitigator
+        self.mitigation_attribute = attribute
+        
+        return {
+            'attribute': attribute,
+            'thresholds': dict(mitigator.thresholds),
+            **mitigator.fit_summary
+        }
+    
+    def _mitigate(self, decision_analyses: List[Dict[str, Any]], candidate_data: pd.DataFrame):
+        """Replace model predictions by the fitted per-group threshold decisions."""
+        if self.mitigator is None or self.mitigation_attribute not in candidate_data:
+            return
+            
+        # Binary models: confidence is the probability of the predicted class
+        scores = [
+            analysis['confidence'] if analysis['prediction'] else 1 - analysis['confidence']
+            for analysis in decision_analyses
+        ]
+        decisions = self.mitigator.predict(
+            scores, self.bias_detector.group_labels(candidate_data, self.mitigation_attribute)
+        )
+        
+        for analysis, decision in zip(decision_analyses, decisions):
+            analysis['model_prediction'] = analysis['prediction']
+            analysis['prediction'] = bool(decision)
+            analysis['mitigated'] = analysis['prediction'] != analysis['model_prediction']
+    
+    def _training_features(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Model features of ``data``: everything but the outcome and protected attributes."""
+        return data.drop(
+            ['selected'] + self.bias_detector.config['protected_attributes'],
+            axis=1, errors='ignore'
+        )
+    
+    def _protected_columns(self, data: pd.DataFrame) -> pd.DataFrame:
+        return data[[
+            attr for attr in self.bias_detector.config['protected_attributes']
+            if attr in data.columns
+        ]]
+    
+    def _scan_cache_key(self, data, chunksize: int, training_sample_size: int):
+        """Fingerprint of a scan's input and configuration, None if uncacheable."""
+        # Bin edges are part of the scan's configuration; fit them up front so
+        # that a first scan and its repetitions share the same key
+        if isinstance(data, pd.DataFrame):
+            self.bias_detector.fit_bins(data)
+            extra = ()
+        elif isinstance(data, (str, os.PathLike)):
+            self.bias_detector.fit_bins(next(iter_data_chunks(data, chunksize)))
+            extra = (chunksize, training_sample_size)
+        else:
+            return None
+            
+        return fingerprint_data(
+            data, *extra,
+            self.bias_detector.config,
+            {k: v.tolist() for k, v in self.bias_detector.bin_edges.items()},
+            self.decision_analyzer.config
+        )
+    
+    def _restore_scan(self, cached: Dict[str, Any]):
+        """Restore the detector and analyzer state left behind by a cached scan."""
+        self.bias_detector.set_bin_edges(cached['bin_edges'])
+        self.decision_analyzer.bin_edges = dict(cached['bin_edges'])
+        self.decision_analyzer.model = cached['model']
+        self.decision_analyzer.feature_names = cached['feature_names']
+        self.decision_analyzer.preprocessing = cached['preprocessing']
+        # update() checks the restored model against the holdout of its own scan
+        self.decision_analyzer.holdout = cached['holdout']
+        self.decision_analyzer.updates = 0
+        self.decision_analyzer.performance_metrics = copy.deepcopy(
+            cached['result']['model_metrics']
+        )
+    
+    def _scan_chunks(self, chunks, training_sample_size: int):
+        """Build the bias report and a training sample from a stream of chunks."""
+        counts = {}
+        sample = ReservoirSample(
+            training_sample_size,
+            random_state=self.decision_analyzer.config['model_params'].get('random_state')
+        )
+        
+        for chunk in chunks:
+            counts = self.bias_detector.accumulate_group_counts(chunk, counts)
+            sample.update(chunk)
+            
+        if not sample.rows_seen:
+            raise ValueError("No historical data to scan")
+            
+        bias_scan = self.bias_detector.build_report(counts, sample.rows_seen)
+        
+        return bias_scan, sample.sample
     
     def evaluate_candidate(self, candidate_data):
         """Evaluate a candidate while checking for potential bias."""
@@ -37,6 +275,13 @@ class ABDMF:
         
         features = candidate_data.drop(list(protected_attributes.keys()), axis=1)
         decision_analysis = self.decision_analyzer.analyze_decision(features)
+        self._mitigate([decision_analysis], candidate_data.iloc[:1])
+        
+        # Feed the live bias monitor with the decision just made
+        self.bias_monitor.record_decision(
+            {attr: values.iloc[0] for attr, values in protected_attributes.items()},
+            decision_analysis['prediction']
+        )
         
         return {
             'decision_analysis': decision_analysis,
@@ -44,6 +289,50 @@ class ABDMF:
             'timestamp': pd.Timestamp.now()
         }
         
+    def evaluate_candidates(self, candidate_data: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Evaluate a batch of candidates, one result per row.
+        
+        Scores the whole batch in one model pass and records every decision
+        in the live bias monitor.
+        """
+        validate_data(candidate_data)
+        
+        protected_columns = [
+            attr for attr in self.bias_detector.config['protected_attributes']
+            if attr in candidate_data
+        ]
+        
+        features = candidate_data.drop(protected_columns, axis=1)
+        decision_analyses = self.decision_analyzer.analyze_decisions(features)
+        self._mitigate(decision_analyses, candidate_data)
+        
+        self.bias_monitor.record_decisions(
+            candidate_data[protected_columns],
+            [analysis['prediction'] for analysis in decision_analyses]
+        )
+        
+        timestamp = pd.Timestamp.now()
+        return [
+            {
+                'decision_analysis': analysis,
+                'protected_attributes': protected_attributes,
+                'timestamp': timestamp
+            }
+            for analysis, protected_attributes in zip(
+                decision_analyses,
+                candidate_data[protected_columns].to_dict('records')
+            )
+        ]
+        
+    def scoring_service(self) -> ScoringService:
+        """ScoringService in front of this system, with the ``scoring_service`` settings."""
+        settings = self.config.get('scoring_service', {})
+        return ScoringService(
+            self,
+            max_batch_size=settings.get('max_batch_size', 64),
+            max_wait_ms=settings.get('max_wait_ms', 5.0)
+        )
+        
     def generate_report(self):
         """Generate a comprehensive system performance report."""
         feedback_analysis = self.feedback_system.analyze_feedback()
@@ -1,6 +1,14 @@
+import copy
 import pandas as pd
 import numpy as np
+import itertools
+from scipy import stats
 from typing import Dict, List, Any
+from .utils import validate_data
+
+def merge_group_counts(*counts: pd.DataFrame) -> pd.DataFrame:
+    """Merge group count tables computed over disjoint parts of a dataset."""
+    return pd.concat(counts).groupby(level=0, dropna=False, sort=False).sum()
 
 class BiasDetector:
     def __init__(self, config: Dict[str, Any] = None):
@@ -10,59 +18,354 @@ class BiasDetector:
                 'career_change', 'disability_status', 'location'
             ],
             'threshold': 0.2,
-            'minimum_sample_size': 100
+            'minimum_sample_size': 100,
+            'binning': {
+                'age': {'edges': [40]}
+            },
+            'significance': {
+                'confidence_level': 0.95,
+                'method': 'asymptotic',
+                'bootstrap_samples': 1000
+            },
+            'proxy_detection': {
+                'threshold': 0.3,
+                'bins': 10,
+                'max_levels': 50
+            }
         }
         self.baseline_metrics = {}
+        self.bin_edges = {}
+        # Binning configuration the edges in ``bin_edges`` were computed for
+        self._binning = copy.deepcopy(self.config.get('binning', {}))
         
-    def calculate_disparate_impact(self, data: pd.DataFrame, attribute: str) -> float:
-        """Calculate disparate impact ratio for a protected attribute."""
-        groups = data[attribute].unique()
-        selection_rates = {}
+    def fit_bins(self, data: pd.DataFrame):
+        """Compute the bin edges of every binned attribute present in ``data``.
         
-        for group in groups:
-            group_data = data[data[attribute] == group]
-            if len(group_data) >= self.config['minimum_sample_size']:
-                selection_rates[group] = (group_data['selected'] == 1).mean()
+        Edges are computed once and reused for detection, monitoring and
+        intersectional analysis. Fixed edges need no data; quantile edges
+        are taken from the first data they are fitted on. Scans fit their
+        data first; nothing else fits quantile edges. Changing
+        ``config['binning']`` discards the edges computed so far.
+        """
+        self._sync_binning()
+        for attribute, spec in self.config.get('binning', {}).items():
+            if attribute in data.columns and attribute not in self.bin_edges:
+                self.bin_edges[attribute] = self._fit_edges(attribute, spec, data)
+                
+    def bins_fitted(self, attribute: str) -> bool:
+        """Whether ``attribute`` can be binned: unbinned, fixed edges or fitted quantiles."""
+        self._sync_binning()
+        spec = self.config.get('binning', {}).get(attribute)
+        return spec is None or 'quantiles' not in spec or attribute in self.bin_edges
         
-        if not selection_rates:
-            return 0.0
+    def get_bin_edges(self, attribute: str) -> np.ndarray:
+        """Bin edges of a binned attribute, or None if it is not binned."""
+        self._sync_binning()
+        if attribute in self.bin_edges:
+            return self.bin_edges[attribute]
+            
+        spec = self.config.get('binning', {}).get(attribute)
+        if spec is None:
+            return None
+        if 'quantiles' in spec:
+            raise ValueError(
+                f"Quantile bins for {attribute} have not been fitted yet"
+            )
+            
+        edges = self.bin_edges[attribute] = self._fit_edges(attribute, spec)
+        return edges
+    
+    def set_bin_edges(self, bin_edges: Dict[str, np.ndarray]):
+        """Use edges fitted earlier, e.g. saved with a model, for the current binning."""
+        self._sync_binning()
+        self.bin_edges.update(bin_edges)
+    
+    def _sync_binning(self):
+        """Drop computed edges if the binning configuration changed since."""
+        binning = self.config.get('binning', {})
+        if binning != self._binning:
+            self.bin_edges.clear()
+            self._binning = copy.deepcopy(binning)
+    
+    def _fit_edges(self, attribute: str, spec: Dict[str, Any],
+                   data: pd.DataFrame = None) -> np.ndarray:
+        if 'edges' in spec:
+            edges = np.sort(np.asarray(spec['edges'], dtype=float))
+        elif 'quantiles' in spec:
+            values = pd.to_numeric(data[attribute], errors='coerce').dropna()
+            quantiles = np.linspace(0, 1, spec['quantiles'] + 1)[1:-1]
+            edges = np.unique(np.quantile(values, quantiles)) if len(values) else np.array([])
+        else:
+            raise ValueError(
+                f"Binning for {attribute} needs either 'edges' or 'quantiles'"
+            )
+            
+        return edges
+    
+    def _bin_labels(self, attribute: str, edges: np.ndarray) -> np.ndarray:
+        """Group label of every bin, e.g. '<40' and '40+' for edges [40]."""
+        labels = self.config['binning'][attribute].get('labels')
+        if labels is not None:
+            if len(labels) != len(edges) + 1:
+                raise ValueError(
+                    f"Binning for {attribute} needs {len(edges) + 1} labels"
+                )
+            return np.asarray(labels, dtype=object)
+            
+        bounds = [f"{edge:g}" for edge in edges]
+        if not bounds:
+            return np.array(['all'], dtype=object)
             
-        max_rate = max(selection_rates.values())
-        min_rate = min(selection_rates.values())
+        return np.array(
+            [f"<{bounds[0]}"] +
+            [f"{lo}-{hi}" for lo, hi in zip(bounds[:-1], bounds[1:])] +
+            [f"{bounds[-1]}+"],
+            dtype=object
+        )
+    
+    def bin_value(self, attribute: str, value: Any) -> Any:
+        """Map a single attribute value to its group label."""
+        edges = self.get_bin_edges(attribute)
+        if edges is None or pd.isna(value):
+            return value
+            
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return None
+            
+        return self._bin_labels(attribute, edges)[np.searchsorted(edges, value, side='right')]
+    
+    def _factorize(self, data: pd.DataFrame, attribute: str):
+        """Integer group codes (-1 for missing values) and group labels."""
+        edges = self.get_bin_edges(attribute)
+        if edges is None:
+            return pd.factorize(data[attribute])
+            
+        values = pd.to_numeric(data[attribute], errors='coerce').to_numpy(dtype=float)
+        valid = ~np.isnan(values)
+        bins = np.digitize(values[valid], edges)
+        
+        # Keep only the bins that occur, like pd.factorize does
+        present = np.flatnonzero(np.bincount(bins, minlength=len(edges) + 1))
+        lookup = np.full(len(edges) + 1, -1, dtype=np.int64)
+        lookup[present] = np.arange(len(present))
         
-        return min_rate / max_rate if max_rate > 0 else 0.0
+        codes = np.full(len(values), -1, dtype=np.int64)
+        codes[valid] = lookup[bins]
+        
+        return codes, pd.Index(self._bin_labels(attribute, edges)[present], dtype=object)
+    
+    def group_labels(self, data: pd.DataFrame, attribute: str) -> pd.Series:
+        """Group label of every row (binned where configured), NaN when missing."""
+        codes, groups = self._factorize(data, attribute)
+        return pd.Series(
+            pd.Categorical.from_codes(codes, groups), index=data.index, name=attribute
+        ).astype(object)
+    
+    def compute_group_counts(self, data: pd.DataFrame, attribute: str) -> pd.DataFrame:
+        """Count records and selections per group of an attribute in one pass.
+        
+        Returns a table indexed by group with ``total`` and ``selected``
+        columns. Records with a missing attribute value are kept under a
+        NaN label so that they can still be accounted for.
+        """
+        codes, groups = self._factorize(data, attribute)
+        selected = (data['selected'] == 1).to_numpy(dtype=np.int64)
+        
+        # Shift codes so that missing values (code -1) land in bin 0 and
+        # interleave the selection flag so a single bincount yields both
+        # the per-group totals and the per-group selections.
+        n_bins = len(groups) + 1
+        flat = np.bincount(
+            (codes + 1) * 2 + selected, minlength=2 * n_bins
+        ).reshape(n_bins, 2)
+        
+        return self._counts_table(flat, groups, attribute)
+    
+    def _counts_table(self, flat: np.ndarray, groups: pd.Index, attribute: str) -> pd.DataFrame:
+        """Group count table from (unselected, selected) counts per group code.
+        
+        Row 0 of ``flat`` holds records with a missing value, row i + 1 the
+        records of ``groups[i]``. Groups without any records are left out.
+        """
+        totals = flat[1:].sum(axis=1)
+        present = totals > 0
+        counts = pd.DataFrame({
+            'total': totals[present],
+            'selected': flat[1:, 1][present]
+        }, index=pd.Index(groups[present], name=attribute))
+        
+        n_missing = int(flat[0].sum())
+        if n_missing:
+            counts = pd.concat([counts, pd.DataFrame(
+                {'total': [n_missing], 'selected': [int(flat[0, 1])]},
+                index=pd.Index([np.nan], name=attribute)
+            )])
+            
+        return counts
+    
+    def _selection_rates(self, counts: pd.DataFrame) -> pd.Series:
+        """Selection rate of every group meeting the minimum sample size."""
+        eligible = counts[
+            counts.index.notna() &
+            (counts['total'] >= self.config['minimum_sample_size'])
+        ]
+        return eligible['selected'] / eligible['total']
+    
+    def calculate_disparate_impact(self, data: pd.DataFrame, attribute: str) -> float:
+        """Calculate disparate impact ratio for a protected attribute."""
+        self.fit_bins(data)
+        return self._disparate_impact(
+            self._selection_rates(self.compute_group_counts(data, attribute))
+        )
     
     def calculate_statistical_parity(self, data: pd.DataFrame, attribute: str) -> float:
         """Calculate statistical parity difference."""
-        groups = data[attribute].unique()
-        selection_rates = {}
+        self.fit_bins(data)
+        return self._statistical_parity(
+            self._selection_rates(self.compute_group_counts(data, attribute))
+        )
+    
+    def _disparate_impact(self, selection_rates: pd.Series) -> float:
+        if selection_rates.empty:
+            return 0.0
+            
+        max_rate = selection_rates.max()
+        min_rate = selection_rates.min()
         
-        for group in groups:
-            group_data = data[data[attribute] == group]
-            if len(group_data) >= self.config['minimum_sample_size']:
-                selection_rates[group] = (group_data['selected'] == 1).mean()
-                
-        if not selection_rates:
+        return float(min_rate / max_rate) if max_rate > 0 else 0.0
+    
+    def _statistical_parity(self, selection_rates: pd.Series) -> float:
+        if selection_rates.empty:
             return 0.0
             
-        return max(selection_rates.values()) - min(selection_rates.values())
+        return float(selection_rates.max() - selection_rates.min())
+    
+    def calculate_metrics_from_counts(self, counts: pd.DataFrame) -> Dict[str, float]:
+        """Derive all bias metrics for one attribute from its group counts."""
+        selection_rates = self._selection_rates(counts)
+        
+        return {
+            'disparate_impact': self._disparate_impact(selection_rates),
+            'statistical_parity': self._statistical_parity(selection_rates),
+            'sample_size': int(counts.loc[counts.index.notna(), 'total'].sum()),
+            'groups_analyzed': len(counts)
+        }
+    
+    def accumulate_group_counts(self, data: pd.DataFrame,
+                                counts: Dict[str, pd.DataFrame] = None) -> Dict[str, pd.DataFrame]:
+        """Add the group counts of ``data`` to running per-attribute counts.
+        
+        Lets large datasets be scanned chunk by chunk: feed every chunk
+        through this method and pass the result to ``detect_bias_from_counts``.
+        """
+        validate_data(data, required_columns=['selected'])
+        self.fit_bins(data)
+        counts = dict(counts or {})
+        
+        for attribute in self.config['protected_attributes']:
+            if attribute not in data.columns:
+                continue
+                
+            chunk_counts = self.compute_group_counts(data, attribute)
+            if attribute in counts:
+                chunk_counts = merge_group_counts(counts[attribute], chunk_counts)
+            counts[attribute] = chunk_counts
+            
+        return counts
+    
+    def detect_bias_from_counts(self, counts: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, float]]:
+        """Bias metrics for every protected attribute with accumulated counts."""
+        return {
+            attribute: self.calculate_metrics_from_counts(counts[attribute])
+            for attribute in self.config['protected_attributes']
+            if attribute in counts
+        }
     
     def detect_bias(self, data: pd.DataFrame) -> Dict[str, Dict[str, float]]:
         """Comprehensive bias detection across all protected attributes."""
-        results = {}
+        return self.detect_bias_from_counts(self.accumulate_group_counts(data))
+    
+    def detect_bias_over_time(self, data: pd.DataFrame, timestamp_column: str,
+                              freq: str = 'M', window: int = 1) -> Dict[str, Any]:
+        """Bias metrics per time window.
+        
+        Records are bucketed into periods of ``freq`` ('D', 'W', 'M', ...)
+        and every window covers ``window`` consecutive periods: tumbling
+        windows for ``window=1``, sliding windows advancing one period at a
+        time otherwise. Window counts are differences of cumulative
+        per-period counts, so the data is scanned once regardless of the
+        number of windows. Windows where bias crosses the configured
+        threshold are listed under ``alerts``.
+        """
+        validate_data(data, required_columns=['selected', timestamp_column])
+        self.fit_bins(data)
+        periods = pd.to_datetime(data[timestamp_column]).dt.to_period(freq)
+        valid = periods.notna().to_numpy()
+        
+        result = {'windows': [], 'alerts': []}
+        if not valid.any():
+            return result
+            
+        ordinals = periods.array.asi8[valid]
+        first = ordinals.min()
+        period_codes = ordinals - first
+        n_periods = int(period_codes.max()) + 1
+        period_index = pd.period_range(start=periods[valid].min(), periods=n_periods, freq=freq)
+        selected = (data['selected'] == 1).to_numpy(dtype=np.int64)[valid]
         
+        window_totals = self._window_sums(np.bincount(period_codes, minlength=n_periods), window)
+        window_counts = {}
         for attribute in self.config['protected_attributes']:
             if attribute not in data.columns:
                 continue
                 
-            results[attribute] = {
-                'disparate_impact': self.calculate_disparate_impact(data, attribute),
-                'statistical_parity': self.calculate_statistical_parity(data, attribute),
-                'sample_size': len(data[data[attribute].notna()]),
-                'groups_analyzed': len(data[attribute].unique())
+            codes, groups = self._factorize(data, attribute)
+            n_bins = len(groups) + 1
+            flat = np.bincount(
+                (period_codes * n_bins + codes[valid] + 1) * 2 + selected,
+                minlength=n_periods * n_bins * 2
+            ).reshape(n_periods, n_bins, 2)
+            window_counts[attribute] = (self._window_sums(flat, window), groups)
+            
+        for end in range(min(window, n_periods) - 1, n_periods):
+            if not window_totals[end]:
+                continue
+                
+            start = period_index[max(end - window + 1, 0)].start_time
+            metrics = {
+                attribute: self.calculate_metrics_from_counts(
+                    self._counts_table(flat[end], groups, attribute)
+                )
+                for attribute, (flat, groups) in window_counts.items()
             }
+            result['windows'].append({
+                'start': start,
+                'end': period_index[end].end_time,
+                'total_records': int(window_totals[end]),
+                'metrics': metrics
+            })
             
-        return results
+            for attribute, values in metrics.items():
+                if (values['disparate_impact'] < (1 - self.config['threshold']) or
+                        values['statistical_parity'] > self.config['threshold']):
+                    result['alerts'].append({
+                        'start': start,
+                        'end': period_index[end].end_time,
+                        'attribute': attribute,
+                        'disparate_impact': values['disparate_impact'],
+                        'statistical_parity': values['statistical_parity']
+                    })
+                    
+        return result
+    
+    @staticmethod
+    def _window_sums(counts: np.ndarray, window: int) -> np.ndarray:
+        """Sums over the last ``window`` periods (axis 0) via cumulative sums."""
+        sums = np.cumsum(counts, axis=0)
+        sums[window:] -= sums[:-window].copy()
+        return sums
     
     def analyze_intersectional_bias(self, data: pd.DataFrame, 
                                   attributes: List[str]) -> Dict[str, float]:
@@ -70,38 +373,377 @@ class BiasDetector:
         if not all(attr in data.columns for attr in attributes):
             return {}
             
-        # Create intersectional groups
-        data['intersectional_group'] = data[attributes].apply(
-            lambda x: '_'.join(x.astype(str)), axis=1
+        validate_data(data, required_columns=['selected'])
+        cells, groups = self._intersection_cells(data, attributes)
+        
+        return self.calculate_metrics_from_counts(
+            self._rollup_intersection(cells, groups, attributes)
+        )
+    
+    def audit_intersections(self, data: pd.DataFrame, attributes: List[str] = None,
+                            max_order: int = 3) -> Dict[str, Dict[str, float]]:
+        """Bias metrics for every 2- to ``max_order``-way attribute intersection.
+        
+        Counts are computed once at the finest intersection of all
+        ``attributes`` (the protected attributes by default) and every
+        coarser combination is rolled up from those counts. Results are
+        keyed by the attribute names joined with ' & '.
+        """
+        validate_data(data, required_columns=['selected'])
+        attributes = [
+            attr for attr in (attributes or self.config['protected_attributes'])
+            if attr in data.columns
+        ]
+        cells, groups = self._intersection_cells(data, attributes)
+        
+        results = {}
+        for order in range(2, min(max_order, len(attributes)) + 1):
+            for combination in itertools.combinations(attributes, order):
+                results[' & '.join(combination)] = self.calculate_metrics_from_counts(
+                    self._rollup_intersection(cells, groups, combination)
+                )
+                
+        return results
+    
+    def _intersection_cells(self, data: pd.DataFrame, attributes: List[str]):
+        """Count records and selections per cell of the finest intersection.
+        
+        Returns a frame with one row per non-empty cell holding the group
+        code of every attribute plus ``total`` and ``selected`` counts, and
+        the group labels of every attribute.
+        """
+        self.fit_bins(data)
+        codes = {}
+        groups = {}
+        for attribute in attributes:
+            codes[attribute], groups[attribute] = self._factorize(data, attribute)
+            
+        cells = pd.DataFrame(codes)
+        cells['_selected'] = (data['selected'] == 1).to_numpy(dtype=np.int64)
+        cells = cells.groupby(list(attributes), sort=False)['_selected'].agg(
+            total='size', selected='sum'
+        ).reset_index()
+        
+        return cells, groups
+    
+    def _rollup_intersection(self, cells: pd.DataFrame, groups: Dict[str, Any],
+                             attributes: List[str]) -> pd.DataFrame:
+        """Group count table of an intersection, rolled up from finer cells."""
+        table = cells.groupby(list(attributes), sort=False)[['total', 'selected']].sum()
+        codes = [table.index.get_level_values(attr).to_numpy() for attr in attributes]
+        missing = np.logical_or.reduce([c < 0 for c in codes])
+        
+        # A record missing any of the attributes belongs to no intersection;
+        # such cells are folded into a single NaN group like in
+        # compute_group_counts.
+        labels = list(zip(*[
+            np.asarray(groups[attr], dtype=object)[c[~missing]]
+            for attr, c in zip(attributes, codes)
+        ]))
+        counts = pd.DataFrame(
+            table.to_numpy()[~missing],
+            columns=['total', 'selected'],
+            index=pd.Index(labels, dtype=object, tupleize_cols=False,
+                           name=' & '.join(attributes))
+        )
+        
+        if missing.any():
+            counts.loc[np.nan] = table.to_numpy()[missing].sum(axis=0)
+            
+        return counts
+    
+    def detect_proxies(self, data: pd.DataFrame, features: List[str] = None) -> Dict[str, Any]:
+        """Measure how strongly each feature predicts each protected attribute.
+        
+        Features (by default every column but the protected attributes and
+        'selected') are encoded once: numeric columns into quantile bins,
+        categories with rare ones pooled, missing values as a level of their
+        own. All contingency tables of an attribute are then counted with a
+        single ``np.bincount``, and Cramér's V and mutual information (in
+        nats) are computed from them together. Features whose Cramér's V
+        reaches ``proxy_detection.threshold`` are flagged as likely proxies.
+        """
+        settings = self.config.get('proxy_detection', {})
+        attributes = [
+            attr for attr in self.config['protected_attributes']
+            if attr in data.columns
+        ]
+        if features is None:
+            features = [
+                col for col in data.columns
+                if col not in attributes and col != 'selected'
+            ]
+            
+        associations = {}
+        flagged = []
+        if not features or len(data) == 0:
+            return {'associations': associations, 'flagged': flagged, 'recommendations': []}
+            
+        codes = np.column_stack([
+            self._proxy_codes(data[feature], settings.get('bins', 10), settings.get('max_levels', 50))
+            for feature in features
+        ])
+        width = int(codes.max()) + 1
+        offsets = np.arange(len(features)) * width
+        rows_per_chunk = max(1, (1 << 22) // len(features))
+        
+        self.fit_bins(data)
+        for attribute in attributes:
+            attribute_codes, groups = self._factorize(data, attribute)
+            n_groups = len(groups)
+            if n_groups < 2:
+                continue
+                
+            # Cell (level, group) of feature f lives at ((f * width + level) * n_groups + group)
+            tables = np.zeros(len(features) * width * n_groups)
+            for start in range(0, len(data), rows_per_chunk):
+                chunk_codes = attribute_codes[start:start + rows_per_chunk]
+                valid = chunk_codes >= 0
+                cells = (codes[start:start + rows_per_chunk][valid] + offsets) * n_groups
+                tables += np.bincount(
+                    (cells + chunk_codes[valid, None]).ravel(), minlength=len(tables)
+                )
+                
+            cramers_v, mutual_information = self._associations(
+                tables.reshape(len(features), width, n_groups)
+            )
+            
+            associations[attribute] = {}
+            for feature, v, mi in zip(features, cramers_v.tolist(), mutual_information.tolist()):
+                associations[attribute][feature] = {'cramers_v': v, 'mutual_information': mi}
+                if v >= settings.get('threshold', 0.3):
+                    flagged.append({
+                        'feature': feature,
+                        'attribute': attribute,
+                        'cramers_v': v,
+                        'mutual_information': mi
+                    })
+                    
+        flagged.sort(key=lambda proxy: proxy['cramers_v'], reverse=True)
+        recommendations = [
+            f"Feature {proxy['feature']} is strongly associated with {proxy['attribute']} "
+            f"(Cramér's V {proxy['cramers_v']:.2f}) and may act as a proxy for it. "
+            f"Review its use in decisions."
+            for proxy in flagged
+        ]
+        
+        return {'associations': associations, 'flagged': flagged, 'recommendations': recommendations}
+    
+    @staticmethod
+    def _proxy_codes(values: pd.Series, bins: int, max_levels: int) -> np.ndarray:
+        """Non-negative level codes of a feature, missing values last."""
+        if pd.api.types.is_numeric_dtype(values):
+            numbers = values.to_numpy(dtype=float, na_value=np.nan)
+            missing = np.isnan(numbers)
+            edges = np.unique(np.quantile(numbers[~missing], np.linspace(0, 1, bins + 1)[1:-1])) \
+                if (~missing).any() else np.array([])
+            codes = np.digitize(numbers, edges)
+            codes[missing] = len(edges) + 1
+            return codes
+            
+        codes, uniques = pd.factorize(values)
+        if len(uniques) > max_levels:
+            # Pool all but the most frequent categories into one level
+            frequent = np.argsort(-np.bincount(codes[codes >= 0], minlength=len(uniques)))[:max_levels - 1]
+            lookup = np.full(len(uniques), max_levels - 1)
+            lookup[frequent] = np.arange(len(frequent))
+            codes = np.where(codes >= 0, lookup[codes], -1)
+            n_levels = max_levels
+        else:
+            n_levels = len(uniques)
+            
+        return np.where(codes >= 0, codes, n_levels)
+    
+    @staticmethod
+    def _associations(tables: np.ndarray):
+        """Cramér's V and mutual information of stacked contingency tables."""
+        n = tables.sum(axis=(1, 2))
+        rows = tables.sum(axis=2)
+        cols = tables.sum(axis=1)
+        expected = rows[:, :, None] * cols[:, None, :] / np.maximum(n, 1)[:, None, None]
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            chi2 = np.where(expected > 0, (tables - expected) ** 2 / expected, 0).sum(axis=(1, 2))
+            mutual_information = np.where(
+                tables > 0, tables * np.log(tables / expected), 0
+            ).sum(axis=(1, 2)) / np.maximum(n, 1)
+            
+        dof = np.minimum((rows > 0).sum(axis=1), (cols > 0).sum(axis=1)) - 1
+        cramers_v = np.sqrt(np.where(dof > 0, chi2 / np.maximum(n, 1) / np.maximum(dof, 1), 0))
+        
+        return np.minimum(cramers_v, 1.0), np.maximum(mutual_information, 0.0)
+    
+    def calculate_significance(self, counts: pd.DataFrame) -> Dict[str, Any]:
+        """Confidence intervals and a p-value for the metrics of one attribute.
+        
+        Everything is computed from the group count table: the p-value tests
+        whether selection rates differ between the analyzed groups (Fisher's
+        exact test for two small groups, a chi-square test otherwise), and
+        the intervals are either asymptotic or from a parametric bootstrap
+        that resamples group counts instead of rows.
+        """
+        settings = {
+            'confidence_level': 0.95,
+            'method': 'asymptotic',
+            'bootstrap_samples': 1000,
+            'random_state': None,
+            **self.config.get('significance', {})
+        }
+        eligible = counts[
+            counts.index.notna() &
+            (counts['total'] >= self.config['minimum_sample_size'])
+        ]
+        
+        result = {
+            'disparate_impact_ci': None,
+            'statistical_parity_ci': None,
+            'p_value': None,
+            'significant': False
+        }
+        if len(eligible) < 2:
+            return result
+            
+        # Canonical group order, so that results do not depend on the order
+        # in which groups were first seen (e.g. after merging partial counts)
+        eligible = eligible.iloc[np.lexsort((eligible['selected'], eligible['total']))]
+        totals = eligible['total'].to_numpy(dtype=float)
+        selected = eligible['selected'].to_numpy(dtype=float)
+        rates = selected / totals
+        
+        # Test for any difference in selection rates between the groups
+        table = np.column_stack([selected, totals - selected])
+        if not table[:, 0].any() or not table[:, 1].any():
+            p_value = 1.0
+        else:
+            expected = stats.contingency.expected_freq(table)
+            if len(table) == 2 and expected.min() < 5:
+                p_value = stats.fisher_exact(table)[1]
+            else:
+                p_value = stats.chi2_contingency(table, correction=False)[1]
+                
+        if settings['method'] == 'bootstrap':
+            di_ci, sp_ci = self._bootstrap_intervals(totals, rates, settings)
+        else:
+            di_ci, sp_ci = self._asymptotic_intervals(totals, selected, rates, settings)
+            
+        result.update({
+            'disparate_impact_ci': di_ci,
+            'statistical_parity_ci': sp_ci,
+            'p_value': float(p_value),
+            'significant': bool(p_value < 1 - settings['confidence_level'])
+        })
+        
+        return result
+    
+    def _asymptotic_intervals(self, totals: np.ndarray, selected: np.ndarray,
+                              rates: np.ndarray, settings: Dict[str, Any]):
+        """Normal-approximation intervals between the lowest and highest rate groups."""
+        z = stats.norm.ppf(0.5 + settings['confidence_level'] / 2)
+        # Two distinct groups even when every rate ties, in the canonical group order
+        order = np.argsort(rates, kind='stable')
+        lo, hi = order[0], order[-1]
+        
+        # Statistical parity: Wald interval for a difference of proportions
+        diff = rates[hi] - rates[lo]
+        se = np.sqrt(
+            rates[hi] * (1 - rates[hi]) / totals[hi] +
+            rates[lo] * (1 - rates[lo]) / totals[lo]
         )
+        sp_ci = (float(max(diff - z * se, 0.0)), float(min(diff + z * se, 1.0)))
         
-        return self.detect_bias(data)['intersectional_group']
+        # Disparate impact: Katz log interval for a ratio of proportions,
+        # with a continuity correction when a group has no selections
+        x_lo, x_hi = selected[lo], selected[hi]
+        n_lo, n_hi = totals[lo], totals[hi]
+        if x_lo == 0 or x_hi == 0:
+            x_lo, x_hi, n_lo, n_hi = x_lo + 0.5, x_hi + 0.5, n_lo + 0.5, n_hi + 0.5
+        log_ratio = np.log((x_lo / n_lo) / (x_hi / n_hi))
+        se = np.sqrt(1 / x_lo - 1 / n_lo + 1 / x_hi - 1 / n_hi)
+        di_ci = (
+            float(np.exp(log_ratio - z * se)),
+            float(min(np.exp(log_ratio + z * se), 1.0))
+        )
+        
+        return di_ci, sp_ci
+    
+    def _bootstrap_intervals(self, totals: np.ndarray, rates: np.ndarray,
+                             settings: Dict[str, Any]):
+        """Percentile intervals from binomial resamples of the group counts."""
+        rng = np.random.default_rng(settings['random_state'])
+        n_samples = settings['bootstrap_samples']
+        
+        sample_rates = rng.binomial(
+            totals.astype(np.int64), rates, size=(n_samples, len(totals))
+        ) / totals
+        max_rates = sample_rates.max(axis=1)
+        min_rates = sample_rates.min(axis=1)
+        
+        di = np.divide(min_rates, max_rates, out=np.zeros(n_samples), where=max_rates > 0)
+        sp = max_rates - min_rates
+        
+        alpha = 1 - settings['confidence_level']
+        quantiles = [alpha / 2, 1 - alpha / 2]
+        
+        return (
+            tuple(float(q) for q in np.quantile(di, quantiles)),
+            tuple(float(q) for q in np.quantile(sp, quantiles))
+        )
     
     def generate_bias_report(self, data: pd.DataFrame) -> Dict[str, Any]:
         """Generate comprehensive bias analysis report."""
-        bias_metrics = self.detect_bias(data)
+        return self.build_report(self.accumulate_group_counts(data), len(data))
+    
+    def build_report(self, counts: Dict[str, pd.DataFrame],
+                     total_records: int) -> Dict[str, Any]:
+        """Assemble a bias report from accumulated group counts."""
+        bias_metrics = self.detect_bias_from_counts(counts)
+        significance = {
+            attribute: self.calculate_significance(counts[attribute])
+            for attribute in bias_metrics
+        }
+        
+        di_flagged = {
+            attribute: m['disparate_impact'] < (1 - self.config['threshold'])
+            for attribute, m in bias_metrics.items()
+        }
         
         report = {
             'summary': {
-                'total_records': len(data),
+                'total_records': total_records,
                 'attributes_analyzed': len(bias_metrics),
-                'significant_bias_detected': any(
-                    m['disparate_impact'] < (1 - self.config['threshold'])
-                    for m in bias_metrics.values()
+                # Disparate impact point estimate below the threshold
+                'significant_bias_detected': any(di_flagged.values()),
+                # ... and a selection rate difference unlikely to be chance
+                'statistically_significant_bias': any(
+                    flagged and significance[attribute]['significant']
+                    for attribute, flagged in di_flagged.items()
                 )
             },
             'detailed_metrics': bias_metrics,
-            'recommendations': self._generate_recommendations(bias_metrics),
+            'statistical_significance': significance,
+            'recommendations': self._generate_recommendations(bias_metrics, significance),
             'timestamp': pd.Timestamp.now()
         }
         
         return report
     
-    def _generate_recommendations(self, metrics: Dict[str, Dict[str, float]]) -> List[str]:
+    def _generate_recommendations(self, metrics: Dict[str, Dict[str, float]],
+                                  significance: Dict[str, Dict[str, Any]] = None) -> List[str]:
         """Generate recommendations based on bias analysis."""
         recommendations = []
         
         for attribute, values in metrics.items():
+            flagged = (
+                values['disparate_impact'] < (1 - self.config['threshold']) or
+                values['statistical_parity'] > self.config['threshold']
+            )
+            if flagged and significance and not significance[attribute]['significant']:
+                recommendations.append(
+                    f"Possible bias in {attribute} is not statistically significant "
+                    f"at the current sample size. Keep monitoring before acting."
+                )
+                continue
+                
             if values['disparate_impact'] < (1 - self.config['threshold']):
                 recommendations.append(
                     f"High bias detected in {attribute}. Consider reviewing "
@@ -0,0 +1,108 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Any
+from .bias_detector import BiasDetector
+from .utils import logger
+
+class BiasMonitor:
+    """Live bias metrics over the decisions recorded so far.
+    
+    Keeps per-attribute, per-group selected/total counters that are updated
+    in constant time per decision, so that disparate impact, statistical
+    parity and recommendations can be read at any moment without rescanning
+    the decision history.
+    
+    Attributes with quantile bins are only monitored once their edges have
+    been fitted by a scan (or loaded with the model), so that monitoring
+    uses the same groups as detection.
+    """
+    
+    def __init__(self, bias_detector: BiasDetector = None):
+        self.bias_detector = bias_detector or BiasDetector()
+        self.group_counts = {}
+        self.total_decisions = 0
+        self._unfitted = set()
+        
+    def record_decision(self, protected_attributes: Dict[str, Any], selected: bool):
+        """Record a single decision for the given protected attribute values."""
+        for attribute in self.bias_detector.config['protected_attributes']:
+            if attribute not in protected_attributes or not self._monitored(attribute):
+                continue
+                
+            group = self.bias_detector.bin_value(attribute, protected_attributes[attribute])
+            if pd.isna(group):
+                group = None
+                
+            counts = self.group_counts.setdefault(attribute, {}).setdefault(group, [0, 0])
+            counts[0] += 1
+            counts[1] += int(bool(selected))
+            
+        self.total_decisions += 1
+        
+    def record_decisions(self, protected_attributes: pd.DataFrame, selected: List[bool]):
+        """Record a batch of decisions, one per row of ``protected_attributes``."""
+        decisions = protected_attributes.assign(
+            selected=np.asarray(selected, dtype=np.int64)
+        )
+        
+        for attribute in self.bias_detector.config['protected_attributes']:
+            if attribute not in decisions.columns or not self._monitored(attribute):
+                continue
+                
+            batch_counts = self.bias_detector.compute_group_counts(decisions, attribute)
+            groups = self.group_counts.setdefault(attribute, {})
+            for group, total, chosen in zip(
+                batch_counts.index, batch_counts['total'], batch_counts['selected']
+            ):
+                counts = groups.setdefault(None if pd.isna(group) else group, [0, 0])
+                counts[0] += int(total)
+                counts[1] += int(chosen)
+                
+        self.total_decisions += len(decisions)
+        
+    def _monitored(self, attribute: str) -> bool:
+        """Whether decisions can be counted for ``attribute``, warning once if not."""
+        if self.bias_detector.bins_fitted(attribute):
+            return True
+            
+        if attribute not in self._unfitted:
+            self._unfitted.add(attribute)
+            logger.warning(f"Not monitoring {attribute}: its quantile bins have not been fitted")
+        return False
+        
+    def get_group_counts(self, attribute: str) -> pd.DataFrame:
+        """Return the counts for an attribute in the BiasDetector table format."""
+        groups = self.group_counts.get(attribute, {})
+        totals = np.array([c[0] for c in groups.values()], dtype=np.int64)
+        selected = np.array([c[1] for c in groups.values()], dtype=np.int64)
+        
+        return pd.DataFrame(
+            {'total': totals, 'selected': selected},
+            index=pd.Index(list(groups.keys()), dtype=object, name=attribute)
+        )
+    
+    def current_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Bias metrics over all decisions recorded so far."""
+        return {
+            attribute: self.bias_detector.calculate_metrics_from_counts(
+                self.get_group_counts(attribute)
+            )
+            for attribute in self.group_counts
+        }
+    
+    def get_recommendations(self) -> List[str]:
+        """Recommendations based on the current bias metrics."""
+        return self.generate_bias_report()['recommendations']
+    
+    def generate_bias_report(self) -> Dict[str, Any]:
+        """Generate a bias report over all decisions recorded so far."""
+        counts = {
+            attribute: self.get_group_counts(attribute)
+            for attribute in self.group_counts
+        }
+        return self.bias_detector.build_report(counts, self.total_decisions)
+    
+    def reset(self):
+        """Discard all recorded decisions."""
+        self.group_counts = {}
+        self.total_decisions = 0
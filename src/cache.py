@@ -0,0 +1,103 @@
+import os
+import time
+import joblib
+from collections import OrderedDict
+from typing import Any
+from .utils import logger
+
+class ResultCache:
+    """LRU cache of expensive results keyed by content fingerprints.
+    
+    Entries live in memory up to ``max_entries``; when ``directory`` is set,
+    they are also written to disk, where the least recently used files are
+    evicted once the tier grows beyond ``max_disk_bytes``. In-memory caches
+    can also expire entries ``ttl_seconds`` after they were stored.
+    """
+    
+    def __init__(self, max_entries: int = 8, directory: str = None,
+                 max_disk_bytes: int = 1 << 30, ttl_seconds: float = None):
+        if directory and ttl_seconds is not None:
+            raise ValueError("ttl_seconds is only supported for in-memory caches")
+            
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl_seconds = ttl_seconds
+        self.entries = OrderedDict()
+        self.expires = {}
+        self.stats = {'hits': 0, 'disk_hits': 0, 'misses': 0}
+        
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            
+    def get(self, key: str) -> Any:
+        """Cached value for ``key``, or None if it is not cached."""
+        if key in self.expires and self.expires[key] <= time.monotonic():
+            del self.entries[key]
+            del self.expires[key]
+            
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return self.entries[key]
+            
+        path = self._path(key)
+        if path and os.path.exists(path):
+            try:
+                value = joblib.load(path)
+            except Exception as e:
+                logger.warning(f"Failed to load cache entry {path}: {e}")
+            else:
+                os.utime(path)
+                self._remember(key, value)
+                self.stats['disk_hits'] += 1
+                return value
+                
+        self.stats['misses'] += 1
+        return None
+    
+    def put(self, key: str, value: Any):
+        """Cache ``value`` under ``key`` in memory and, if enabled, on disk."""
+        self._remember(key, value)
+        
+        path = self._path(key)
+        if path:
+            joblib.dump(value, path + '.tmp')
+            os.replace(path + '.tmp', path)
+            self._evict_disk()
+            
+    def clear(self):
+        """Remove all cached entries from memory and disk."""
+        self.entries.clear()
+        self.expires.clear()
+        if self.directory:
+            for name in os.listdir(self.directory):
+                if name.endswith('.joblib'):
+                    os.remove(os.path.join(self.directory, name))
+                    
+    def _remember(self, key: str, value: Any):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if self.ttl_seconds is not None:
+            self.expires[key] = time.monotonic() + self.ttl_seconds
+            
+        while len(self.entries) > self.max_entries:
+            evicted, _ = self.entries.popitem(last=False)
+            self.expires.pop(evicted, None)
+            
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.joblib") if self.directory else None
+    
+    def _evict_disk(self):
+        files = [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith('.joblib')
+        ]
+        files.sort(key=os.path.getmtime)
+        total = sum(os.path.getsize(f) for f in files)
+        
+        while files and total > self.max_disk_bytes:
+            oldest = files.pop(0)
+            total -= os.path.getsize(oldest)
+            os.remove(oldest)
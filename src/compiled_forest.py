@@ -0,0 +1,220 @@
+import os
+import json
+import numpy as np
+from typing import Any
+
+class CompiledForest:
+    """Fitted tree ensemble flattened into NumPy node arrays.
+    
+    The nodes of all trees are stored back to back in flat ``feature``,
+    ``threshold``, ``left``, ``right`` and ``value`` arrays. Leaves point
+    to themselves, so a batch is scored by advancing every (tree, row)
+    pair one level at a time for ``max_depth`` steps, without Python
+    loops over rows or trees. Probabilities match sklearn's
+    ``predict_proba`` for the compiled forest.
+    """
+    
+    # Node arrays written by save() as uncompressed, memory-mappable .npy files
+    ARRAYS = ('feature', 'threshold', 'left', 'right', 'missing_left', 'value',
+              'roots', 'is_leaf', 'feature_importances_')
+    
+    def __init__(self, feature: np.ndarray, threshold: np.ndarray, left: np.ndarray,
+                 right: np.ndarray, missing_left: np.ndarray, value: np.ndarray,
+                 roots: np.ndarray, max_depth: int, classes: np.ndarray, n_features: int,
+                 feature_importances: np.ndarray = None, is_leaf: np.ndarray = None):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.missing_left = missing_left
+        self.value = value
+        self.roots = roots
+        self.max_depth = max_depth
+        self.classes_ = classes
+        self.n_features = n_features
+        self.feature_importances_ = feature_importances
+        self.is_leaf = left == np.arange(len(left)) if is_leaf is None else is_leaf
+        
+    @classmethod
+    def from_sklearn(cls, model: Any) -> 'CompiledForest':
+        """Compile a fitted sklearn forest classifier."""
+        if getattr(model, 'n_outputs_', 1) != 1:
+            raise ValueError("Only single-output forests can be compiled")
+            
+        features, thresholds, lefts, rights, missing, values, roots = [], [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        
+        for estimator in model.estimators_:
+            tree = estimator.tree_
+            nodes = np.arange(tree.node_count)
+            is_leaf = tree.children_left < 0
+            
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(tree.threshold)
+            lefts.append(np.where(is_leaf, nodes, tree.children_left) + offset)
+            rights.append(np.where(is_leaf, nodes, tree.children_right) + offset)
+            missing.append(
+                tree.missing_go_to_left.astype(bool)
+                if hasattr(tree, 'missing_go_to_left')
+                else np.zeros(tree.node_count, dtype=bool)
+            )
+            
+            # Class distributions of every node, normalized as in DecisionTreeClassifier
+            value = tree.value[:, 0, :]
+            totals = value.sum(axis=1, keepdims=True)
+            values.append(np.divide(value, totals, out=np.zeros_like(value), where=totals > 0))
+            
+            roots.append(offset)
+            offset += tree.node_count
+            max_depth = max(max_depth, tree.max_depth)
+            
+        return cls(
+            feature=np.concatenate(features).astype(np.intp),
+            threshold=np.concatenate(thresholds),
+            left=np.concatenate(lefts).astype(np.intp),
+            right=np.concatenate(rights).astype(np.intp),
+            missing_left=np.concatenate(missing),
+            value=np.concatenate(values),
+            roots=np.asarray(roots, dtype=np.intp),
+            max_depth=max_depth,
+            classes=model.classes_,
+            n_features=model.n_features_in_,
+            feature_importances=np.asarray(model.feature_importances_)
+        )
+    
+    def save(self, path: str):
+        """Write the node arrays as ``.npy`` files plus ``forest.json`` to ``path``."""
+        os.makedirs(path, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(os.path.join(path, f'{name}.npy'), np.ascontiguousarray(getattr(self, name)))
+            
+        with open(os.path.join(path, 'forest.json'), 'w') as f:
+            json.dump({
+                'max_depth': int(self.max_depth),
+                'n_features': int(self.n_features),
+                'classes': np.asarray(self.classes_).tolist()
+            }, f)
+    
+    @classmethod
+    def load(cls, path: str, mmap_mode: str = 'r') -> 'CompiledForest':
+        """Load a forest written by ``save``.
+        
+        With the default ``mmap_mode='r'`` the node arrays are memory-mapped
+        read-only: loading reads no tree data, and processes loading the same
+        files share one copy through the page cache.
+        """
+        with open(os.path.join(path, 'forest.json')) as f:
+            meta = json.load(f)
+            
+        arrays = {
+            name: np.load(os.path.join(path, f'{name}.npy'), mmap_mode=mmap_mode)
+            for name in cls.ARRAYS
+        }
+        
+        return cls(
+            feature=arrays['feature'],
+            threshold=arrays['threshold'],
+            left=arrays['left'],
+            right=arrays['right'],
+            missing_left=arrays['missing_left'],
+            value=arrays['value'],
+            roots=arrays['roots'],
+            max_depth=meta['max_depth'],
+            classes=np.asarray(meta['classes']),
+            n_features=meta['n_features'],
+            feature_importances=arrays['feature_importances_'],
+            is_leaf=arrays['is_leaf']
+        )
+    
+    def apply(self, X: np.ndarray) -> np.ndarray:
+        """Leaf node reached by every row in every tree, shape (n_trees, n_rows)."""
+        # Trees compare float32 feature values, like sklearn does
+        X = np.asarray(X, dtype=np.float32)
+        n_rows = len(X)
+        nodes = np.repeat(self.roots, n_rows)
+        rows = np.tile(np.arange(n_rows), len(self.roots))
+        
+        # Only (tree, row) pairs that have not reached a leaf are advanced
+        active = np.flatnonzero(~self.is_leaf[nodes])
+        while len(active):
+            current = nodes[active]
+            x = X[rows[active], self.feature[current]]
+            go_left = np.where(np.isnan(x), self.missing_left[current], x <= self.threshold[current])
+            current = np.where(go_left, self.left[current], self.right[current])
+            nodes[active] = current
+            active = active[~self.is_leaf[current]]
+            
+        return nodes.reshape(len(self.roots), n_rows)
+    
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Class probabilities for a batch of encoded rows."""
+        return self.value[self.apply(X)].mean(axis=0)
+    
+    def predict_proba_one(self, x: np.ndarray) -> np.ndarray:
+        """Class probabilities for a single encoded row (1-D array)."""
+        x = np.asarray(x, dtype=np.float32)
+        nodes = self.roots
+        
+        for _ in range(self.max_depth):
+            values = x[self.feature[nodes]]
+            go_left = np.where(np.isnan(values), self.missing_left[nodes], values <= self.threshold[nodes])
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+            
+        return self.value[nodes].mean(axis=0)
+    
+    def contributions(self, X: np.ndarray):
+        """Per-row feature contributions by tree path decomposition.
+        
+        Every split on a row's path moves the class distribution from the
+        parent's to the child's; that change is credited to the split
+        feature. Averaged over trees, the forest's probabilities equal
+        ``bias + contributions.sum(axis=1)``.
+        
+        Returns ``bias`` of shape (n_rows, n_classes) and ``contributions``
+        of shape (n_rows, n_features, n_classes).
+        """
+        _, bias, contributions = self.explain(X)
+        return bias, contributions
+    
+    def explain(self, X: np.ndarray):
+        """Class probabilities, ``bias`` and ``contributions`` from a single traversal.
+        
+        The probabilities are those of ``predict_proba``, averaged over the
+        leaves reached, so they match it exactly.
+        """
+        X = np.asarray(X, dtype=np.float32)
+        n_rows = len(X)
+        n_classes = self.value.shape[1]
+        nodes = np.repeat(self.roots, n_rows)
+        rows = np.tile(np.arange(n_rows), len(self.roots))
+        
+        contributions = np.zeros((n_rows * self.n_features, n_classes))
+        active = np.flatnonzero(~self.is_leaf[nodes])
+        while len(active):
+            current = nodes[active]
+            feature = self.feature[current]
+            x = X[rows[active], feature]
+            go_left = np.where(np.isnan(x), self.missing_left[current], x <= self.threshold[current])
+            child = np.where(go_left, self.left[current], self.right[current])
+            
+            delta = self.value[child, :-1] - self.value[current, :-1]
+            slots = rows[active] * self.n_features + feature
+            for k in range(n_classes - 1):
+                contributions[:, k] += np.bincount(
+                    slots, weights=delta[:, k], minlength=len(contributions)
+                )
+                
+            nodes[active] = child
+            active = active[~self.is_leaf[child]]
+            
+        # Class distributions sum to one, so their changes sum to zero
+        contributions[:, -1] = -contributions[:, :-1].sum(axis=1)
+        
+        probabilities = self.value[nodes.reshape(len(self.roots), n_rows)].mean(axis=0)
+        bias = np.broadcast_to(self.value[self.roots].mean(axis=0), (n_rows, n_classes))
+        return probabilities, bias, contributions.reshape(n_rows, self.n_features, n_classes) / len(self.roots)
+    
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Predicted classes for a batch of encoded rows."""
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
@@ -1,10 +1,18 @@
+import os
+import copy
+import json
+import hashlib
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Any
+from sklearn.base import clone
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report
 import joblib
+from .cache import ResultCache
+from .compiled_forest import CompiledForest
+from .utils import json_default
 
 class DecisionAnalyzer:
     def __init__(self, config: Dict[str, Any] = None):
@@ -16,14 +24,93 @@ class DecisionAnalyzer:
                 'random_state': 42
             },
             'feature_importance_threshold': 0.05,
-            'confidence_threshold': 0.8
+            'confidence_threshold': 0.8,
+            'compiled_inference': False,
+            'compiled_batch_limit': 256,
+            'local_explanations': True,
+            'incremental': {
+                'replace_fraction': 0.1,
+                'holdout_size': 5000
+            },
+            'prediction_cache': {
+                'max_entries': 4096,
+                'ttl_seconds': 3600
+            }
         }
         self.model = RandomForestClassifier(**self.config['model_params'])
         self.feature_names = None
         self.performance_metrics = {}
+        self.preprocessing = None
+        self.compiled_model = None
+        self._compiled_source = None
+        self._compiled_scoring = False
+        self._feature_importance = None
+        self._feature_importance_model = None
+        self.holdout = None
+        self.updates = 0
+        # Protected-attribute bin edges of the scan the model was trained in
+        self.bin_edges = {}
+        
+        cache_settings = self.config.get('prediction_cache', {})
+        self.prediction_cache = ResultCache(
+            max_entries=cache_settings.get('max_entries', 4096),
+            ttl_seconds=cache_settings.get('ttl_seconds', 3600)
+        )
+        self._prediction_cache_model = None
+        
+    def fit_preprocessing(self, features: pd.DataFrame):
+        """Learn category codes and imputation values from training features.
+        
+        Categories are encoded with the codes ``pd.Categorical`` assigns on
+        the training data; unseen and missing categories map to -1. Missing
+        numeric values are imputed with the training mean.
+        """
+        categories = {}
+        fill_values = {}
+        
+        for col in features.columns:
+            if pd.api.types.is_numeric_dtype(features[col]):
+                fill_values[col] = float(features[col].mean())
+            else:
+                categories[col] = pd.Index(pd.Categorical(features[col]).categories)
+                
+        self.preprocessing = {
+            'columns': features.columns.tolist(),
+            'categories': categories,
+            'fill_values': fill_values
+        }
+    
+    def transform_features(self, features: pd.DataFrame) -> np.ndarray:
+        """Encode features with the fitted preprocessing into a float matrix.
+        
+        Columns are read straight from ``features`` into a single output
+        array, in training order; ``features`` itself is never copied.
+        """
+        columns = self.preprocessing['columns']
+        categories = self.preprocessing['categories']
+        fill_values = self.preprocessing['fill_values']
         
+        encoded = np.empty((len(features), len(columns)), dtype=float)
+        for i, col in enumerate(columns):
+            if col in categories:
+                encoded[:, i] = categories[col].get_indexer(features[col])
+            else:
+                encoded[:, i] = features[col].to_numpy(dtype=float, na_value=np.nan)
+                missing = np.isnan(encoded[:, i])
+                if missing.any():
+                    encoded[missing, i] = fill_values[col]
+                    
+        return encoded
+    
     def preprocess_features(self, features: pd.DataFrame) -> pd.DataFrame:
         """Preprocess features for model training/prediction."""
+        if self.preprocessing is not None:
+            return pd.DataFrame(
+                self.transform_features(features),
+                columns=self.preprocessing['columns'],
+                index=features.index
+            )
+            
         processed = features.copy()
         
         # Handle categorical variables
@@ -43,7 +130,8 @@ class DecisionAnalyzer:
               validation_split: float = 0.2) -> Dict[str, Any]:
         """Train the decision analyzer model."""
         self.feature_names = features.columns.tolist()
-        processed_features = self.preprocess_features(features)
+        self.fit_preprocessing(features)
+        processed_features = self.transform_features(features)
         
         # Split data for validation
         X_train, X_val, y_train, y_val = train_test_split(
@@ -52,9 +140,19 @@ class DecisionAnalyzer:
             random_state=self.config['model_params']['random_state']
         )
         
-        # Train model
+        # Train a fresh model, leaving previously fitted ones (e.g. cached) intact
+        if isinstance(self.model, CompiledForest):
+            # Loaded from an artifact, which only holds the compiled arrays
+            self.model = RandomForestClassifier(**self.config['model_params'])
+        else:
+            self.model = clone(self.model)
         self.model.fit(X_train, y_train)
         
+        # Start the rolling holdout that update() refreshes metrics on
+        holdout_size = self.config.get('incremental', {}).get('holdout_size', 5000)
+        self.holdout = (X_val[-holdout_size:], np.asarray(y_val)[-holdout_size:])
+        self.updates = 0
+        
         # Calculate performance metrics
         train_pred = self.model.predict(X_train)
         val_pred = self.model.predict(X_val)
@@ -70,8 +168,132 @@ class DecisionAnalyzer:
         
         return self.performance_metrics
     
+    def update(self, features: pd.DataFrame, decisions: pd.Series,
+               validation_split: float = 0.2) -> Dict[str, Any]:
+        """Refresh the trained forest with newly labeled decisions.
+        
+        The oldest ``replace_fraction`` of the trees is replaced by trees
+        grown with ``warm_start`` on the new data only, encoded with the
+        preprocessing fitted by ``train``. Validation metrics are recomputed
+        on a rolling holdout of the most recent ``holdout_size`` labeled
+        rows, so an update costs time in proportion to the new data rather
+        than to everything the model has seen.
+        """
+        if self.feature_names is None or self.preprocessing is None:
+            raise RuntimeError("Model needs to be trained before updating")
+        if isinstance(self.model, CompiledForest):
+            raise RuntimeError("Models loaded from artifacts cannot be updated")
+            
+        missing_features = set(self.feature_names) - set(features.columns)
+        if missing_features:
+            raise ValueError(f"Missing features: {missing_features}")
+            
+        # New trees must vote over the same classes as the ones they join
+        if set(np.unique(decisions)) != set(self.model.classes_):
+            raise ValueError("New decisions must contain every class the model was trained on")
+            
+        settings = self.config.get('incremental', {})
+        n_trees = len(self.model.estimators_)
+        n_new = max(1, int(round(n_trees * settings.get('replace_fraction', 0.1))))
+        random_state = self.config['model_params']['random_state']
+        
+        processed_features = self.transform_features(features)
+        X_train, X_val, y_train, y_val = train_test_split(
+            processed_features, decisions,
+            test_size=validation_split,
+            random_state=random_state
+        )
+        
+        # Grow the new trees on a shallow copy sharing the existing ones,
+        # leaving the current model (e.g. cached or compiled) intact
+        self.updates += 1
+        model = copy.copy(self.model)
+        model.estimators_ = list(self.model.estimators_)
+        model.set_params(
+            warm_start=True,
+            n_estimators=n_trees + n_new,
+            random_state=None if random_state is None else random_state + self.updates
+        )
+        model.fit(X_train, y_train)
+        model.estimators_ = model.estimators_[n_new:]
+        model.set_params(warm_start=False, n_estimators=n_trees, random_state=random_state)
+        self.model = model
+        
+        holdout_size = settings.get('holdout_size', 5000)
+        X_holdout, y_holdout = X_val, np.asarray(y_val)
+        if self.holdout is not None:
+            X_holdout = np.concatenate([self.holdout[0], X_holdout])
+            y_holdout = np.concatenate([self.holdout[1], y_holdout])
+        self.holdout = (X_holdout[-holdout_size:], y_holdout[-holdout_size:])
+        
+        self.performance_metrics = {
+            'train': classification_report(y_train, self.model.predict(X_train), output_dict=True),
+            'validation': classification_report(
+                self.holdout[1], self.model.predict(self.holdout[0]), output_dict=True
+            ),
+            'feature_importance': dict(zip(
+                self.feature_names,
+                self.model.feature_importances_
+            ))
+        }
+        
+        return self.performance_metrics
+    
     def analyze_decision(self, candidate_features: pd.DataFrame) -> Dict[str, Any]:
-        """Analyze a hiring decision and provide detailed explanation."""
+        """Analyze a hiring decision and provide detailed explanation.
+        
+        Results are memoized in ``prediction_cache`` by the encoded feature
+        vector, so re-evaluating a candidate skips the forest. The cache is
+        cleared whenever the model changes (``train``, ``update``, loading).
+        """
+        processed_features = self._prepare_candidates(candidate_features)
+        if not isinstance(processed_features, np.ndarray):
+            return self._analyze_processed(processed_features[:1])[0]
+            
+        key = self._prediction_key(processed_features[0])
+        result = self.prediction_cache.get(key)
+        if result is None:
+            result = self._analyze_processed(processed_features[:1])[0]
+            self.prediction_cache.put(key, result)
+            
+        # Callers get their own result dict; nested dictionaries are shared
+        return dict(result)
+    
+    def _prediction_key(self, encoded_row: np.ndarray) -> str:
+        """Prediction cache key of one encoded row under the current model and settings."""
+        if self._prediction_cache_model is not self.model:
+            self.prediction_cache.clear()
+            self._prediction_cache_model = self.model
+            
+        settings = (
+            self.config['feature_importance_threshold'],
+            self.config['confidence_threshold'],
+            self.config.get('local_explanations', True)
+        )
+        return hashlib.blake2b(
+            encoded_row.tobytes() + repr(settings).encode(), digest_size=16
+        ).hexdigest()
+    
+    def analyze_decisions(self, candidate_features: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Analyze a batch of hiring decisions, one result per row.
+        
+        The whole batch is scored with a single pass over the forest, which
+        also yields the local explanations, and all results share the same
+        feature importance dictionaries.
+        """
+        processed_features = self._prepare_candidates(candidate_features)
+        return self._analyze_processed(processed_features)
+    
+    def score(self, candidate_features: pd.DataFrame) -> np.ndarray:
+        """Probability of the positive decision for every candidate."""
+        processed_features = self._prepare_candidates(candidate_features)
+        if len(self.model.classes_) != 2:
+            raise ValueError("Scores require a model trained on two classes")
+            
+        return self._predict_proba(processed_features)[:, 1]
+    
+    def _prepare_candidates(self, candidate_features: pd.DataFrame):
+        """Validate candidate features and preprocess them for scoring."""
         if not isinstance(candidate_features, pd.DataFrame):
             raise ValueError("candidate_features must be a pandas DataFrame")
             
@@ -83,33 +305,117 @@ class DecisionAnalyzer:
         if missing_features:
             raise ValueError(f"Missing features: {missing_features}")
             
-        processed_features = self.preprocess_features(
-            candidate_features[self.feature_names]
-        )
+        if self.preprocessing is None:
+            # Models saved before preprocessing was fitted at training time
+            return self.preprocess_features(candidate_features[self.feature_names])
+            
+        return self.transform_features(candidate_features)
+    
+    def _analyze_processed(self, processed_features) -> List[Dict[str, Any]]:
+        if len(processed_features) == 0:
+            return []
+            
+        local_explanations = self.config.get('local_explanations', True)
+        if local_explanations:
+            # The forest is traversed once for probabilities and contributions alike
+            probabilities, _, contributions = self._get_compiled_model().explain(
+                np.asarray(processed_features, dtype=float)
+            )
+        else:
+            probabilities = self._predict_proba(processed_features)
+            
+        # Predictions are derived from the probabilities, as predict() would
+        predicted = probabilities.argmax(axis=1)
+        predictions = self.model.classes_[predicted]
+        confidences = probabilities.max(axis=1)
         
-        # Get prediction and probability
-        prediction = self.model.predict(processed_features)[0]
-        probability = self.model.predict_proba(processed_features)[0]
+        feature_importance = self._get_feature_importance()
         
-        # Get feature importance for this decision
-        feature_importance = dict(zip(
-            self.feature_names,
-            self.model.feature_importances_
-        ))
+        if not local_explanations:
+            # Filter significant features
+            significant_features = {
+                k: v for k, v in feature_importance.items()
+                if v >= self.config['feature_importance_threshold']
+            }
+            
+            return [
+                {
+                    'prediction': bool(prediction),
+                    'confidence': float(confidence),
+                    'significant_features': significant_features,
+                    'all_features': feature_importance,
+                    'high_confidence': bool(confidence >= self.config['confidence_threshold'])
+                }
+                for prediction, confidence in zip(predictions, confidences)
+            ]
+            
+        # Contribution of every feature towards each candidate's predicted class
+        local = contributions[np.arange(len(contributions)), :, predicted]
         
-        # Filter significant features
-        significant_features = {
-            k: v for k, v in feature_importance.items()
-            if v >= self.config['feature_importance_threshold']
-        }
+        results = []
+        for prediction, confidence, row in zip(predictions, confidences, local.tolist()):
+            feature_contributions = dict(zip(self.feature_names, row))
+            results.append({
+                'prediction': bool(prediction),
+                'confidence': float(confidence),
+                'significant_features': {
+                    k: v for k, v in feature_contributions.items()
+                    if abs(v) >= self.config['feature_importance_threshold']
+                },
+                'all_features': feature_importance,
+                'feature_contributions': feature_contributions,
+                'high_confidence': bool(confidence >= self.config['confidence_threshold'])
+            })
+            
+        return results
+    
+    def compile_model(self) -> CompiledForest:
+        """Compile the trained forest into flat node arrays for fast scoring.
         
-        return {
-            'prediction': bool(prediction),
-            'confidence': float(max(probability)),
-            'significant_features': significant_features,
-            'all_features': feature_importance,
-            'high_confidence': max(probability) >= self.config['confidence_threshold']
-        }
+        Once compiled, single candidates and batches of up to
+        ``compiled_batch_limit`` rows are scored by ``CompiledForest``;
+        larger batches keep using sklearn, which is faster for them. Later
+        models are compiled again when they are first used.
+        """
+        if self.feature_names is None:
+            raise RuntimeError("Model needs to be trained before compiling")
+            
+        self._compiled_scoring = True
+        return self._get_compiled_model()
+    
+    def _get_compiled_model(self) -> CompiledForest:
+        """Compiled form of the current model, rebuilt when the model changes."""
+        if isinstance(self.model, CompiledForest):
+            return self.model
+            
+        if self._compiled_source is not self.model:
+            self.compiled_model = CompiledForest.from_sklearn(self.model)
+            self._compiled_source = self.model
+            
+        return self.compiled_model
+    
+    def _predict_proba(self, processed_features) -> np.ndarray:
+        compiled_scoring = self._compiled_scoring or self.config.get('compiled_inference', False)
+        
+        # The compiled forest only understands fitted-preprocessing output
+        if compiled_scoring and isinstance(processed_features, np.ndarray):
+            if len(processed_features) == 1:
+                return self._get_compiled_model().predict_proba_one(processed_features[0])[None, :]
+            if len(processed_features) <= self.config.get('compiled_batch_limit', 256):
+                return self._get_compiled_model().predict_proba(processed_features)
+                
+        return self.model.predict_proba(processed_features)
+    
+    def _get_feature_importance(self) -> Dict[str, float]:
+        """Global feature importance of the current model, built once per model."""
+        if self._feature_importance_model is not self.model:
+            self._feature_importance = dict(zip(
+                self.feature_names,
+                self.model.feature_importances_
+            ))
+            self._feature_importance_model = self.model
+            
+        return self._feature_importance
     
     def save_model(self, path: str):
         """Save the trained model and configuration."""
@@ -119,7 +425,9 @@ class DecisionAnalyzer:
         model_data = {
             'model': self.model,
             'feature_names': self.feature_names,
+            'preprocessing': self.preprocessing,
             'performance_metrics': self.performance_metrics,
+            'bin_edges': self.bin_edges,
             'config': self.config
         }
         
@@ -133,6 +441,71 @@ class DecisionAnalyzer:
         analyzer = cls(config=model_data['config'])
         analyzer.model = model_data['model']
         analyzer.feature_names = model_data['feature_names']
+        analyzer.preprocessing = model_data.get('preprocessing')
         analyzer.performance_metrics = model_data['performance_metrics']
+        analyzer.bin_edges = model_data.get('bin_edges', {})
+        
+        return analyzer
+    
+    def save_artifact(self, path: str):
+        """Save the trained model as a memory-mappable artifact directory.
+        
+        The forest is written in compiled form (``CompiledForest.save``) as
+        uncompressed ``.npy`` node arrays, next to ``metadata.json`` holding
+        the feature schema, preprocessing, bin edges, metrics and configuration.
+        """
+        if self.feature_names is None:
+            raise RuntimeError("Model needs to be trained before saving")
+        if self.preprocessing is None:
+            raise RuntimeError("Artifacts require preprocessing fitted at training time")
+            
+        self._get_compiled_model().save(path)
+        
+        metadata = {
+            'feature_names': self.feature_names,
+            'preprocessing': {
+                'columns': self.preprocessing['columns'],
+                'categories': {
+                    col: values.tolist()
+                    for col, values in self.preprocessing['categories'].items()
+                },
+                'fill_values': self.preprocessing['fill_values']
+            },
+            'bin_edges': {attr: edges.tolist() for attr, edges in self.bin_edges.items()},
+            'performance_metrics': self.performance_metrics,
+            'config': self.config
+        }
+        
+        with open(os.path.join(path, 'metadata.json'), 'w') as f:
+            json.dump(metadata, f, default=json_default)
+    
+    @classmethod
+    def load_artifact(cls, path: str, mmap: bool = True) -> 'DecisionAnalyzer':
+        """Load an artifact written by ``save_artifact``.
+        
+        The loaded analyzer scores with the memory-mapped ``CompiledForest``
+        as its model; training it again fits a new sklearn forest.
+        """
+        with open(os.path.join(path, 'metadata.json')) as f:
+            metadata = json.load(f)
+            
+        preprocessing = metadata['preprocessing']
+        
+        analyzer = cls(config=metadata['config'])
+        analyzer.model = CompiledForest.load(path, mmap_mode='r' if mmap else None)
+        analyzer.feature_names = metadata['feature_names']
+        analyzer.preprocessing = {
+            'columns': preprocessing['columns'],
+            'categories': {
+                col: pd.Index(values)
+                for col, values in preprocessing['categories'].items()
+            },
+            'fill_values': preprocessing['fill_values']
+        }
+        analyzer.bin_edges = {
+            attr: np.asarray(edges, dtype=float)
+            for attr, edges in metadata.get('bin_edges', {}).items()
+        }
+        analyzer.performance_metrics = metadata['performance_metrics']
         
         return analyzer
@@ -0,0 +1,288 @@
+import os
+import json
+import shutil
+import tempfile
+import threading
+from datetime import datetime
+from typing import Dict, List, Any, Callable, Iterator, Optional, Tuple
+from .utils import logger
+
+DURABILITY_MODES = ('sync', 'batch', 'none')
+
+class FeedbackLog:
+    """Append-only on-disk log of feedback changes with group commit.
+    
+    Records are JSON lines numbered by a sequence number, in segment files
+    named after their first record. ``durability`` sets when an appended
+    record reaches the disk:
+    
+    - ``'sync'``: ``append`` returns once the record is fsynced. Concurrent
+      appenders share one fsync per group of records.
+    - ``'batch'``: a background thread writes and fsyncs pending records
+      once ``max_batch_size`` are waiting or the oldest has waited
+      ``max_wait_ms``; a crash loses at most that window.
+    - ``'none'``: as ``'batch'``, without fsync.
+    
+    ``snapshot`` saves state covering every record so far, starts a new
+    segment and removes the segments it covers, so recovery only replays
+    the records appended after the latest snapshot. The state can be
+    written by a background thread while records keep being appended.
+    """
+    
+    def __init__(self, directory: str, durability: str = 'batch',
+                 max_batch_size: int = 256, max_wait_ms: float = 50.0):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {DURABILITY_MODES}, got {durability!r}")
+        
+        self.directory = directory
+        self.durability = durability
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        os.makedirs(directory, exist_ok=True)
+        
+        self.snapshot_path, self.snapshot_seq = self._latest_snapshot()
+        self.seq = max(self.snapshot_seq, self._last_logged_seq())
+        self.durable_seq = self.seq
+        
+        self._pending = []
+        self._file = None
+        self._closed = False
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._write_lock = threading.Lock()
+        
+        self._snapshotter = None
+        self._committer = None
+        if durability != 'sync':
+            self._committer = threading.Thread(target=self._run, name='feedback-log', daemon=True)
+            self._committer.start()
+    
+    def append(self, record: Dict[str, Any]) -> int:
+        """Log ``record`` and return its sequence number."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Feedback log is closed")
+            self.seq += 1
+            seq = self.seq
+            self._pending.append(json.dumps({'seq': seq, **record}, default=str))
+            if len(self._pending) >= self.max_batch_size:
+                self._ready.notify()
+        
+        if self.durability == 'sync':
+            self._commit(seq)
+        
+        return seq
+    
+    def flush(self):
+        """Write (and, unless durability is 'none', fsync) all pending records."""
+        self._commit()
+    
+    def replay(self, after: int = None) -> Iterator[Dict[str, Any]]:
+        """Logged records with a sequence number above ``after``, in order.
+        
+        Defaults to the records after the latest snapshot. A torn last line
+        of a segment, left by a crash during a write, is skipped.
+        """
+        after = self.snapshot_seq if after is None else after
+        segments = self._segments()
+        
+        for i, (first, path) in enumerate(segments):
+            if i + 1 < len(segments) and segments[i + 1][0] <= after + 1:
+                continue
+            
+            with open(path) as f:
+                for line in f:
+                    if not line.endswith('\n'):
+                        logger.warning(f"Skipping incomplete record at the end of {path}")
+                        break
+                    record = json.loads(line)
+                    if record['seq'] > after:
+                        yield record
+    
+    def snapshot(self, save: Callable[[str], None], wait: bool = True) -> Optional[str]:
+        """Save a snapshot with ``save(directory)`` and drop the segments it covers.
+        
+        The saved state must reflect every record appended so far, so call
+        this from the thread that appends. With ``wait=False`` a background
+        thread calls ``save`` and the snapshot's path is not returned; ``save``
+        must then write a copy of the state, not the live one. One snapshot
+        is written at a time: this first waits for any in progress.
+        """
+        self.wait_for_snapshot()
+        with self._write_lock:
+            seq = self._write_pending()
+            # Records after the snapshot go to a new segment
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        
+        if not wait:
+            self._snapshotter = threading.Thread(
+                target=self._write_snapshot_in_background, args=(save, seq),
+                name='feedback-snapshot', daemon=True
+            )
+            self._snapshotter.start()
+            return None
+        
+        return self._write_snapshot(save, seq)
+    
+    @property
+    def snapshot_in_progress(self) -> bool:
+        """Whether a background thread is writing a snapshot."""
+        return self._snapshotter is not None and self._snapshotter.is_alive()
+    
+    def wait_for_snapshot(self):
+        """Wait until the snapshot being written in the background, if any, is done."""
+        if self._snapshotter is not None:
+            self._snapshotter.join()
+            self._snapshotter = None
+    
+    def close(self):
+        """Write pending records, finish any snapshot and stop the background committer."""
+        self.wait_for_snapshot()
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._ready.notify()
+        
+        if self._committer is not None:
+            self._committer.join()
+        self._commit()
+        
+        with self._write_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+    
+    def _write_snapshot(self, save: Callable[[str], None], seq: int) -> str:
+        staging = tempfile.mkdtemp(prefix='.staging-', dir=self.directory)
+        try:
+            save(staging)
+            self._write_json(os.path.join(staging, 'snapshot.json'), {
+                'seq': seq,
+                'created_at': datetime.now().isoformat()
+            })
+            # The snapshot's files must be durable before it replaces anything
+            self._fsync_directory(staging)
+            path = os.path.join(self.directory, f'snapshot-{seq:012d}')
+            if os.path.exists(path):
+                shutil.rmtree(path)
+            os.rename(staging, path)
+            self._fsync_directory(self.directory)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        
+        # Only a durable snapshot may replace the segments it covers
+        self.snapshot_path, self.snapshot_seq = path, seq
+        self._prune(seq)
+        logger.info(f"Wrote feedback snapshot at record {seq}")
+        
+        return path
+    
+    def _write_snapshot_in_background(self, save: Callable[[str], None], seq: int):
+        try:
+            self._write_snapshot(save, seq)
+        except Exception as e:
+            # The segments stay in place, so no record is lost
+            logger.error(f"Failed to write feedback snapshot at record {seq}: {e}")
+    
+    def _run(self):
+        while True:
+            with self._lock:
+                if len(self._pending) < self.max_batch_size and not self._closed:
+                    self._ready.wait(self.max_wait_ms / 1000)
+                closed = self._closed
+            
+            self._commit()
+            if closed:
+                return
+    
+    def _commit(self, seq: int = None):
+        """Make pending records durable, unless ``seq`` already is."""
+        with self._write_lock:
+            # A group commit by another appender may already cover ``seq``
+            if seq is not None and self.durable_seq >= seq:
+                return
+            self._write_pending()
+    
+    def _write_pending(self) -> int:
+        """Write pending records to the current segment; needs ``_write_lock``."""
+        with self._lock:
+            lines, self._pending = self._pending, []
+            seq = self.seq
+        
+        if lines:
+            created = self._file is None
+            if created:
+                first = seq - len(lines) + 1
+                self._file = open(os.path.join(self.directory, f'log-{first:012d}.jsonl'), 'w')
+            self._file.write('\n'.join(lines) + '\n')
+            self._file.flush()
+            if self.durability != 'none':
+                os.fsync(self._file.fileno())
+                # A new segment is only durable once its directory entry is
+                if created:
+                    self._fsync_directory(self.directory)
+        
+        self.durable_seq = seq
+        return seq
+    
+    def _segments(self) -> List[Tuple[int, str]]:
+        """First sequence number and path of every segment, oldest first."""
+        return sorted(
+            (int(name[4:-6]), os.path.join(self.directory, name))
+            for name in os.listdir(self.directory)
+            if name.startswith('log-') and name.endswith('.jsonl')
+        )
+    
+    def _last_logged_seq(self) -> int:
+        """Sequence number of the last complete record on disk."""
+        for first, path in reversed(self._segments()):
+            with open(path, 'rb') as f:
+                complete = f.read().count(b'\n')
+            if complete:
+                return first + complete - 1
+        
+        return 0
+    
+    def _latest_snapshot(self) -> Tuple[Optional[str], int]:
+        snapshots = sorted(
+            name for name in os.listdir(self.directory)
+            if name.startswith('snapshot-')
+            and os.path.exists(os.path.join(self.directory, name, 'snapshot.json'))
+        )
+        if not snapshots:
+            return None, 0
+        
+        path = os.path.join(self.directory, snapshots[-1])
+        with open(os.path.join(path, 'snapshot.json')) as f:
+            return path, json.load(f)['seq']
+    
+    def _prune(self, seq: int):
+        """Remove older snapshots and the segments covered by snapshot ``seq``."""
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.startswith('snapshot-') and path != self.snapshot_path:
+                shutil.rmtree(path, ignore_errors=True)
+        
+        # Records after ``seq`` are always in segments starting after it
+        for first, path in self._segments():
+            if first <= seq:
+                os.remove(path)
+    
+    @staticmethod
+    def _fsync_directory(directory: str):
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _write_json(path: str, value: Dict[str, Any]):
+        with open(path, 'w') as f:
+            json.dump(value, f)
+            f.flush()
+            os.fsync(f.fileno())
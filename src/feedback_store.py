@@ -0,0 +1,809 @@
+import os
+import json
+import bisect
+import pandas as pd
+import numpy as np
+from collections.abc import Sequence, MutableMapping
+from datetime import datetime
+from typing import Dict, List, Any, Tuple
+from .feedback_trend import TrendTracker
+
+# Placeholder for free-form fields an entry does not have
+_MISSING = object()
+
+DAY_NS = 24 * 60 * 60 * 10 ** 9
+
+class FeedbackStore:
+    """Append-only columnar storage of feedback entries, partitioned by day.
+    
+    Every day of feedback is a ``FeedbackPartition``: typed NumPy arrays of
+    timestamps (nanoseconds since the epoch), satisfaction scores and
+    dictionary-encoded user types and categories, with statistics
+    pre-aggregated as entries arrive. Comments and any other free-form
+    fields are kept separately, one list per field. Timeframe queries
+    combine the aggregates of the days they cover, filtering rows only in
+    the first one, and expired days are dropped whole. ``trend_tracker``
+    keeps the newest ``trend_window`` scores for ``trend``. ``entries()``
+    offers a list-of-dicts view, oldest day first, for compatibility.
+    """
+    
+    def __init__(self, trend_window: int = 10, ewma_halflife_days: float = 7.0):
+        self.ewma_halflife_days = ewma_halflife_days
+        self.partitions = {}
+        self.days = []
+        self.size = 0
+        # Bumped on every change, so entry views know when to refetch
+        self.version = 0
+        self.aggregates = FeedbackAggregates(ewma_halflife_days)
+        self.trend_tracker = TrendTracker(trend_window)
+        self.user_types = []
+        self.categories = []
+        self._user_type_lookup = {}
+        self._category_lookup = {}
+        # Index of the first entry of each day, rebuilt when days shift
+        self._starts = None
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def append(self, user_type: str, timestamp: datetime, satisfaction: float,
+               category: str, comments: Any, extras: Dict[str, Any] = None) -> int:
+        """Store one entry and return its timestamp in nanoseconds."""
+        timestamp = _to_ns(timestamp)
+        self._insert(
+            timestamp, float(satisfaction),
+            self._encode(user_type, self.user_types, self._user_type_lookup),
+            self._encode(category, self.categories, self._category_lookup),
+            comments, extras or {}
+        )
+        return timestamp
+    
+    def columns(self, since: int = None) -> Dict[str, np.ndarray]:
+        """Typed columns of all entries, or of those at or after ``since`` (ns)."""
+        parts = [partition.columns() for partition in self._partitions_since(since)]
+        if not parts:
+            return {
+                'timestamp': np.empty(0, dtype=np.int64),
+                'satisfaction': np.empty(0),
+                'user_type': np.empty(0, dtype=np.int16),
+                'category': np.empty(0, dtype=np.int32)
+            }
+        
+        columns = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+        if since is not None:
+            selected = columns['timestamp'] >= since
+            columns = {name: values[selected] for name, values in columns.items()}
+        
+        return columns
+    
+    def aggregate(self, since: int = None) -> Tuple['FeedbackAggregates', int]:
+        """Aggregates of the entries at or after ``since`` (ns) and their oldest timestamp.
+        
+        Whole days are combined from their pre-aggregated statistics; only
+        the day containing ``since`` is filtered row by row.
+        """
+        if since is None:
+            oldest = min((p.oldest for p in self.partitions.values()), default=None)
+            return self.aggregates, oldest
+        
+        aggregates = FeedbackAggregates(self.ewma_halflife_days)
+        oldest = None
+        for partition in self._partitions_since(since):
+            if partition.day == since // DAY_NS:
+                columns = partition.columns()
+                selected = columns['timestamp'] >= since
+                if not selected.any():
+                    continue
+                aggregates.merge(FeedbackAggregates.from_columns(
+                    columns['user_type'][selected],
+                    columns['category'][selected],
+                    columns['satisfaction'][selected],
+                    columns['timestamp'][selected],
+                    self.ewma_halflife_days
+                ))
+                first = int(columns['timestamp'][selected].min())
+            else:
+                aggregates.merge(partition.aggregates)
+                first = partition.oldest
+            oldest = first if oldest is None else min(oldest, first)
+        
+        return aggregates, oldest
+    
+    def trend(self, since: int = None) -> Dict[str, Any]:
+        """Rolling-mean trend of the entries at or after ``since`` (ns).
+        
+        The oldest entry's score comes from its day partition and the mean
+        of the newest scores from ``trend_tracker``; neither needs a sort.
+        """
+        start = None
+        for partition in self._partitions_since(since):
+            if since is not None and partition.day == since // DAY_NS:
+                timestamps = partition.timestamps[:partition.size]
+                selected = np.flatnonzero(timestamps >= since)
+                if len(selected) == 0:
+                    continue
+                start = partition.satisfaction[selected[np.argmin(timestamps[selected])]]
+            else:
+                start = partition.oldest_satisfaction
+            break
+        
+        if self.trend_tracker.stale:
+            self._reset_trend_tracker()
+        
+        return self.trend_tracker.trend(start, since)
+    
+    def drop_before(self, day: int) -> int:
+        """Drop all partitions of days before ``day``; returns the newest dropped timestamp."""
+        newest = None
+        while self.days and self.days[0] < day:
+            partition = self.partitions.pop(self.days.pop(0))
+            self.aggregates.merge(partition.aggregates, weight=-1)
+            self.trend_tracker.remove(partition.newest)
+            self.size -= partition.size
+            newest = partition.newest if newest is None else max(newest, partition.newest)
+            self.version += 1
+            self._starts = None
+        
+        return newest
+    
+    def get_entry(self, index: int) -> Dict[str, Any]:
+        """Entry ``index`` as a dictionary, as it was collected."""
+        partition, offset = self._locate(index)
+        values = partition.get(offset)
+        
+        entry = {
+            'user_type': self.user_types[values['user_type']],
+            'timestamp': pd.Timestamp(values['timestamp']).to_pydatetime(),
+            'satisfaction': values['satisfaction'],
+            'category': self.categories[values['category']],
+            'comments': values['comments']
+        }
+        entry.update(values['extras'])
+        
+        return entry
+    
+    def get_timestamp(self, index: int) -> int:
+        """Timestamp of entry ``index`` in nanoseconds."""
+        partition, offset = self._locate(index)
+        return int(partition.timestamps[offset])
+    
+    def set_value(self, index: int, field: str, value: Any):
+        """Overwrite one field of a stored entry, keeping aggregates and partitions in step."""
+        partition, offset = self._locate(index)
+        values = partition.get(offset)
+        self.version += 1
+        
+        if field == 'timestamp':
+            values['timestamp'] = _to_ns(value)
+        elif field == 'satisfaction':
+            values['satisfaction'] = float(value)
+        elif field == 'user_type':
+            values['user_type'] = self._encode(value, self.user_types, self._user_type_lookup)
+        elif field == 'category':
+            values['category'] = self._encode(value, self.categories, self._category_lookup)
+        elif field == 'comments':
+            values['comments'] = value
+        else:
+            values['extras'][field] = value
+        
+        if values['timestamp'] // DAY_NS == partition.day:
+            previous = partition.replace(offset, values)
+            self.aggregates.add(
+                previous['user_type'], previous['category'], previous['satisfaction'],
+                previous['timestamp'], weight=-1
+            )
+            self.aggregates.add(
+                values['user_type'], values['category'], values['satisfaction'], values['timestamp']
+            )
+            self.trend_tracker.remove(previous['timestamp'])
+            self.trend_tracker.add(values['timestamp'], values['satisfaction'])
+        else:
+            # The entry moves to another day's partition
+            self._remove(partition, offset)
+            self._insert(
+                values['timestamp'], values['satisfaction'], values['user_type'],
+                values['category'], values['comments'], values['extras']
+            )
+    
+    def entries(self, on_change=None) -> 'FeedbackEntries':
+        """List-of-dicts view of the stored entries.
+        
+        ``on_change(index, field, value)`` is called instead of
+        ``set_value`` when an entry is modified through the view.
+        """
+        return FeedbackEntries(self, on_change or self.set_value)
+    
+    def copy(self) -> 'FeedbackStore':
+        """Copy of the entries and aggregates, to save while this store keeps changing."""
+        store = FeedbackStore(self.trend_tracker.window, self.ewma_halflife_days)
+        store.partitions = {day: partition.copy() for day, partition in self.partitions.items()}
+        store.days = list(self.days)
+        store.size = self.size
+        store.aggregates = self.aggregates.copy()
+        store.user_types = list(self.user_types)
+        store.categories = list(self.categories)
+        store._user_type_lookup = dict(self._user_type_lookup)
+        store._category_lookup = dict(self._category_lookup)
+        store.trend_tracker.stale = True
+        
+        return store
+    
+    def save(self, path: str):
+        """Write columns and aggregates as ``columns.npz`` plus ``store.json`` to ``path``.
+        
+        Comments and other free-form fields are written as JSON; values JSON
+        cannot represent are stored as strings. Both files are fsynced.
+        """
+        os.makedirs(path, exist_ok=True)
+        partitions = [self.partitions[day] for day in self.days]
+        aggregates = [partition.aggregates for partition in partitions] + [self.aggregates]
+        
+        with open(os.path.join(path, 'columns.npz'), 'wb') as f:
+            np.savez(
+                f,
+                days=np.array(self.days, dtype=np.int64),
+                sizes=np.array([partition.size for partition in partitions], dtype=np.int64),
+                origins=np.array([np.nan if a.origin is None else a.origin for a in aggregates]),
+                overall=np.array([a.overall for a in aggregates]),
+                by_user_type=np.stack([_resize(a.by_user_type, len(self.user_types)) for a in aggregates]),
+                by_category=np.stack([_resize(a.by_category, len(self.categories)) for a in aggregates]),
+                **self.columns()
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        
+        comments = []
+        extras = {}
+        offset = 0
+        for partition in partitions:
+            comments.extend(partition.comments)
+            for name, values in partition.extra_fields.items():
+                field = extras.setdefault(name, {'index': [], 'values': []})
+                for i, value in enumerate(values):
+                    if value is not _MISSING:
+                        field['index'].append(offset + i)
+                        field['values'].append(value)
+            offset += partition.size
+        
+        with open(os.path.join(path, 'store.json'), 'w') as f:
+            json.dump({
+                'trend_window': self.trend_tracker.window,
+                'ewma_halflife_days': self.ewma_halflife_days,
+                'user_types': self.user_types,
+                'categories': self.categories,
+                'comments': comments,
+                'extras': extras
+            }, f, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+    
+    @classmethod
+    def load(cls, path: str) -> 'FeedbackStore':
+        """Load a store written by ``save``, with the trend settings it was saved with."""
+        arrays = dict(np.load(os.path.join(path, 'columns.npz')))
+        with open(os.path.join(path, 'store.json')) as f:
+            meta = json.load(f)
+        
+        store = cls(meta['trend_window'], meta['ewma_halflife_days'])
+        for user_type in meta['user_types']:
+            store._encode(user_type, store.user_types, store._user_type_lookup)
+        for category in meta['categories']:
+            store._encode(category, store.categories, store._category_lookup)
+        
+        def restore(i: int) -> FeedbackAggregates:
+            aggregates = FeedbackAggregates(store.ewma_halflife_days)
+            if not np.isnan(arrays['origins'][i]):
+                aggregates.origin = float(arrays['origins'][i])
+            aggregates.overall = arrays['overall'][i].copy()
+            aggregates.by_user_type = arrays['by_user_type'][i].copy()
+            aggregates.by_category = arrays['by_category'][i].copy()
+            return aggregates
+        
+        extras = {
+            name: (np.asarray(field['index'], dtype=np.int64), field['values'])
+            for name, field in meta['extras'].items()
+        }
+        
+        start = 0
+        for i, (day, size) in enumerate(zip(arrays['days'].tolist(), arrays['sizes'].tolist())):
+            stop = start + size
+            partition = FeedbackPartition(day, store.ewma_halflife_days, capacity=max(size, 64))
+            partition.size = size
+            partition.timestamps[:size] = arrays['timestamp'][start:stop]
+            partition.satisfaction[:size] = arrays['satisfaction'][start:stop]
+            partition.user_type_codes[:size] = arrays['user_type'][start:stop]
+            partition.category_codes[:size] = arrays['category'][start:stop]
+            partition.comments = meta['comments'][start:stop]
+            for name, (index, values) in extras.items():
+                lo, hi = np.searchsorted(index, [start, stop])
+                if hi > lo:
+                    field_values = partition.extra_fields[name] = [_MISSING] * size
+                    for j in range(lo, hi):
+                        field_values[index[j] - start] = values[j]
+            partition.aggregates = restore(i)
+            partition._update_bounds()
+            
+            store.partitions[day] = partition
+            store.days.append(day)
+            start = stop
+        
+        store.size = start
+        store.aggregates = restore(-1)
+        store.trend_tracker.stale = True
+        
+        return store
+    
+    def _insert(self, timestamp: int, satisfaction: float, user_type: int, category: int,
+                comments: Any, extras: Dict[str, Any]):
+        day = timestamp // DAY_NS
+        partition = self.partitions.get(day)
+        if partition is None:
+            partition = self.partitions[day] = FeedbackPartition(day, self.ewma_halflife_days)
+            bisect.insort(self.days, day)
+        # Appending to the newest day moves no day's first index
+        if day != self.days[-1] or partition.size == 0:
+            self._starts = None
+        
+        partition.append(timestamp, satisfaction, user_type, category, comments, extras)
+        self.aggregates.add(user_type, category, satisfaction, timestamp)
+        self.trend_tracker.add(timestamp, satisfaction)
+        self.size += 1
+        self.version += 1
+    
+    def _remove(self, partition: 'FeedbackPartition', offset: int):
+        values = partition.remove(offset)
+        self.aggregates.add(
+            values['user_type'], values['category'], values['satisfaction'],
+            values['timestamp'], weight=-1
+        )
+        self.trend_tracker.remove(values['timestamp'])
+        self.size -= 1
+        self.version += 1
+        self._starts = None
+        
+        if partition.size == 0:
+            del self.partitions[partition.day]
+            self.days.remove(partition.day)
+    
+    def _reset_trend_tracker(self):
+        """Refill ``trend_tracker`` from the newest days, after removals it could not follow."""
+        window = self.trend_tracker.window
+        parts = []
+        for day in reversed(self.days):
+            parts.insert(0, self.partitions[day].columns())
+            if sum(len(part['timestamp']) for part in parts) >= window:
+                break
+        
+        timestamps = np.concatenate([part['timestamp'] for part in parts] or [np.empty(0, dtype=np.int64)])
+        satisfaction = np.concatenate([part['satisfaction'] for part in parts] or [np.empty(0)])
+        # Stable timestamp order, as in a sort of all entries
+        newest = np.argsort(timestamps, kind='stable')[-window:]
+        self.trend_tracker.reset(timestamps[newest], satisfaction[newest])
+    
+    def _partitions_since(self, since: int = None) -> List['FeedbackPartition']:
+        start = 0 if since is None else bisect.bisect_left(self.days, since // DAY_NS)
+        return [self.partitions[day] for day in self.days[start:]]
+    
+    def _locate(self, index: int) -> Tuple['FeedbackPartition', int]:
+        """Partition and offset of entry ``index``, counting from the oldest day."""
+        if not 0 <= index < self.size:
+            raise IndexError("feedback index out of range")
+        
+        if self._starts is None:
+            sizes = [self.partitions[day].size for day in self.days]
+            self._starts = np.concatenate(([0], np.cumsum(sizes)[:-1])).tolist()
+        
+        i = bisect.bisect_right(self._starts, index) - 1
+        return self.partitions[self.days[i]], index - self._starts[i]
+    
+    @staticmethod
+    def _encode(value: Any, labels: List[Any], lookup: Dict[Any, int]) -> int:
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(labels)
+            labels.append(value)
+        return code
+
+class FeedbackPartition:
+    """Columnar feedback entries of one day with their aggregated statistics."""
+    
+    def __init__(self, day: int, ewma_halflife_days: float = 7.0, capacity: int = 64):
+        self.day = day
+        self.size = 0
+        self.timestamps = np.empty(capacity, dtype=np.int64)
+        self.satisfaction = np.empty(capacity, dtype=np.float64)
+        self.user_type_codes = np.empty(capacity, dtype=np.int16)
+        self.category_codes = np.empty(capacity, dtype=np.int32)
+        self.comments = []
+        self.extra_fields = {}
+        self.aggregates = FeedbackAggregates(ewma_halflife_days)
+        self.oldest = None
+        self.oldest_satisfaction = None
+        self.newest = None
+    
+    def append(self, timestamp: int, satisfaction: float, user_type: int, category: int,
+               comments: Any, extras: Dict[str, Any]):
+        if self.size == len(self.timestamps):
+            self._grow()
+        
+        offset = self.size
+        self.timestamps[offset] = timestamp
+        self.satisfaction[offset] = satisfaction
+        self.user_type_codes[offset] = user_type
+        self.category_codes[offset] = category
+        self.comments.append(comments)
+        
+        for name, values in self.extra_fields.items():
+            values.append(extras.get(name, _MISSING))
+        for name, value in extras.items():
+            if name not in self.extra_fields:
+                self.extra_fields[name] = [_MISSING] * offset + [value]
+        
+        self.aggregates.add(user_type, category, satisfaction, timestamp)
+        if self.oldest is None or timestamp < self.oldest:
+            self.oldest, self.oldest_satisfaction = timestamp, satisfaction
+        self.newest = timestamp if self.newest is None else max(self.newest, timestamp)
+        self.size += 1
+    
+    def get(self, offset: int) -> Dict[str, Any]:
+        """Raw (encoded) values of the entry at ``offset``."""
+        return {
+            'timestamp': int(self.timestamps[offset]),
+            'satisfaction': self.satisfaction[offset].item(),
+            'user_type': int(self.user_type_codes[offset]),
+            'category': int(self.category_codes[offset]),
+            'comments': self.comments[offset],
+            'extras': {
+                name: values[offset]
+                for name, values in self.extra_fields.items()
+                if values[offset] is not _MISSING
+            }
+        }
+    
+    def replace(self, offset: int, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Overwrite the entry at ``offset`` with raw ``values``; returns the previous ones."""
+        previous = self.get(offset)
+        
+        self.timestamps[offset] = values['timestamp']
+        self.satisfaction[offset] = values['satisfaction']
+        self.user_type_codes[offset] = values['user_type']
+        self.category_codes[offset] = values['category']
+        self.comments[offset] = values['comments']
+        for name, value in values['extras'].items():
+            if name not in self.extra_fields:
+                self.extra_fields[name] = [_MISSING] * self.size
+            self.extra_fields[name][offset] = value
+        
+        self.aggregates.add(
+            previous['user_type'], previous['category'], previous['satisfaction'],
+            previous['timestamp'], weight=-1
+        )
+        self.aggregates.add(
+            values['user_type'], values['category'], values['satisfaction'], values['timestamp']
+        )
+        self._update_bounds()
+        
+        return previous
+    
+    def remove(self, offset: int) -> Dict[str, Any]:
+        """Remove the entry at ``offset`` and return its raw values."""
+        values = self.get(offset)
+        
+        for name in ('timestamps', 'satisfaction', 'user_type_codes', 'category_codes'):
+            column = getattr(self, name)
+            column[offset:self.size - 1] = column[offset + 1:self.size]
+        del self.comments[offset]
+        for field_values in self.extra_fields.values():
+            del field_values[offset]
+        
+        self.size -= 1
+        self.aggregates.add(
+            values['user_type'], values['category'], values['satisfaction'],
+            values['timestamp'], weight=-1
+        )
+        if self.size:
+            self._update_bounds()
+        
+        return values
+    
+    def copy(self) -> 'FeedbackPartition':
+        partition = FeedbackPartition(self.day, self.aggregates.ewma_halflife_days, capacity=0)
+        partition.size = self.size
+        partition.timestamps = self.timestamps[:self.size].copy()
+        partition.satisfaction = self.satisfaction[:self.size].copy()
+        partition.user_type_codes = self.user_type_codes[:self.size].copy()
+        partition.category_codes = self.category_codes[:self.size].copy()
+        partition.comments = list(self.comments)
+        partition.extra_fields = {name: list(values) for name, values in self.extra_fields.items()}
+        partition.aggregates = self.aggregates.copy()
+        partition.oldest, partition.oldest_satisfaction = self.oldest, self.oldest_satisfaction
+        partition.newest = self.newest
+        
+        return partition
+    
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Views of the filled part of every typed column."""
+        return {
+            'timestamp': self.timestamps[:self.size],
+            'satisfaction': self.satisfaction[:self.size],
+            'user_type': self.user_type_codes[:self.size],
+            'category': self.category_codes[:self.size]
+        }
+    
+    def _update_bounds(self):
+        timestamps = self.timestamps[:self.size]
+        first = int(np.argmin(timestamps))
+        self.oldest = int(timestamps[first])
+        self.oldest_satisfaction = self.satisfaction[first].item()
+        self.newest = int(timestamps.max())
+    
+    def _grow(self):
+        capacity = 2 * len(self.timestamps)
+        for name in ('timestamps', 'satisfaction', 'user_type_codes', 'category_codes'):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+
+class FeedbackAggregates:
+    """Running sums of satisfaction scores and their timestamps.
+    
+    Kept overall and per user type and category code: count, sum and sum of
+    squares of the scores, the sums of a least-squares fit of score against
+    time, and time-decayed sums for an exponentially weighted mean with a
+    half-life of ``ewma_halflife_days``. Times are days since ``origin``,
+    which moves forward as newer entries arrive so the decay weights stay
+    bounded. Adding or removing an entry is O(1) and summary statistics never
+    need a pass over entries.
+    """
+    
+    # count, sum, sum of squares, t, t^2, t * score, decay weight, weight * score
+    WIDTH = 8
+    # Move the origin once the newest entry's decay weight exceeds 2 ** MAX_HALFLIVES
+    MAX_HALFLIVES = 64
+    
+    def __init__(self, ewma_halflife_days: float = 7.0):
+        self.ewma_halflife_days = ewma_halflife_days
+        self.origin = None
+        self.overall = np.zeros(self.WIDTH)
+        self.by_user_type = np.zeros((0, self.WIDTH))
+        self.by_category = np.zeros((0, self.WIDTH))
+    
+    def add(self, user_type_code: int, category_code: int, satisfaction: float,
+            timestamp: int, weight: int = 1):
+        """Add one entry (``timestamp`` in ns), or remove it with ``weight=-1``."""
+        days = timestamp / DAY_NS
+        if self.origin is None:
+            self.origin = days
+        elif (days - self.origin) / self.ewma_halflife_days > self.MAX_HALFLIVES:
+            self._rebase(days)
+        
+        t = days - self.origin
+        decay = 2.0 ** (t / self.ewma_halflife_days)
+        stats = weight * np.array([
+            1.0, satisfaction, satisfaction * satisfaction,
+            t, t * t, t * satisfaction, decay, decay * satisfaction
+        ])
+        if user_type_code >= len(self.by_user_type):
+            self.by_user_type = self._grow(self.by_user_type, user_type_code + 1)
+        if category_code >= len(self.by_category):
+            self.by_category = self._grow(self.by_category, category_code + 1)
+        
+        self.overall += stats
+        self.by_user_type[user_type_code] += stats
+        self.by_category[category_code] += stats
+    
+    def merge(self, other: 'FeedbackAggregates', weight: int = 1):
+        """Add the entries aggregated in ``other``, or remove them with ``weight=-1``."""
+        if other.origin is None:
+            return
+        if self.origin is None:
+            self.origin = other.origin
+        elif self.origin < other.origin:
+            self._rebase(other.origin)
+        
+        shift = self.origin - other.origin
+        self.overall += weight * self._shifted(other.overall, shift)
+        for name in ('by_user_type', 'by_category'):
+            mine, theirs = getattr(self, name), getattr(other, name)
+            if len(theirs) > len(mine):
+                mine = self._grow(mine, len(theirs))
+                setattr(self, name, mine)
+            mine[:len(theirs)] += weight * self._shifted(theirs, shift)
+    
+    @classmethod
+    def from_columns(cls, user_type_codes: np.ndarray, category_codes: np.ndarray,
+                     satisfaction: np.ndarray, timestamps: np.ndarray,
+                     ewma_halflife_days: float = 7.0) -> 'FeedbackAggregates':
+        """Aggregates of many entries at once, from their column values."""
+        aggregates = cls(ewma_halflife_days)
+        if len(timestamps) == 0:
+            return aggregates
+        
+        days = timestamps / DAY_NS
+        aggregates.origin = float(days.max())
+        t = days - aggregates.origin
+        decay = 2.0 ** (t / ewma_halflife_days)
+        weights = (
+            None, satisfaction, satisfaction * satisfaction,
+            t, t * t, t * satisfaction, decay, decay * satisfaction
+        )
+        
+        aggregates.overall = np.array([
+            len(satisfaction) if w is None else w.sum() for w in weights
+        ], dtype=float)
+        aggregates.by_user_type = np.column_stack([
+            np.bincount(user_type_codes, weights=w, minlength=1) for w in weights
+        ]).astype(float)
+        aggregates.by_category = np.column_stack([
+            np.bincount(category_codes, weights=w, minlength=1) for w in weights
+        ]).astype(float)
+        
+        return aggregates
+    
+    def copy(self) -> 'FeedbackAggregates':
+        aggregates = FeedbackAggregates(self.ewma_halflife_days)
+        aggregates.origin = self.origin
+        aggregates.overall = self.overall.copy()
+        aggregates.by_user_type = self.by_user_type.copy()
+        aggregates.by_category = self.by_category.copy()
+        return aggregates
+    
+    @property
+    def count(self) -> int:
+        return int(round(self.overall[0]))
+    
+    def trend(self, stats: np.ndarray = None) -> Dict[str, float]:
+        """Exponentially weighted mean and least-squares slope (per day) of the scores."""
+        count, total, _, t, t_sq, t_score, decay, decay_score = self.overall if stats is None else stats
+        
+        # Entries less than about a second apart leave the slope undefined
+        t_variance = t_sq / count - (t / count) ** 2 if count > 1 else 0.0
+        slope = (t_score / count - t / count * total / count) / t_variance if t_variance > 1e-10 else 0.0
+        
+        return {
+            'ewma': float(decay_score / decay) if decay > 0 else float(total / count),
+            'slope_per_day': float(slope)
+        }
+    
+    def summary(self, user_types: List[Any], categories: List[Any]) -> Dict[str, Any]:
+        """Overall, per user type and per category statistics, as analyze_feedback reports them."""
+        count, total, total_sq = self.overall[:3]
+        variance = (total_sq - total * total / count) / (count - 1) if count > 1 else float('nan')
+        
+        return {
+            'overall_metrics': {
+                'total_feedback': self.count,
+                'average_satisfaction': float(total / count),
+                'satisfaction_std': float(np.sqrt(max(variance, 0.0))) if count > 1 else variance
+            },
+            'user_type_analysis': self._group_summary(
+                self.by_user_type, user_types, 'feedback_by_user_type',
+                'satisfaction_by_user_type', 'satisfaction_trend_by_user_type'
+            ),
+            'category_analysis': self._group_summary(
+                self.by_category, categories, 'feedback_by_category',
+                'satisfaction_by_category', 'satisfaction_trend_by_category'
+            )
+        }
+    
+    def _group_summary(self, stats: np.ndarray, labels: List[Any], count_key: str,
+                       mean_key: str, trend_key: str) -> Dict[str, Dict[Any, Any]]:
+        """Feedback counts (most frequent first), mean satisfaction and trend per label."""
+        counts = np.round(stats[:, 0]).astype(int)
+        present = np.flatnonzero(counts > 0)
+        by_label = sorted(present, key=lambda code: labels[code])
+        
+        return {
+            count_key: {
+                labels[code]: int(counts[code])
+                for code in sorted(present, key=lambda code: -counts[code])
+            },
+            mean_key: {
+                labels[code]: float(stats[code, 1] / counts[code])
+                for code in by_label
+            },
+            trend_key: {
+                labels[code]: self.trend(stats[code])
+                for code in by_label
+            }
+        }
+    
+    def _rebase(self, origin: float):
+        """Move the origin forward to ``origin`` (days)."""
+        shift = origin - self.origin
+        self.overall = self._shifted(self.overall, shift)
+        self.by_user_type = self._shifted(self.by_user_type, shift)
+        self.by_category = self._shifted(self.by_category, shift)
+        self.origin = origin
+    
+    def _shifted(self, stats: np.ndarray, shift: float) -> np.ndarray:
+        """``stats`` with times measured from ``shift`` days later."""
+        if shift == 0:
+            return stats
+        
+        count, total, t, t_score = stats[..., 0], stats[..., 1], stats[..., 3], stats[..., 5]
+        shifted = stats.copy()
+        shifted[..., 3] = t - shift * count
+        shifted[..., 4] = stats[..., 4] - 2 * shift * t + shift * shift * count
+        shifted[..., 5] = t_score - shift * total
+        shifted[..., 6:] *= 2.0 ** (-shift / self.ewma_halflife_days)
+        
+        return shifted
+    
+    @classmethod
+    def _grow(cls, stats: np.ndarray, size: int) -> np.ndarray:
+        grown = np.zeros((max(size, 2 * len(stats)), cls.WIDTH))
+        grown[:len(stats)] = stats
+        return grown
+
+class FeedbackEntries(Sequence):
+    """Read-write sequence view of a FeedbackStore, one dict-like entry per item."""
+    
+    def __init__(self, store: FeedbackStore, on_change):
+        self.store = store
+        self.on_change = on_change
+    
+    def __len__(self) -> int:
+        return len(self.store)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("feedback index out of range")
+        return FeedbackEntry(self, index)
+
+class FeedbackEntry(MutableMapping):
+    """One stored feedback entry; assignments are written back to the store."""
+    
+    def __init__(self, entries: FeedbackEntries, index: int):
+        self.entries = entries
+        self.index = index
+        self._entry = None
+        self._version = None
+    
+    def __getitem__(self, field: str) -> Any:
+        return self._values()[field]
+    
+    def __setitem__(self, field: str, value: Any):
+        self.entries.on_change(self.index, field, value)
+    
+    def __delitem__(self, field: str):
+        raise TypeError("Feedback fields cannot be deleted")
+    
+    def __iter__(self):
+        return iter(self._values())
+    
+    def __len__(self) -> int:
+        return len(self._values())
+    
+    def __repr__(self) -> str:
+        return repr(self._values())
+    
+    def keys(self):
+        return self._values().keys()
+    
+    def items(self):
+        return self._values().items()
+    
+    def values(self):
+        return self._values().values()
+    
+    def _values(self) -> Dict[str, Any]:
+        """The entry as a dict, fetched once per version of the store."""
+        store = self.entries.store
+        if self._version != store.version:
+            self._entry = store.get_entry(self.index)
+            self._version = store.version
+        return self._entry
+
+def _resize(stats: np.ndarray, size: int) -> np.ndarray:
+    resized = np.zeros((size, FeedbackAggregates.WIDTH))
+    resized[:min(size, len(stats))] = stats[:size]
+    return resized
+
+def _to_ns(timestamp: Any) -> int:
+    return pd.Timestamp(timestamp).value
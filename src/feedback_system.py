@@ -3,6 +3,10 @@ import numpy as np
 from typing import Dict, List, Any
 from datetime import datetime
 import json
+import copy
+from .feedback_log import FeedbackLog
+from .feedback_store import FeedbackStore, FeedbackAggregates, DAY_NS, _to_ns
+from .utils import logger
 
 class FeedbackSystem:
     def __init__(self, config: Dict[str, Any] = None):
@@ -17,35 +21,71 @@ class FeedbackSystem:
             'satisfaction_scale': (1, 5),
             'retention_period_days': 365
         }
-        self.feedback_data = []
+        trend = self.config.get('trend') or {}
+        self.store = FeedbackStore(
+            trend_window=trend.get('window', 10),
+            ewma_halflife_days=trend.get('ewma_halflife_days', 7.0)
+        )
         self.analysis_cache = {}
         
+        persistence = self.config.get('persistence') or {}
+        self.snapshot_interval = persistence.get('snapshot_interval', 100000)
+        self.log = None
+        if persistence.get('path'):
+            self.log = FeedbackLog(
+                persistence['path'],
+                durability=persistence.get('durability', 'batch'),
+                max_batch_size=persistence.get('max_batch_size', 256),
+                max_wait_ms=persistence.get('max_wait_ms', 50.0)
+            )
+            self._recover()
+    
+    @property
+    def feedback_data(self):
+        """Collected feedback as a sequence of dict-like entries.
+        
+        Entries are views of the columnar ``store``; assigning to a field
+        updates the stored entry.
+        """
+        return self.store.entries(on_change=self._update_entry)
+    
     def collect_feedback(self, user_type: str, feedback: Dict[str, Any]) -> bool:
         """Collect and validate user feedback."""
         if user_type not in self.config['user_types']:
             raise ValueError(f"Invalid user type: {user_type}")
-            
+        
         required_fields = ['satisfaction', 'category', 'comments']
         missing_fields = [f for f in required_fields if f not in feedback]
         
         if missing_fields:
             raise ValueError(f"Missing required fields: {missing_fields}")
-            
+        
         if not self._validate_satisfaction_score(feedback['satisfaction']):
             raise ValueError(
                 f"Invalid satisfaction score. Must be between "
                 f"{self.config['satisfaction_scale'][0]} and "
                 f"{self.config['satisfaction_scale'][1]}"
             )
-            
-        feedback_entry = {
-            'user_type': user_type,
-            'timestamp': datetime.now(),
-            **feedback
-        }
         
-        self.feedback_data.append(feedback_entry)
-        self._clear_analysis_cache()
+        extras = {
+            k: v for k, v in feedback.items()
+            if k not in ('user_type', 'timestamp', 'satisfaction', 'category', 'comments')
+        }
+        timestamp = self.store.append(
+            user_type, feedback.get('timestamp', datetime.now()), feedback['satisfaction'],
+            feedback['category'], feedback['comments'], extras
+        )
+        self._log({
+            'op': 'add',
+            'user_type': user_type,
+            'timestamp': timestamp,
+            'satisfaction': feedback['satisfaction'],
+            'category': feedback['category'],
+            'comments': feedback['comments'],
+            'extras': extras
+        })
+        self._invalidate_analysis(timestamp)
+        self._enforce_retention()
         
         return True
     
@@ -55,71 +95,159 @@ class FeedbackSystem:
         return isinstance(score, (int, float)) and min_score <= score <= max_score
     
     def analyze_feedback(self, timeframe_days: int = None) -> Dict[str, Any]:
-        """Analyze collected feedback to identify patterns and issues."""
-        if not self.feedback_data:
+        """Analyze collected feedback to identify patterns and issues.
+        
+        Overall, user type and category statistics come from running
+        aggregates; timeframe results combine the pre-aggregated days they
+        cover. Results are kept in ``analysis_cache`` until feedback
+        inside their timeframe changes or, for timeframe results, until their
+        oldest entry leaves the timeframe.
+        """
+        self._enforce_retention()
+        if len(self.store) == 0:
             return {
                 'status': 'No feedback data available',
                 'timestamp': datetime.now()
             }
-            
-        # Convert feedback data to DataFrame for analysis
-        df = pd.DataFrame(self.feedback_data)
+        
+        now = pd.Timestamp.now()
+        key = timeframe_days or None
+        cached = self.analysis_cache.get(key)
+        if cached is not None and (cached['expires'] is None or now.value < cached['expires']):
+            analysis = copy.deepcopy(cached['analysis'])
+            analysis['timestamp'] = datetime.now()
+            return analysis
+        
+        cutoff = expires = None
         
         # Apply timeframe filter if specified
         if timeframe_days:
-            cutoff_date = pd.Timestamp.now() - pd.Timedelta(days=timeframe_days)
-            df = df[df['timestamp'] >= cutoff_date]
+            window = pd.Timedelta(days=timeframe_days).value
+            cutoff = now.value - window
+            aggregates, oldest = self.store.aggregate(since=cutoff)
             
-        if len(df) == 0:
-            return {
-                'status': 'No feedback data available for specified timeframe',
-                'timestamp': datetime.now()
-            }
+            if aggregates.count == 0:
+                return {
+                    'status': 'No feedback data available for specified timeframe',
+                    'timestamp': datetime.now()
+                }
             
-        analysis = {
-            'overall_metrics': {
-                'total_feedback': len(df),
-                'average_satisfaction': df['satisfaction'].mean(),
-                'satisfaction_std': df['satisfaction'].std(),
-                'feedback_trend': self._calculate_feedback_trend(df)
-            },
-            'user_type_analysis': {
-                'feedback_by_user_type': df['user_type'].value_counts().to_dict(),
-                'satisfaction_by_user_type': df.groupby('user_type')['satisfaction'].mean().to_dict()
-            },
-            'category_analysis': {
-                'feedback_by_category': df['category'].value_counts().to_dict(),
-                'satisfaction_by_category': df.groupby('category')['satisfaction'].mean().to_dict()
-            },
-            'timestamp': datetime.now()
-        }
+            # The result holds until its oldest entry leaves the timeframe
+            expires = oldest + window
+        else:
+            aggregates = self.store.aggregates
         
-        return analysis
+        analysis = aggregates.summary(self.store.user_types, self.store.categories)
+        analysis['overall_metrics']['feedback_trend'] = self._calculate_feedback_trend(
+            aggregates, since=cutoff
+        )
+        analysis['timestamp'] = datetime.now()
+        
+        self.analysis_cache[key] = {'analysis': analysis, 'cutoff': cutoff, 'expires': expires}
+        
+        return copy.deepcopy(analysis)
     
-    def _calculate_feedback_trend(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Calculate trend in feedback satisfaction over time."""
-        df = df.sort_values('timestamp')
-        df['satisfaction_rolling_avg'] = df['satisfaction'].rolling(
-            window=min(10, len(df)),
-            min_periods=1
-        ).mean()
-        
-        trend = {
-            'direction': 'stable',
-            'strength': 0.0
-        }
+    def _calculate_feedback_trend(self, aggregates: FeedbackAggregates,
+                                  since: int = None) -> Dict[str, Any]:
+        """Calculate trend in feedback satisfaction over time.
+        
+        Direction and strength compare the first and last values of a
+        rolling mean, kept up to date by the store's trend tracker; the
+        exponentially weighted mean and least-squares slope come from the
+        running aggregates. No feedback is sorted or scanned.
+        """
+        trend = self.store.trend(since)
+        trend['trend_direction'] = trend['direction']
+        trend['trend_strength'] = trend['strength']
+        trend.update(aggregates.trend())
         
-        if len(df) >= 2:
-            start_avg = df['satisfaction_rolling_avg'].iloc[0]
-            end_avg = df['satisfaction_rolling_avg'].iloc[-1]
-            change = end_avg - start_avg
-            
-            if abs(change) > 0.1:
-                trend['direction'] = 'improving' if change > 0 else 'declining'
-                trend['strength'] = abs(change)
-                
         return trend
     
+    def _update_entry(self, index: int, field: str, value: Any):
+        """Write a modified field of a stored entry back to the store."""
+        old_timestamp = self.store.get_timestamp(index)
+        new_timestamp = _to_ns(value) if field == 'timestamp' else old_timestamp
+        
+        self.store.set_value(index, field, value)
+        self._log({
+            'op': 'set',
+            'index': index,
+            'field': field,
+            'value': new_timestamp if field == 'timestamp' else value
+        })
+        self._invalidate_analysis(max(old_timestamp, new_timestamp))
+    
+    def _enforce_retention(self):
+        """Drop the days of feedback older than ``retention_period_days``.
+        
+        Whole days are dropped at once, so entries are kept until the end of
+        the day in which they expire.
+        """
+        retention_days = self.config.get('retention_period_days')
+        if not retention_days:
+            return
+        
+        cutoff = pd.Timestamp.now().value - pd.Timedelta(days=retention_days).value
+        newest_dropped = self.store.drop_before(cutoff // DAY_NS)
+        if newest_dropped is not None:
+            self._log({'op': 'drop', 'day': cutoff // DAY_NS})
+            self._invalidate_analysis(newest_dropped)
+    
+    def snapshot(self) -> str:
+        """Snapshot the store so recovery only replays feedback logged after it."""
+        if self.log is None:
+            raise RuntimeError("Feedback persistence is not configured")
+        return self.log.snapshot(self.store.save)
+    
+    def close(self):
+        """Write pending log records to disk and stop the log."""
+        if self.log is not None:
+            self.log.close()
+    
+    def _log(self, record: Dict[str, Any]):
+        """Append a change to the feedback log, snapshotting every ``snapshot_interval`` records.
+        
+        Snapshots taken here copy the store and are written in the background,
+        so the caller only waits for the copy.
+        """
+        if self.log is None:
+            return
+        
+        seq = self.log.append(record)
+        if (self.snapshot_interval and seq - self.log.snapshot_seq >= self.snapshot_interval
+                and not self.log.snapshot_in_progress):
+            self.log.snapshot(self.store.copy().save, wait=False)
+    
+    def _recover(self):
+        """Rebuild the store from the latest snapshot and the records logged after it."""
+        if self.log.snapshot_path is not None:
+            self.store = FeedbackStore.load(self.log.snapshot_path)
+        
+        replayed = 0
+        for record in self.log.replay():
+            if record['op'] == 'add':
+                self.store.append(
+                    record['user_type'], record['timestamp'], record['satisfaction'],
+                    record['category'], record['comments'], record['extras']
+                )
+            elif record['op'] == 'set':
+                self.store.set_value(record['index'], record['field'], record['value'])
+            elif record['op'] == 'drop':
+                self.store.drop_before(record['day'])
+            replayed += 1
+        
+        if len(self.store):
+            logger.info(f"Recovered {len(self.store)} feedback entries, {replayed} replayed from the log")
+    
+    def _invalidate_analysis(self, timestamp: int):
+        """Drop cached results whose timeframe includes ``timestamp`` (ns)."""
+        for key in [
+            key for key, cached in self.analysis_cache.items()
+            if cached['cutoff'] is None or timestamp >= cached['cutoff']
+        ]:
+            del self.analysis_cache[key]
+    
+    
     def _clear_analysis_cache(self):
         """Clear cached analysis results."""
         self.analysis_cache = {}
@@ -0,0 +1,87 @@
+import numpy as np
+from typing import Dict, Any
+
+class TrendTracker:
+    """Newest satisfaction scores in a fixed-size ring buffer, for the feedback trend.
+    
+    The trend compares the first and last values of a rolling mean over
+    ``window`` entries in timestamp order: the oldest entry's score (the
+    first rolling value, with ``min_periods=1``) and the mean of the
+    ``window`` newest scores. New entries overwrite the oldest slot of the
+    buffer, so adding one and computing the trend take O(window) time.
+    
+    Removing an entry the buffer may hold marks it ``stale``; the owner then
+    refills it with ``reset``.
+    """
+    
+    def __init__(self, window: int = 10, threshold: float = 0.1):
+        self.window = window
+        self.threshold = threshold
+        self.timestamps = np.zeros(window, dtype=np.int64)
+        self.satisfaction = np.zeros(window)
+        # Arrival order breaks ties between equal timestamps
+        self.arrivals = np.zeros(window, dtype=np.int64)
+        self.size = 0
+        self.arrival = 0
+        self.stale = False
+    
+    def add(self, timestamp: int, satisfaction: float):
+        """Add an entry (``timestamp`` in ns) if it is among the newest."""
+        if self.stale:
+            return
+        
+        if self.size < self.window:
+            slot = self.size
+            self.size += 1
+        else:
+            slot = self._oldest_slot()
+            if timestamp < self.timestamps[slot]:
+                return
+        
+        self.timestamps[slot] = timestamp
+        self.satisfaction[slot] = satisfaction
+        self.arrivals[slot] = self.arrival
+        self.arrival += 1
+    
+    def remove(self, timestamp: int):
+        """Note the removal of an entry, marking the buffer stale if it may hold it."""
+        if self.size and timestamp >= self.timestamps[self._oldest_slot()]:
+            self.stale = True
+    
+    def reset(self, timestamps: np.ndarray, satisfaction: np.ndarray):
+        """Refill the buffer with the newest entries, oldest first."""
+        self.size = len(timestamps)
+        self.timestamps[:self.size] = timestamps
+        self.satisfaction[:self.size] = satisfaction
+        self.arrivals[:self.size] = np.arange(self.size)
+        self.arrival = self.size
+        self.stale = False
+    
+    def trend(self, start: float, since: int = None) -> Dict[str, Any]:
+        """Trend from the oldest score ``start`` to the mean of the newest ones.
+        
+        With ``since`` (ns), only entries at or after it count; the buffer
+        then holds every such entry if it holds any older one.
+        """
+        trend = {
+            'direction': 'stable',
+            'strength': 0.0
+        }
+        
+        newest = self.satisfaction[:self.size]
+        if since is not None:
+            newest = newest[self.timestamps[:self.size] >= since]
+        
+        if start is not None and len(newest) >= 2:
+            change = newest.mean() - start
+            
+            if abs(change) > self.threshold:
+                trend['direction'] = 'improving' if change > 0 else 'declining'
+                trend['strength'] = float(abs(change))
+        
+        return trend
+    
+    def _oldest_slot(self) -> int:
+        timestamps = self.timestamps[:self.size]
+        ties = np.flatnonzero(timestamps == timestamps.min())
+        return int(ties[np.argmin(self.arrivals[ties])])
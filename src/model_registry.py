@@ -0,0 +1,160 @@
+import os
+import json
+import errno
+import shutil
+import tempfile
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+from .decision_analyzer import DecisionAnalyzer
+from .utils import logger
+
+class ModelRegistry:
+    """Local, versioned store of DecisionAnalyzer artifacts.
+    
+    Each registered model is written with ``save_artifact`` into its own
+    ``versions/v<N>`` directory, staged first and renamed into place, so a
+    version is either complete or absent. ``production.json`` names the
+    version in production and the ones promoted before it; it is replaced
+    atomically on promote and rollback.
+    """
+    
+    def __init__(self, root: str):
+        self.root = root
+        self.versions_dir = os.path.join(root, 'versions')
+        os.makedirs(self.versions_dir, exist_ok=True)
+    
+    def register(self, analyzer: DecisionAnalyzer, metadata: Dict[str, Any] = None,
+                 promote: bool = False) -> int:
+        """Store a trained analyzer as a new version and return its number.
+        
+        ``metadata`` is kept as the version's training metadata (e.g. data
+        source, row count). Pass ``promote=True`` to put it in production.
+        """
+        staging = tempfile.mkdtemp(prefix='.staging-', dir=self.versions_dir)
+        try:
+            analyzer.save_artifact(staging)
+            
+            version = self._next_version()
+            while True:
+                self._write_json(os.path.join(staging, 'version.json'), {
+                    'version': version,
+                    'created_at': datetime.now().isoformat(),
+                    'feature_schema': {
+                        'features': analyzer.feature_names,
+                        'categorical': list(analyzer.preprocessing['categories']),
+                        'numeric': list(analyzer.preprocessing['fill_values']),
+                        'bin_edges': {
+                            attr: edges.tolist() for attr, edges in analyzer.bin_edges.items()
+                        }
+                    },
+                    'training': metadata or {},
+                    'validation_accuracy': analyzer.performance_metrics
+                        .get('validation', {}).get('accuracy')
+                })
+                try:
+                    os.rename(staging, self._path(version))
+                    break
+                except OSError as e:
+                    # Another process registered this version number first
+                    if e.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                        raise
+                    version += 1
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        
+        logger.info(f"Registered model version {version}")
+        
+        if promote:
+            self.promote(version)
+        
+        return version
+    
+    def versions(self) -> List[Dict[str, Any]]:
+        """Information on every registered version, oldest first."""
+        return [self.get(version) for version in self._version_numbers()]
+    
+    def get(self, version: int) -> Dict[str, Any]:
+        """Feature schema and training metadata of one version."""
+        path = os.path.join(self._path(version), 'version.json')
+        if not os.path.exists(path):
+            raise ValueError(f"Unknown model version: {version}")
+        
+        with open(path) as f:
+            return json.load(f)
+    
+    def load(self, version: int = None, mmap: bool = True) -> DecisionAnalyzer:
+        """Load a version, or the production version by default.
+        
+        Node arrays are memory-mapped unless ``mmap`` is False.
+        """
+        if version is None:
+            version = self.production_version
+            if version is None:
+                raise RuntimeError("No model version has been promoted")
+        
+        self.get(version)
+        return DecisionAnalyzer.load_artifact(self._path(version), mmap=mmap)
+    
+    @property
+    def production_version(self) -> Optional[int]:
+        """Version currently in production, or None."""
+        return self._read_state()['version']
+    
+    def promote(self, version: int):
+        """Put ``version`` in production."""
+        self.get(version)
+        
+        state = self._read_state()
+        if state['version'] == version:
+            return
+        
+        if state['version'] is not None:
+            state['history'].append(state['version'])
+        state['version'] = version
+        
+        self._write_json(os.path.join(self.root, 'production.json'), state)
+        logger.info(f"Promoted model version {version}")
+    
+    def rollback(self) -> int:
+        """Return production to the previously promoted version."""
+        state = self._read_state()
+        if not state['history']:
+            raise RuntimeError("No previous model version to roll back to")
+        
+        state['version'] = state['history'].pop()
+        
+        self._write_json(os.path.join(self.root, 'production.json'), state)
+        logger.info(f"Rolled back to model version {state['version']}")
+        
+        return state['version']
+    
+    def _path(self, version: int) -> str:
+        return os.path.join(self.versions_dir, f'v{version}')
+    
+    def _version_numbers(self) -> List[int]:
+        return sorted(
+            int(name[1:]) for name in os.listdir(self.versions_dir)
+            if name.startswith('v') and name[1:].isdigit()
+        )
+    
+    def _next_version(self) -> int:
+        numbers = self._version_numbers()
+        return numbers[-1] + 1 if numbers else 1
+    
+    def _read_state(self) -> Dict[str, Any]:
+        path = os.path.join(self.root, 'production.json')
+        if not os.path.exists(path):
+            return {'version': None, 'history': []}
+        
+        with open(path) as f:
+            return json.load(f)
+    
+    @staticmethod
+    def _write_json(path: str, value: Dict[str, Any]):
+        """Write ``value`` to a temporary file and atomically replace ``path``."""
+        with open(path + '.tmp', 'w') as f:
+            json.dump(value, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + '.tmp', path)
@@ -0,0 +1,172 @@
+import os
+import math
+import time
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Any, Tuple
+from sklearn.base import clone
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.model_selection import StratifiedKFold, ParameterGrid
+from .bias_detector import BiasDetector
+from .compiled_forest import CompiledForest
+from .decision_analyzer import DecisionAnalyzer
+from .utils import logger, map_in_workers, worker_state
+
+def _fit_fold(task: Tuple[Dict[str, Any], np.ndarray, np.ndarray]) -> np.ndarray:
+    """Fit one parameter setting on one fold; predictions for its validation rows."""
+    params, train_idx, val_idx = task
+    X = worker_state['X']
+    y = worker_state['y']
+    
+    model = clone(worker_state['model']).set_params(**params)
+    model.fit(X[train_idx], y[train_idx])
+    
+    return model.predict(X[val_idx])
+
+class CrossValidator:
+    """K-fold cross-validation of the decision model over a process pool.
+    
+    Every (parameter setting, fold) pair is fitted by a worker; workers
+    receive the encoded training data once, when the pool starts. Each fold
+    reports the accuracy of the model's predictions on its held-out rows and
+    their disparate impact per protected attribute, from ``BiasDetector``
+    group counts. No training-set reports are computed.
+    """
+    
+    def __init__(self, decision_analyzer: DecisionAnalyzer = None,
+                 bias_detector: BiasDetector = None, n_folds: int = 5, n_jobs: int = None):
+        self.decision_analyzer = decision_analyzer or DecisionAnalyzer()
+        self.bias_detector = bias_detector or BiasDetector()
+        self.n_folds = n_folds
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+    
+    def cross_validate(self, features: pd.DataFrame, decisions: pd.Series,
+                       protected_attributes: pd.DataFrame = None,
+                       model_params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Cross-validate the model, with ``model_params`` overriding its parameters.
+        
+        ``protected_attributes`` holds the protected attribute columns of the
+        same rows; without it, folds only report accuracy.
+        """
+        X, y = self._encode(features, decisions)
+        if protected_attributes is not None:
+            self.bias_detector.fit_bins(protected_attributes)
+        
+        rows = np.arange(len(y))
+        return self._evaluate([model_params or {}], X, y, rows, protected_attributes)[0]
+    
+    def successive_halving(self, features: pd.DataFrame, decisions: pd.Series,
+                           param_grid: Dict[str, List[Any]],
+                           protected_attributes: pd.DataFrame = None,
+                           factor: int = 3, time_budget: float = None) -> Dict[str, Any]:
+        """Search ``param_grid`` by successive halving of cross-validated candidates.
+        
+        All candidates are first cross-validated on a small sample of rows;
+        the best ``1 / factor`` of them advance to a round with ``factor``
+        times as many rows, until one candidate remains or all rows are used.
+        With ``time_budget`` (seconds), no new round starts once it has been
+        spent. The best parameters are set on the decision analyzer, to be
+        used by its next ``train``.
+        """
+        X, y = self._encode(features, decisions)
+        if protected_attributes is not None:
+            self.bias_detector.fit_bins(protected_attributes)
+        
+        candidates = list(ParameterGrid(param_grid))
+        if not candidates:
+            raise ValueError("param_grid must contain at least one parameter setting")
+        
+        n_rounds = max(1, math.ceil(math.log(len(candidates), factor)))
+        min_rows = min(len(y), 20 * self.n_folds)
+        order = np.random.RandomState(
+            self.decision_analyzer.config['model_params'].get('random_state')
+        ).permutation(len(y))
+        
+        start = time.perf_counter()
+        rounds = []
+        for round_number in range(n_rounds):
+            n_rows = max(min_rows, int(len(y) * factor ** (round_number + 1 - n_rounds)))
+            results = self._evaluate(
+                candidates, X, y, np.sort(order[:n_rows]), protected_attributes
+            )
+            results.sort(key=lambda result: result['mean_accuracy'], reverse=True)
+            rounds.append({'rows': n_rows, 'results': results})
+            
+            candidates = [result['params'] for result in results[:math.ceil(len(results) / factor)]]
+            if len(candidates) == 1:
+                break
+            if time_budget is not None and time.perf_counter() - start > time_budget:
+                logger.info(f"Search time budget spent after {len(rounds)} rounds")
+                break
+        
+        best = rounds[-1]['results'][0]
+        
+        self.decision_analyzer.config['model_params'].update(best['params'])
+        self.decision_analyzer.model = self._base_model().set_params(**best['params'])
+        
+        return {
+            'best_params': best['params'],
+            'best_score': best['mean_accuracy'],
+            'rounds': rounds,
+            'elapsed_seconds': time.perf_counter() - start
+        }
+    
+    def _base_model(self) -> Any:
+        """Unfitted copy of the analyzer's model with its current parameters."""
+        if isinstance(self.decision_analyzer.model, CompiledForest):
+            return RandomForestClassifier(**self.decision_analyzer.config['model_params'])
+        return clone(self.decision_analyzer.model)
+    
+    def _encode(self, features: pd.DataFrame, decisions: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """Encode features with preprocessing fitted on them, leaving the analyzer intact."""
+        encoder = DecisionAnalyzer(self.decision_analyzer.config)
+        encoder.fit_preprocessing(features)
+        
+        return encoder.transform_features(features), np.asarray(decisions)
+    
+    def _evaluate(self, candidates: List[Dict[str, Any]], X: np.ndarray, y: np.ndarray,
+                  rows: np.ndarray, protected_attributes: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Cross-validate every candidate on ``rows`` of ``X``, ``y``."""
+        folds = [
+            (rows[train_idx], rows[val_idx])
+            for train_idx, val_idx in StratifiedKFold(
+                n_splits=self.n_folds, shuffle=True,
+                random_state=self.decision_analyzer.config['model_params'].get('random_state')
+            ).split(rows, y[rows])
+        ]
+        tasks = [(params, train_idx, val_idx) for params in candidates for train_idx, val_idx in folds]
+        
+        predictions = map_in_workers(
+            _fit_fold, tasks, {'model': self._base_model(), 'X': X, 'y': y}, self.n_jobs
+        )
+        
+        results = []
+        for i, params in enumerate(candidates):
+            fold_results = []
+            for fold, (_, val_idx) in enumerate(folds):
+                fold_predictions = predictions[i * len(folds) + fold]
+                fold_result = {
+                    'fold': fold,
+                    'accuracy': float(np.mean(fold_predictions == y[val_idx]))
+                }
+                
+                if protected_attributes is not None:
+                    bias_metrics = self.bias_detector.detect_bias(
+                        protected_attributes.iloc[val_idx].assign(selected=fold_predictions)
+                    )
+                    fold_result['disparate_impact'] = {
+                        attribute: metrics['disparate_impact']
+                        for attribute, metrics in bias_metrics.items()
+                    }
+                
+                fold_results.append(fold_result)
+            
+            accuracies = [fold_result['accuracy'] for fold_result in fold_results]
+            results.append({
+                'params': params,
+                'folds': fold_results,
+                'mean_accuracy': float(np.mean(accuracies)),
+                'std_accuracy': float(np.std(accuracies))
+            })
+        
+        return results
@@ -0,0 +1,91 @@
+import os
+import pandas as pd
+from typing import Dict, Any, Tuple
+from .bias_detector import BiasDetector, merge_group_counts
+from .utils import validate_data, map_in_workers, worker_state
+
+def _count_partition(task: Tuple[str, int, int]) -> Dict[Any, pd.DataFrame]:
+    """Map step: group counts of one attribute over one range of rows."""
+    attribute, start, stop = task
+    bias_detector = worker_state['bias_detector']
+    data = worker_state['data'].iloc[start:stop]
+    partition_by = worker_state['partition_by']
+    
+    if partition_by is None:
+        return {None: bias_detector.compute_group_counts(data, attribute)}
+        
+    return {
+        unit: bias_detector.compute_group_counts(part, attribute)
+        for unit, part in data.groupby(partition_by, sort=False)
+    }
+
+class ParallelBiasScanner:
+    """Bias reports computed over a process pool.
+    
+    Rows are split into ranges and every (attribute, range) pair is counted
+    by a worker (map); the partial count tables are then merged per
+    attribute (reduce). Workers receive the data once, when the pool starts:
+    with the fork start method they share the parent's memory, otherwise it
+    is sent once per worker rather than once per task. Reports are
+    identical to the serial ``BiasDetector.generate_bias_report``.
+    """
+    
+    def __init__(self, bias_detector: BiasDetector = None, n_jobs: int = None,
+                 rows_per_task: int = 250000):
+        self.bias_detector = bias_detector or BiasDetector()
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.rows_per_task = rows_per_task
+        
+    def generate_bias_report(self, data: pd.DataFrame) -> Dict[str, Any]:
+        """Generate the bias report of ``data`` in parallel."""
+        counts = self._map_reduce(data, partition_by=None)
+        return self.bias_detector.build_report(counts.get(None, {}), len(data))
+    
+    def generate_partitioned_reports(self, data: pd.DataFrame,
+                                     partition_by: str) -> Dict[Any, Dict[str, Any]]:
+        """Generate one bias report per value of ``partition_by`` in parallel."""
+        validate_data(data, required_columns=[partition_by])
+        counts = self._map_reduce(data, partition_by=partition_by)
+        sizes = data[partition_by].value_counts()
+        
+        return {
+            unit: self.bias_detector.build_report(counts.get(unit, {}), int(size))
+            for unit, size in sizes.items()
+        }
+    
+    def _map_reduce(self, data: pd.DataFrame, partition_by: str) -> Dict[Any, Dict[str, pd.DataFrame]]:
+        """Per-partition count tables of every protected attribute."""
+        validate_data(data, required_columns=['selected'])
+        
+        # Quantile bin edges must be fitted before the workers copy the detector
+        self.bias_detector.fit_bins(data)
+        
+        attributes = [
+            attr for attr in self.bias_detector.config['protected_attributes']
+            if attr in data.columns
+        ]
+        ranges = [
+            (start, min(start + self.rows_per_task, len(data)))
+            for start in range(0, len(data), self.rows_per_task)
+        ]
+        tasks = [(attr, start, stop) for attr in attributes for start, stop in ranges]
+        
+        partials = map_in_workers(_count_partition, tasks, {
+            'bias_detector': self.bias_detector,
+            'data': data,
+            'partition_by': partition_by
+        }, self.n_jobs)
+        
+        # Reduce in row order, so merged groups keep their first-seen order
+        collected = {}
+        for (attribute, _, _), partial in zip(tasks, partials):
+            for unit, unit_counts in partial.items():
+                collected.setdefault(unit, {}).setdefault(attribute, []).append(unit_counts)
+                
+        return {
+            unit: {
+                attribute: merge_group_counts(*tables)
+                for attribute, tables in unit_tables.items()
+            }
+            for unit, unit_tables in collected.items()
+        }
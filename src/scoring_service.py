@@ -0,0 +1,198 @@
+import json
+import asyncio
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Tuple
+from .utils import logger, validate_data, json_default
+
+class ScoringService:
+    """Asyncio front end that coalesces candidate evaluations into batches.
+    
+    Concurrent ``evaluate`` calls are queued and scored together with
+    ``ABDMF.evaluate_candidates`` once ``max_batch_size`` requests are
+    waiting or the oldest has waited ``max_wait_ms``. Batches run one at a
+    time in a worker thread, so the event loop stays responsive and the
+    system is never scored from two threads at once. ``stop`` refuses new
+    requests and waits for the accepted ones to be scored.
+    """
+    
+    def __init__(self, system, max_batch_size: int = 64, max_wait_ms: float = 5.0):
+        self.system = system
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.stats = {'requests': 0, 'batches': 0}
+        self._queue = None
+        self._worker = None
+        self._executor = None
+        
+    async def __aenter__(self) -> 'ScoringService':
+        await self.start()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+        
+    async def start(self):
+        """Start batching queued requests."""
+        self._queue = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._batch = []
+        self._stopping = False
+        self._worker = asyncio.ensure_future(self._run())
+        
+    async def stop(self):
+        """Stop accepting requests, then finish scoring those already made.
+        
+        If ``stop`` is cancelled while waiting, requests not yet scored are
+        cancelled instead.
+        """
+        if self._worker is None:
+            return
+        
+        self._stopping = True
+        # Queued after every accepted request, so the worker drains them first
+        await self._queue.put(None)
+        try:
+            await self._worker
+        finally:
+            self._worker = None
+            self._executor.shutdown(wait=True)
+        
+    async def evaluate(self, candidate_data: pd.DataFrame) -> Dict[str, Any]:
+        """Evaluate one candidate (the first row of ``candidate_data``)."""
+        if self._worker is None or self._stopping:
+            raise RuntimeError("Scoring service is not running")
+        
+        validate_data(candidate_data)
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((candidate_data.iloc[:1], future))
+        return await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+        
+        try:
+            while not stopping:
+                request = await self._queue.get()
+                if request is None:
+                    break
+                
+                self._batch = [request]
+                deadline = loop.time() + self.max_wait_ms / 1000
+            
+                while len(self._batch) < self.max_batch_size:
+                    if not self._queue.empty():
+                        request = self._queue.get_nowait()
+                    else:
+                        timeout = deadline - loop.time()
+                        if timeout <= 0:
+                            break
+                        try:
+                            request = await asyncio.wait_for(self._queue.get(), timeout)
+                        except asyncio.TimeoutError:
+                            break
+                    
+                    if request is None:
+                        stopping = True
+                        break
+                    self._batch.append(request)
+                
+                await self._score(self._batch)
+                self._batch = []
+        except asyncio.CancelledError:
+            # Requests already taken off the queue would otherwise never resolve
+            for _, future in self._batch:
+                future.cancel()
+            while not self._queue.empty():
+                request = self._queue.get_nowait()
+                if request is not None:
+                    request[1].cancel()
+            raise
+            
+    async def _score(self, batch: List[Tuple[pd.DataFrame, asyncio.Future]]):
+        """Score a batch; requests with different columns are scored apart."""
+        groups = {}
+        for request in batch:
+            groups.setdefault(tuple(request[0].columns), []).append(request)
+            
+        for requests in groups.values():
+            await self._score_group(requests)
+            
+    async def _score_group(self, requests: List[Tuple[pd.DataFrame, asyncio.Future]]):
+        loop = asyncio.get_running_loop()
+        candidates = pd.concat([candidate for candidate, _ in requests], ignore_index=True)
+        
+        try:
+            results = await loop.run_in_executor(
+                self._executor, self.system.evaluate_candidates, candidates
+            )
+        except Exception as e:
+            if len(requests) == 1:
+                if not requests[0][1].done():
+                    requests[0][1].set_exception(e)
+                return
+                
+            # Isolate the failing request(s) by scoring one at a time
+            for request in requests:
+                await self._score_group([request])
+            return
+            
+        self.stats['requests'] += len(requests)
+        self.stats['batches'] += 1
+        for (_, future), result in zip(requests, results):
+            if not future.done():
+                future.set_result(result)
+
+async def serve_http(service: ScoringService, host: str = '127.0.0.1',
+                     port: int = 8080) -> asyncio.AbstractServer:
+    """Minimal local HTTP endpoint in front of a running ScoringService.
+    
+    ``POST /evaluate`` takes a JSON object of candidate fields and returns
+    the evaluation as JSON. Connections are kept alive between requests.
+    Intended as a stand-in for the real web tier in tests and load tests.
+    """
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                    
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                    
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                method, path = request_line.decode('latin-1').split()[:2]
+                
+                if method != 'POST' or path != '/evaluate':
+                    status, payload = '404 Not Found', {'error': 'not found'}
+                else:
+                    try:
+                        candidate = pd.DataFrame([json.loads(body)])
+                        status, payload = '200 OK', await service.evaluate(candidate)
+                    except Exception as e:
+                        logger.warning(f"Candidate evaluation failed: {e}")
+                        status, payload = '400 Bad Request', {'error': str(e)}
+                        
+                response = json.dumps(payload, default=json_default).encode()
+                writer.write(
+                    f"HTTP/1.1 {status}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(response)}\r\n\r\n".encode() + response
+                )
+                await writer.drain()
+                
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            
+    return await asyncio.start_server(handle, host, port)
@@ -0,0 +1,172 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Any
+
+class ThresholdMitigator:
+    """Post-processing mitigation by per-group decision thresholds.
+    
+    ``fit`` chooses, for every group of one protected attribute, the score
+    threshold above which candidates are selected, so that the lowest group
+    selection rate is at least ``target_disparate_impact`` times the highest
+    while as many validation decisions as possible are predicted correctly.
+    Groups smaller than ``min_group_size`` are not constrained; groups not
+    seen during fitting use ``default_threshold``.
+    """
+    
+    def __init__(self, target_disparate_impact: float = 0.8, min_group_size: int = 1,
+                 default_threshold: float = 0.5):
+        self.target_disparate_impact = target_disparate_impact
+        self.min_group_size = min_group_size
+        self.default_threshold = default_threshold
+        self.thresholds = None
+        self.fit_summary = {}
+    
+    def fit(self, scores: np.ndarray, labels: np.ndarray, groups: Any) -> 'ThresholdMitigator':
+        """Fit thresholds on validation scores, true outcomes and group labels.
+        
+        Every group's rows are sorted by score once; its accuracy at each
+        number of selected rows then follows from cumulative counts of
+        positives. A sweep over the lowest allowed selection rate finds the
+        best feasible threshold of every group with range-maximum queries,
+        so fitting takes O(n log n) time overall.
+        """
+        scores = np.asarray(scores, dtype=float)
+        labels = np.asarray(labels).astype(bool)
+        codes, uniques = pd.factorize(pd.Series(groups), sort=True)
+        
+        if not (len(scores) == len(labels) == len(codes)):
+            raise ValueError("scores, labels and groups must have the same length")
+        
+        # Rows with a missing group are scored with the default threshold
+        known = codes >= 0
+        scores, labels, codes = scores[known], labels[known], codes[known]
+        if len(scores) == 0:
+            raise ValueError("No rows with a known group to fit thresholds on")
+        
+        # One sort: by group, then by descending score
+        order = np.lexsort((-scores, codes))
+        scores, labels, codes = scores[order], labels[order], codes[order]
+        starts = np.searchsorted(codes, np.arange(len(uniques) + 1))
+        
+        groups = []
+        for g in range(len(uniques)):
+            group_scores = scores[starts[g]:starts[g + 1]]
+            group_labels = labels[starts[g]:starts[g + 1]]
+            if len(group_scores):
+                groups.append((uniques[g], group_scores, self._correct_counts(group_scores, group_labels)))
+        
+        eligible = [group for group in groups if len(group[1]) >= self.min_group_size]
+        selected = {
+            group: int(np.argmax(correct))
+            for group, _, correct in groups
+        }
+        selected.update(self._constrained_selection(eligible))
+        
+        self.thresholds = {}
+        rates = {}
+        n_correct = 0
+        for group, group_scores, correct in groups:
+            k = selected[group]
+            self.thresholds[group] = self._threshold(group_scores, k)
+            rates[group] = k / len(group_scores)
+            n_correct += correct[k]
+        
+        eligible_rates = [rates[group] for group, _, _ in eligible]
+        self.fit_summary = {
+            'selection_rates': rates,
+            'disparate_impact': (
+                float(min(eligible_rates) / max(eligible_rates))
+                if eligible_rates and max(eligible_rates) > 0 else 0.0
+            ),
+            'accuracy': float(n_correct / len(scores))
+        }
+        
+        return self
+    
+    def predict(self, scores: np.ndarray, groups: Any) -> np.ndarray:
+        """Selection decisions for scores of candidates in ``groups``."""
+        if self.thresholds is None:
+            raise RuntimeError("Mitigator needs to be fitted before predicting")
+        
+        thresholds = pd.Series(groups).map(self.thresholds).fillna(self.default_threshold)
+        return np.asarray(scores, dtype=float) >= thresholds.to_numpy(dtype=float)
+    
+    @staticmethod
+    def _correct_counts(scores: np.ndarray, labels: np.ndarray) -> np.ndarray:
+        """Correct decisions when selecting the top k rows, for k = 0..n.
+        
+        Only k that a threshold can realize, i.e. that do not split tied
+        scores, are feasible; the others are -inf.
+        """
+        true_positives = np.concatenate([[0], np.cumsum(labels)])
+        selected = np.arange(len(scores) + 1)
+        correct = (true_positives + (len(labels) - labels.sum()) - (selected - true_positives)).astype(float)
+        
+        feasible = np.ones(len(scores) + 1, dtype=bool)
+        feasible[1:-1] = scores[:-1] != scores[1:]
+        correct[~feasible] = -np.inf
+        
+        return correct
+    
+    def _constrained_selection(self, eligible) -> Dict[Any, int]:
+        """Rows to select per eligible group, maximizing correct decisions.
+        
+        For every candidate lowest selection rate ``low`` (one of the rates
+        a group can reach), each group independently takes its best count
+        among rates in ``[low, low / target]``; the ``low`` with the most
+        correct decisions overall wins.
+        """
+        if not eligible:
+            return {}
+        
+        sizes = np.array([len(group_scores) for _, group_scores, _ in eligible])
+        lows = np.unique(np.concatenate([np.arange(n + 1) / n for n in sizes]))
+        target = self.target_disparate_impact
+        
+        bounds = []
+        totals = np.zeros(len(lows))
+        for n, (_, _, correct) in zip(sizes, eligible):
+            lo = np.ceil(lows * n - 1e-9).astype(int)
+            hi = np.full(len(lows), n) if target <= 0 else np.minimum(
+                np.floor(lows / target * n + 1e-9).astype(int), n
+            )
+            totals += self._range_max(correct, lo, hi)
+            bounds.append((lo, hi))
+        
+        best = int(np.argmax(totals))
+        
+        return {
+            group: int(lo[best] + np.argmax(correct[lo[best]:hi[best] + 1]))
+            for (group, _, correct), (lo, hi) in zip(eligible, bounds)
+        }
+    
+    @staticmethod
+    def _range_max(values: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        """Maximum of ``values[lo:hi + 1]`` for every pair, -inf for empty ranges.
+        
+        Answered from a sparse table of maxima over power-of-two spans.
+        """
+        table = [values]
+        while 2 ** len(table) <= len(values):
+            span = 2 ** (len(table) - 1)
+            table.append(np.maximum(table[-1][:-span], table[-1][span:]))
+        
+        result = np.full(len(lo), -np.inf)
+        nonempty = hi >= lo
+        level = np.zeros(len(lo), dtype=int)
+        level[nonempty] = np.floor(np.log2(hi[nonempty] - lo[nonempty] + 1)).astype(int)
+        
+        for j, row in enumerate(table):
+            rows = nonempty & (level == j)
+            result[rows] = np.maximum(row[lo[rows]], row[hi[rows] - 2 ** j + 1])
+        
+        return result
+    
+    @staticmethod
+    def _threshold(scores: np.ndarray, k: int) -> float:
+        """Score threshold selecting the ``k`` highest of ``scores`` (sorted descending)."""
+        if k == 0:
+            return float('inf')
+        if k == len(scores):
+            return float('-inf')
+        return float((scores[k - 1] + scores[k]) / 2)
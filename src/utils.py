@@ -1,11 +1,20 @@
+import os
+import json
+import hashlib
 import yaml
+import numpy as np
 import pandas as pd
-from typing import Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Callable, Iterable, Iterator, Union
+from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Per-process state of pool workers, set once by _init_worker
+worker_state = {}
+
 def load_config(config_path: str) -> Dict[str, Any]:
     """Load configuration from YAML file."""
     try:
@@ -28,6 +37,90 @@ def validate_data(data: pd.DataFrame, required_columns: List[str] = None) -> boo
             
     return True
 
+def iter_data_chunks(source: Union[str, os.PathLike, pd.DataFrame, Iterable[pd.DataFrame]],
+                     chunksize: int = 100000) -> Iterator[pd.DataFrame]:
+    """Yield a dataset as DataFrame chunks of at most ``chunksize`` rows.
+    
+    ``source`` may be a path to a CSV or Parquet file, a DataFrame, or an
+    iterable of DataFrames (which is passed through unchanged). Reading
+    Parquet files requires pyarrow.
+    """
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunksize):
+            yield source.iloc[start:start + chunksize]
+    elif isinstance(source, (str, os.PathLike)):
+        if str(source).lower().endswith(('.parquet', '.pq')):
+            try:
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise ImportError("Reading Parquet files requires pyarrow") from e
+                
+            for batch in pq.ParquetFile(source).iter_batches(batch_size=chunksize):
+                yield batch.to_pandas()
+        else:
+            with pd.read_csv(source, chunksize=chunksize) as reader:
+                yield from reader
+    else:
+        for chunk in source:
+            validate_data(chunk)
+            yield chunk
+
+class ReservoirSample:
+    """Uniform random sample of bounded size over a stream of DataFrame chunks."""
+    
+    def __init__(self, size: int, random_state: int = None):
+        self.size = size
+        self.rows_seen = 0
+        self.sample = None
+        self._rng = np.random.default_rng(random_state)
+        
+    def update(self, chunk: pd.DataFrame):
+        """Offer every row of ``chunk`` to the sample (reservoir algorithm R)."""
+        chunk = chunk.reset_index(drop=True)
+        n_fill = min(max(self.size - self.rows_seen, 0), len(chunk))
+        
+        if self.sample is None:
+            self.sample = chunk.iloc[:n_fill]
+        elif n_fill:
+            self.sample = pd.concat([self.sample, chunk.iloc[:n_fill]], ignore_index=True)
+            
+        # Row i of the stream replaces a random slot with probability size / (i + 1).
+        # When several rows of the chunk pick the same slot only the last one
+        # survives, exactly as if they had been inserted one at a time.
+        positions = np.arange(self.rows_seen + n_fill, self.rows_seen + len(chunk))
+        slots = self._rng.integers(0, positions + 1) if len(positions) else positions
+        accepted = slots < self.size
+        
+        if accepted.any():
+            rows = np.flatnonzero(accepted) + n_fill
+            slots = slots[accepted]
+            last = len(slots) - 1 - np.unique(slots[::-1], return_index=True)[1]
+            self.sample = pd.concat([
+                self.sample.drop(index=slots[last]),
+                chunk.iloc[rows[last]]
+            ], ignore_index=True)
+            
+        self.rows_seen += len(chunk)
+
+def fingerprint_data(data: Union[str, os.PathLike, pd.DataFrame], *extra: Any) -> str:
+    """Fast content fingerprint of a dataset plus any JSON-serializable extras.
+    
+    DataFrames are fingerprinted by hashing every column with pandas'
+    vectorized row hashing; files by their path, size and modification time.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    
+    if isinstance(data, pd.DataFrame):
+        digest.update(repr(list(zip(data.columns, map(str, data.dtypes)))).encode())
+        for column in data.columns:
+            digest.update(pd.util.hash_pandas_object(data[column], index=False).to_numpy().tobytes())
+    else:
+        stat = os.stat(data)
+        digest.update(f"{os.path.abspath(data)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        
+    digest.update(json.dumps(extra, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
 def calculate_metrics(predictions: np.ndarray, actual: np.ndarray) -> Dict[str, float]:
     """Calculate various performance metrics."""
     return {
@@ -37,6 +130,40 @@ def calculate_metrics(predictions: np.ndarray, actual: np.ndarray) -> Dict[str,
         'f1': f1_score(actual, predictions)
     }
 
+def map_in_workers(func: Callable[[Any], Any], tasks: List[Any],
+                   state: Dict[str, Any], n_jobs: int) -> List[Any]:
+    """``[func(task) for task in tasks]`` over a pool of at most ``n_jobs`` processes.
+    
+    Workers receive ``state`` once, when the pool starts, and ``func``
+    reads it from ``worker_state``; with one job or task everything runs
+    in this process. Pools use the platform's default start method: fork
+    where that is the default, so workers share the parent's memory, and
+    spawn on macOS, where forking is unsafe with threaded BLAS.
+    """
+    if n_jobs == 1 or len(tasks) <= 1:
+        _init_worker(state)
+        try:
+            return [func(task) for task in tasks]
+        finally:
+            worker_state.clear()
+            
+    with ProcessPoolExecutor(
+        max_workers=min(n_jobs, len(tasks)),
+        initializer=_init_worker,
+        initargs=(state,)
+    ) as executor:
+        return list(executor.map(func, tasks))
+
+def _init_worker(state: Dict[str, Any]):
+    worker_state.clear()
+    worker_state.update(state)
+
+def json_default(value: Any) -> Any:
+    """``json.dump`` fallback: NumPy scalars as Python values, anything else as a string."""
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
 def format_timestamp(timestamp: pd.Timestamp) -> str:
     """Format timestamp for consistent output."""
     return timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')
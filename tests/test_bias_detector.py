@@ -76,3 +76,181 @@ def test_empty_data(bias_detector):
     empty_data = pd.DataFrame()
     with pytest.raises(ValueError):
         bias_detector.detect_bias(empty_data)
+
+def test_group_counts(bias_detector, sample_data):
+    """Test single-pass group counts match per-group masks."""
+    counts = bias_detector.compute_group_counts(sample_data, 'race')
+    for group in sample_data['race'].unique():
+        group_data = sample_data[sample_data['race'] == group]
+        assert counts.loc[group, 'total'] == len(group_data)
+        assert counts.loc[group, 'selected'] == (group_data['selected'] == 1).sum()
+
+def test_missing_attribute_values(bias_detector, sample_data):
+    """Test records with missing attribute values are not analyzed as a group."""
+    data = sample_data.copy()
+    data.loc[:9, 'gender'] = None
+    results = bias_detector.detect_bias(data)
+    assert results['gender']['sample_size'] == len(data) - 10
+    assert results['gender']['groups_analyzed'] == 3
+
+def test_chunked_counts(bias_detector, sample_data):
+    """Test merging counts over chunks matches a full scan."""
+    counts = {}
+    for start in range(0, len(sample_data), 300):
+        counts = bias_detector.accumulate_group_counts(
+            sample_data.iloc[start:start + 300], counts
+        )
+    
+    assert bias_detector.detect_bias_from_counts(counts) == bias_detector.detect_bias(sample_data)
+
+def test_intersection_audit(bias_detector, sample_data):
+    """Test auditing all pairwise and three-way intersections."""
+    original = sample_data.copy()
+    results = bias_detector.audit_intersections(sample_data)
+    
+    pd.testing.assert_frame_equal(sample_data, original)
+    assert set(results) == {
+        'gender & race', 'gender & age', 'race & age', 'gender & race & age'
+    }
+    assert results['gender & race'] == bias_detector.analyze_intersectional_bias(
+        sample_data, ['gender', 'race']
+    )
+    assert results['gender & race']['groups_analyzed'] == 6
+    assert results['gender & race']['sample_size'] == len(sample_data)
+
+def test_age_binning(bias_detector, sample_data):
+    """Test continuous attributes are analyzed in bins."""
+    results = bias_detector.detect_bias(sample_data)
+    assert results['age']['groups_analyzed'] == 2
+    assert results['age']['sample_size'] == len(sample_data)
+    
+    counts = bias_detector.compute_group_counts(sample_data, 'age')
+    assert counts.loc['40+', 'total'] == (sample_data['age'] >= 40).sum()
+    assert bias_detector.bin_value('age', 40) == '40+'
+    assert bias_detector.bin_value('age', 39.5) == '<40'
+
+def test_quantile_binning(sample_data):
+    """Test quantile edges are fitted once and reused."""
+    detector = BiasDetector({
+        'protected_attributes': ['age'],
+        'threshold': 0.2,
+        'minimum_sample_size': 100,
+        'binning': {'age': {'quantiles': 4}}
+    })
+    with pytest.raises(ValueError):
+        detector.bin_value('age', 30)
+    
+    detector.fit_bins(sample_data)
+    edges = detector.bin_edges['age']
+    assert len(edges) == 3
+    
+    results = detector.detect_bias(sample_data.iloc[:100])
+    assert detector.bin_edges['age'] is edges
+    assert results['age']['groups_analyzed'] <= 4
+    
+    # New binning settings discard the fitted edges
+    detector.config['binning'] = {'age': {'quantiles': 2}}
+    with pytest.raises(ValueError):
+        detector.bin_value('age', 30)
+    detector.fit_bins(sample_data)
+    assert len(detector.bin_edges['age']) == 1
+
+def test_significance(bias_detector, sample_data):
+    """Test confidence intervals and p-values for bias metrics."""
+    counts = bias_detector.compute_group_counts(sample_data, 'gender')
+    metrics = bias_detector.calculate_metrics_from_counts(counts)
+    result = bias_detector.calculate_significance(counts)
+    
+    low, high = result['disparate_impact_ci']
+    assert low <= metrics['disparate_impact'] <= high
+    low, high = result['statistical_parity_ci']
+    assert low <= metrics['statistical_parity'] <= high
+    assert 0 <= result['p_value'] <= 1
+    assert not result['significant']
+    
+    bias_detector.config['significance'] = {'method': 'bootstrap', 'random_state': 42}
+    bootstrap = bias_detector.calculate_significance(counts)
+    assert bootstrap['p_value'] == result['p_value']
+    assert bootstrap['disparate_impact_ci'][0] <= metrics['disparate_impact']
+
+def test_tied_rate_intervals(bias_detector):
+    """Test intervals compare two distinct groups when all selection rates tie."""
+    counts = pd.DataFrame(
+        {'total': [100, 400], 'selected': [50, 200]},
+        index=pd.Index(['F', 'M'], name='gender')
+    )
+    result = bias_detector.calculate_significance(counts)
+    
+    se = np.sqrt(0.25 / 100 + 0.25 / 400)
+    assert result['statistical_parity_ci'][1] == pytest.approx(1.959964 * se)
+    low, high = result['disparate_impact_ci']
+    assert low < 1 and high == 1.0
+    assert result['p_value'] == pytest.approx(1.0)
+
+def test_significant_bias(bias_detector, sample_data):
+    """Test recommendations distinguish significant from noisy bias."""
+    data = sample_data.copy()
+    data['selected'] = (data['gender'] == 'M').astype(int)
+    data.loc[data.index[:50], 'selected'] = 1
+    
+    report = bias_detector.generate_bias_report(data)
+    assert report['statistical_significance']['gender']['significant']
+    assert any('High bias detected in gender' in r for r in report['recommendations'])
+    assert report['summary']['statistically_significant_bias']
+    
+    bias_detector.config['minimum_sample_size'] = 5
+    small = pd.DataFrame({
+        'gender': ['M'] * 5 + ['F'] * 5,
+        'selected': [1, 1, 1, 1, 0, 1, 0, 0, 0, 0]
+    })
+    report = bias_detector.generate_bias_report(small)
+    assert report['detailed_metrics']['gender']['disparate_impact'] == 0.25
+    assert not report['statistical_significance']['gender']['significant']
+    assert report['summary']['significant_bias_detected']
+    assert not report['summary']['statistically_significant_bias']
+    assert report['recommendations'] == [
+        "Possible bias in gender is not statistically significant "
+        "at the current sample size. Keep monitoring before acting."
+    ]
+
+def test_bias_over_time(bias_detector, sample_data):
+    """Test windowed bias metrics match scans of each window."""
+    data = sample_data.copy()
+    data['decided_at'] = pd.Timestamp('2024-01-01') + pd.to_timedelta(
+        np.arange(len(data)) % 90, unit='D'
+    )
+    
+    monthly = bias_detector.detect_bias_over_time(data, 'decided_at', freq='M')
+    assert len(monthly['windows']) == 3
+    assert sum(w['total_records'] for w in monthly['windows']) == len(data)
+    
+    rolling = bias_detector.detect_bias_over_time(data, 'decided_at', freq='W', window=4)
+    for window in rolling['windows']:
+        in_window = data[data['decided_at'].between(window['start'], window['end'])]
+        assert window['metrics'] == bias_detector.detect_bias(in_window)
+    
+    bias_detector.config['threshold'] = 0.0
+    alerts = bias_detector.detect_bias_over_time(data, 'decided_at', freq='M')['alerts']
+    assert {a['attribute'] for a in alerts} == {'gender', 'race', 'age'}
+
+def test_proxy_detection(bias_detector, sample_data):
+    """Test detection of features acting as protected attribute proxies."""
+    from scipy.stats import chi2_contingency
+    
+    data = sample_data.copy()
+    proxy = data['race'].map({'A': 'north', 'B': 'south', 'C': 'east'})
+    noise = np.random.uniform(0, 1, len(data)) < 0.3
+    data['zip_region'] = proxy.where(~noise, 'other')
+    data['interview_score'] = np.random.uniform(0, 100, len(data))
+    
+    results = bias_detector.detect_proxies(data)
+    
+    flagged = [(p['feature'], p['attribute']) for p in results['flagged']]
+    assert ('zip_region', 'race') in flagged
+    assert all(feature != 'interview_score' for feature, _ in flagged)
+    assert len(results['recommendations']) == len(flagged)
+    
+    table = pd.crosstab(data['zip_region'], data['race'])
+    chi2 = chi2_contingency(table, correction=False)[0]
+    expected_v = np.sqrt(chi2 / len(data) / (min(table.shape) - 1))
+    assert results['associations']['race']['zip_region']['cramers_v'] == pytest.approx(expected_v)
@@ -0,0 +1,86 @@
+import pytest
+import pandas as pd
+import numpy as np
+from abdmf.bias_detector import BiasDetector
+from abdmf.bias_monitor import BiasMonitor
+
+@pytest.fixture
+def sample_data():
+    """Generate sample data for testing."""
+    np.random.seed(42)
+    n_samples = 1000
+    
+    return pd.DataFrame({
+        'gender': np.random.choice(['M', 'F'], n_samples),
+        'race': np.random.choice(['A', 'B', 'C'], n_samples),
+        'selected': np.random.choice([0, 1], n_samples)
+    })
+
+@pytest.fixture
+def bias_monitor():
+    """Create BiasMonitor instance for testing."""
+    return BiasMonitor(BiasDetector())
+
+def test_incremental_metrics_match_batch(bias_monitor, sample_data):
+    """Test live metrics match a full detect_bias scan."""
+    for row in sample_data.to_dict('records'):
+        bias_monitor.record_decision(row, row['selected'] == 1)
+    
+    expected = bias_monitor.bias_detector.detect_bias(sample_data)
+    assert bias_monitor.current_metrics() == expected
+    assert bias_monitor.total_decisions == len(sample_data)
+
+def test_monitor_report(bias_monitor):
+    """Test report and recommendations from recorded decisions."""
+    bias_monitor.bias_detector.config['minimum_sample_size'] = 1
+    bias_monitor.record_decision({'gender': 'M'}, True)
+    bias_monitor.record_decision({'gender': 'F'}, False)
+    
+    report = bias_monitor.generate_bias_report()
+    assert report['summary']['total_records'] == 2
+    assert report['summary']['significant_bias_detected']
+    assert report['recommendations'] == bias_monitor.get_recommendations()
+    
+    bias_monitor.reset()
+    assert bias_monitor.current_metrics() == {}
+
+def test_missing_values(bias_monitor):
+    """Test missing attribute values are counted but not analyzed."""
+    bias_monitor.record_decision({'gender': None}, True)
+    bias_monitor.record_decision({'gender': np.nan}, False)
+    metrics = bias_monitor.current_metrics()['gender']
+    assert metrics['sample_size'] == 0
+    assert metrics['groups_analyzed'] == 1
+
+def test_batch_recording(bias_monitor, sample_data):
+    """Test recording a batch matches recording one decision at a time."""
+    single = BiasMonitor(BiasDetector())
+    for row in sample_data.to_dict('records'):
+        single.record_decision(row, row['selected'] == 1)
+    
+    bias_monitor.record_decisions(
+        sample_data[['gender', 'race']], sample_data['selected'] == 1
+    )
+    assert bias_monitor.current_metrics() == single.current_metrics()
+    assert bias_monitor.total_decisions == single.total_decisions
+
+def test_unfitted_quantile_bins():
+    """Test attributes with unfitted quantile bins are skipped, not fitted on decisions."""
+    detector = BiasDetector({
+        'protected_attributes': ['gender', 'age'],
+        'threshold': 0.2,
+        'minimum_sample_size': 1,
+        'binning': {'age': {'quantiles': 2}}
+    })
+    monitor = BiasMonitor(detector)
+    decisions = pd.DataFrame({'gender': ['M', 'F', 'F'], 'age': [55, 61, 64]})
+    
+    monitor.record_decision({'gender': 'M', 'age': 30}, True)
+    monitor.record_decisions(decisions, [True, False, True])
+    assert list(monitor.group_counts) == ['gender']
+    assert detector.bin_edges == {}
+    
+    detector.fit_bins(pd.DataFrame({'age': [20, 30, 40, 50]}))
+    monitor.record_decision({'gender': 'M', 'age': 30}, True)
+    monitor.record_decisions(decisions, [True, False, True])
+    assert monitor.group_counts['age'] == {'<35': [1, 1], '35+': [3, 2]}
@@ -0,0 +1,91 @@
+import pytest
+import pandas as pd
+import numpy as np
+from abdmf import ABDMF
+from abdmf.cache import ResultCache
+from abdmf.utils import fingerprint_data
+
+@pytest.fixture
+def sample_data():
+    """Generate sample data for testing."""
+    np.random.seed(42)
+    n_samples = 500
+    
+    return pd.DataFrame({
+        'gender': np.random.choice(['M', 'F'], n_samples),
+        'age': np.random.randint(22, 65, n_samples),
+        'experience': np.random.randint(0, 30, n_samples),
+        'education_score': np.random.uniform(0, 100, n_samples),
+        'selected': np.random.choice([0, 1], n_samples)
+    })
+
+def test_fingerprint(sample_data):
+    """Test fingerprints change with content and configuration only."""
+    key = fingerprint_data(sample_data, {'threshold': 0.2})
+    assert key == fingerprint_data(sample_data.copy(), {'threshold': 0.2})
+    assert key != fingerprint_data(sample_data, {'threshold': 0.1})
+    
+    changed = sample_data.copy()
+    changed.loc[0, 'experience'] += 1
+    assert key != fingerprint_data(changed, {'threshold': 0.2})
+
+def test_lru_eviction():
+    """Test least recently used entries are evicted first."""
+    cache = ResultCache(max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.stats == {'hits': 2, 'disk_hits': 0, 'misses': 1}
+
+def test_disk_tier(tmp_path):
+    """Test entries survive in the on-disk tier."""
+    ResultCache(directory=str(tmp_path)).put('a', {'value': 1})
+    
+    cache = ResultCache(directory=str(tmp_path))
+    assert cache.get('a') == {'value': 1}
+    assert cache.stats['disk_hits'] == 1
+    
+    small = ResultCache(directory=str(tmp_path), max_disk_bytes=0)
+    small.put('b', 2)
+    assert list(tmp_path.iterdir()) == []
+
+def test_cached_scan(sample_data):
+    """Test rescanning unchanged data reuses the result and model."""
+    system = ABDMF()
+    first = system.scan_historical_data(sample_data)
+    model = system.decision_analyzer.model
+    
+    second = system.scan_historical_data(sample_data)
+    assert second['bias_scan']['detailed_metrics'] == first['bias_scan']['detailed_metrics']
+    assert system.scan_cache.stats['hits'] == 1
+    
+    changed = sample_data.copy()
+    changed.loc[0, 'selected'] = 1 - changed.loc[0, 'selected']
+    system.scan_historical_data(changed)
+    assert system.decision_analyzer.model is not model
+    
+    system.scan_historical_data(sample_data[:300])
+    assert len(system.decision_analyzer.holdout[1]) == 60
+    
+    system.scan_historical_data(sample_data)
+    assert system.decision_analyzer.model is model
+    assert len(system.decision_analyzer.holdout[1]) == 100
+    assert system.decision_analyzer.updates == 0
+
+def test_cache_ttl():
+    """Test expiry of in-memory entries."""
+    cache = ResultCache(max_entries=2, ttl_seconds=60)
+    cache.put('a', 1)
+    assert cache.get('a') == 1
+    
+    cache.expires['a'] -= 61
+    assert cache.get('a') is None
+    assert cache.stats['misses'] == 1
+    assert 'a' not in cache.entries
+    
+    with pytest.raises(ValueError):
+        ResultCache(directory='cache', ttl_seconds=60)
@@ -102,3 +102,170 @@ def test_confidence_threshold(analyzer, sample_data):
     analyzer.config['confidence_threshold'] = 0.1
     result = analyzer.analyze_decision(features.iloc[[0]])
     assert result['high_confidence']
+
+def test_batch_decision_analysis(analyzer, sample_data):
+    """Test batch analysis matches single-candidate analysis per row."""
+    features, decisions = sample_data
+    analyzer.train(features, decisions)
+    
+    batch = features.iloc[:20]
+    results = analyzer.analyze_decisions(batch)
+    assert len(results) == len(batch)
+    for i, result in enumerate(results):
+        assert result == analyzer.analyze_decision(batch.iloc[[i]])
+    
+    assert analyzer.analyze_decisions(features.iloc[:0]) == []
+
+def test_fitted_preprocessing(analyzer, sample_data):
+    """Test single rows are encoded with the categories and means seen in training."""
+    features, decisions = sample_data
+    features = features.assign(
+        education_level=np.random.choice(['Bachelor', 'Master', 'PhD'], len(features))
+    )
+    analyzer.train(features, decisions)
+    
+    candidate = pd.DataFrame({
+        'experience': [np.nan],
+        'education_score': [80],
+        'interview_score': [75],
+        'education_level': ['PhD']
+    })
+    encoded = analyzer.preprocess_features(candidate)
+    assert encoded.loc[0, 'education_level'] == 2
+    assert encoded.loc[0, 'experience'] == pytest.approx(features['experience'].mean())
+    
+    unseen = candidate.assign(education_level=['Diploma'])
+    assert analyzer.preprocess_features(unseen).loc[0, 'education_level'] == -1
+    
+    batch = features.iloc[:10]
+    for i, result in enumerate(analyzer.analyze_decisions(batch)):
+        assert result == analyzer.analyze_decision(batch.iloc[[i]])
+
+def test_compiled_inference(analyzer, sample_data):
+    """Test compiled forest probabilities match sklearn."""
+    features, decisions = sample_data
+    analyzer.train(features, decisions)
+    expected = analyzer.analyze_decisions(features.iloc[:50])
+    
+    compiled = analyzer.compile_model()
+    encoded = analyzer.transform_features(features.iloc[:50])
+    np.testing.assert_allclose(
+        compiled.predict_proba(encoded), analyzer.model.predict_proba(encoded)
+    )
+    np.testing.assert_allclose(
+        compiled.predict_proba_one(encoded[0]), analyzer.model.predict_proba(encoded[:1])[0]
+    )
+    
+    assert analyzer.analyze_decisions(features.iloc[:50]) == expected
+    assert analyzer.analyze_decision(features.iloc[[0]]) == expected[0]
+    
+    # Retraining recompiles the new model on first use
+    analyzer.train(features, decisions)
+    assert analyzer.analyze_decision(features.iloc[[0]]) == expected[0]
+    assert analyzer.compiled_model is not compiled
+
+def test_local_explanations(analyzer, sample_data):
+    """Test per-candidate feature contributions."""
+    features, decisions = sample_data
+    analyzer.train(features, decisions)
+    
+    batch = features.iloc[:20]
+    encoded = analyzer.transform_features(batch)
+    probabilities = analyzer.model.predict_proba(encoded)
+    bias, contributions = analyzer.compile_model().contributions(encoded)
+    np.testing.assert_allclose(bias + contributions.sum(axis=1), probabilities)
+    np.testing.assert_array_equal(analyzer.compile_model().explain(encoded)[0], probabilities)
+    
+    results = analyzer.analyze_decisions(batch)
+    for i, result in enumerate(results):
+        local = result['feature_contributions']
+        assert set(local) == set(features.columns)
+        predicted = probabilities[i].argmax()
+        assert sum(local.values()) == pytest.approx(
+            result['confidence'] - bias[i, predicted]
+        )
+        assert all(
+            abs(v) >= analyzer.config['feature_importance_threshold']
+            for v in result['significant_features'].values()
+        )
+    
+    assert results[0]['feature_contributions'] != results[1]['feature_contributions']
+    
+    analyzer.config['local_explanations'] = False
+    result = analyzer.analyze_decision(batch.iloc[[0]])
+    assert 'feature_contributions' not in result
+    # Explained decisions are scored by the same forest pass, with the same outcome
+    for plain, explained in zip(analyzer.analyze_decisions(batch), results):
+        assert plain['prediction'] == explained['prediction']
+        assert plain['confidence'] == explained['confidence']
+    assert result['significant_features'].keys() <= result['all_features'].keys()
+
+def test_memory_mapped_artifact(analyzer, sample_data, tmp_path):
+    """Test saving and loading a memory-mapped model artifact."""
+    features, decisions = sample_data
+    features = features.assign(degree=np.random.choice(['BS', 'MS', None], len(features)))
+    analyzer.train(features, decisions)
+    
+    analyzer.save_artifact(str(tmp_path))
+    loaded = DecisionAnalyzer.load_artifact(str(tmp_path))
+    
+    assert isinstance(loaded.model.value, np.memmap)
+    assert loaded.feature_names == analyzer.feature_names
+    
+    batch = features.iloc[:50]
+    expected = analyzer.analyze_decisions(batch)
+    results = loaded.analyze_decisions(batch)
+    for result, reference in zip(results, expected):
+        assert result['prediction'] == reference['prediction']
+        assert result['confidence'] == pytest.approx(reference['confidence'])
+        assert result['all_features'] == pytest.approx(reference['all_features'])
+        
+    # Retraining a loaded analyzer fits a new sklearn forest
+    loaded.train(features, decisions)
+    assert loaded.analyze_decision(batch.iloc[[0]])['prediction'] == expected[0]['prediction']
+
+def test_incremental_update(analyzer, sample_data):
+    """Test refreshing a trained model with new decisions."""
+    features, decisions = sample_data
+    analyzer.config['incremental']['holdout_size'] = 220
+    analyzer.train(features.iloc[:800], decisions.iloc[:800])
+    old_model = analyzer.model
+    
+    metrics = analyzer.update(features.iloc[800:], decisions.iloc[800:])
+    
+    # The oldest 10% of the trees are replaced, the rest are kept as they are
+    assert len(analyzer.model.estimators_) == len(old_model.estimators_)
+    assert analyzer.model.estimators_[:90] == old_model.estimators_[10:]
+    assert len(old_model.estimators_) == 100
+    
+    assert len(analyzer.holdout[1]) == 200
+    assert 'accuracy' in metrics['validation']
+    assert len(metrics['feature_importance']) == len(features.columns)
+    assert len(analyzer.analyze_decisions(features.iloc[:5])) == 5
+    
+    analyzer.update(features.iloc[800:], decisions.iloc[800:])
+    assert len(analyzer.holdout[1]) == 220
+    
+    with pytest.raises(ValueError):
+        analyzer.update(features.iloc[:10], pd.Series([1] * 10))
+
+def test_prediction_cache(analyzer, sample_data):
+    """Test memoized decisions and invalidation on retraining."""
+    features, decisions = sample_data
+    analyzer.train(features, decisions)
+    candidate = features.iloc[[0]]
+    
+    first = analyzer.analyze_decision(candidate)
+    second = analyzer.analyze_decision(candidate.copy())
+    assert second == first
+    assert second is not first
+    assert analyzer.prediction_cache.stats['hits'] == 1
+    assert analyzer.prediction_cache.stats['misses'] == 1
+    
+    analyzer.analyze_decision(features.iloc[[1]])
+    assert analyzer.prediction_cache.stats['misses'] == 2
+    
+    analyzer.train(features.iloc[:500], decisions.iloc[:500])
+    analyzer.analyze_decision(candidate)
+    assert analyzer.prediction_cache.stats['misses'] == 3
+    assert len(analyzer.prediction_cache.entries) == 1
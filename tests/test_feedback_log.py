@@ -0,0 +1,118 @@
+import os
+import pytest
+import threading
+from datetime import datetime, timedelta
+from abdmf.feedback_log import FeedbackLog
+from abdmf.feedback_store import FeedbackStore
+from abdmf.feedback_system import FeedbackSystem
+
+@pytest.fixture
+def sample_feedback():
+    """Generate sample feedback data."""
+    return {
+        'satisfaction': 4,
+        'category': 'System_Usability',
+        'comments': 'System works well',
+        'issues': None
+    }
+
+def persistent_system(path, **persistence):
+    """Create a FeedbackSystem logging to ``path``."""
+    config = dict(FeedbackSystem().config)
+    config['persistence'] = {'path': str(path), **persistence}
+    return FeedbackSystem(config)
+
+def test_recovery(tmp_path, sample_feedback):
+    """Test that feedback, edits and retention are recovered from the log."""
+    system = persistent_system(tmp_path)
+    for days_ago in (400, 3, 0):
+        system.collect_feedback('HR', {
+            **sample_feedback, 'timestamp': datetime.now() - timedelta(days=days_ago)
+        })
+    system.collect_feedback('Manager', {**sample_feedback, 'satisfaction': 2})
+    system.feedback_data[0]['timestamp'] = datetime.now() - timedelta(days=10)
+    system.feedback_data[-1]['comments'] = 'Edited'
+    expected = [dict(entry) for entry in system.feedback_data]
+    analysis = system.analyze_feedback()
+    system.close()
+    
+    recovered = persistent_system(tmp_path)
+    assert [dict(entry) for entry in recovered.feedback_data] == expected
+    assert recovered.analyze_feedback()['overall_metrics'] == analysis['overall_metrics']
+    recovered.close()
+
+def test_snapshot_recovery(tmp_path, sample_feedback):
+    """Test that recovery replays only the records after the latest snapshot."""
+    system = persistent_system(tmp_path, snapshot_interval=5)
+    for i in range(12):
+        system.collect_feedback('HR', {**sample_feedback, 'satisfaction': 1 + i % 5})
+        # Snapshots are written in the background; wait so each interval takes one
+        system.feedback_data[-1]['comments'] = f'Edited {i}'
+        system.log.wait_for_snapshot()
+    expected = [dict(entry) for entry in system.feedback_data]
+    system.close()
+    
+    assert sorted(os.listdir(tmp_path)) == ['log-000000000021.jsonl', 'snapshot-000000000020']
+    
+    recovered = persistent_system(tmp_path)
+    assert recovered.log.snapshot_seq == 20
+    assert len(list(recovered.log.replay())) == 4
+    assert [dict(entry) for entry in recovered.feedback_data] == expected
+    assert recovered.analyze_feedback()['overall_metrics']['average_satisfaction'] == pytest.approx(33 / 12)
+    recovered.close()
+
+def test_background_snapshot(tmp_path, sample_feedback):
+    """Test that a snapshot written in the background saves the state it was taken with."""
+    system = persistent_system(tmp_path, snapshot_interval=0)
+    for _ in range(3):
+        system.collect_feedback('HR', sample_feedback)
+    
+    copy = system.store.copy()
+    started, release = threading.Event(), threading.Event()
+    def save(path):
+        started.set()
+        release.wait()
+        copy.save(path)
+    
+    system.log.snapshot(save, wait=False)
+    started.wait()
+    assert system.log.snapshot_in_progress
+    # Feedback keeps flowing while the snapshot is written
+    system.collect_feedback('Manager', sample_feedback)
+    system.feedback_data[0]['satisfaction'] = 1
+    release.set()
+    system.close()
+    
+    snapshot = FeedbackStore.load(system.log.snapshot_path)
+    assert len(snapshot) == 3
+    assert snapshot.get_entry(0)['satisfaction'] == 4
+    
+    recovered = persistent_system(tmp_path)
+    assert len(list(recovered.log.replay())) == 2
+    assert len(recovered.feedback_data) == 4
+    assert recovered.feedback_data[0]['satisfaction'] == 1
+    recovered.close()
+
+def test_group_commit(tmp_path):
+    """Test concurrent synchronous appends and a torn last record."""
+    log = FeedbackLog(str(tmp_path), durability='sync')
+    threads = [
+        threading.Thread(target=lambda: [log.append({'op': 'noop'}) for _ in range(50)])
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    log.close()
+    
+    with open(tmp_path / 'log-000000000001.jsonl', 'a') as f:
+        f.write('{"seq": 201, "op"')
+    
+    log = FeedbackLog(str(tmp_path))
+    assert log.seq == 200
+    assert [record['seq'] for record in log.replay()] == list(range(1, 201))
+    log.close()
+    
+    with pytest.raises(ValueError):
+        FeedbackLog(str(tmp_path), durability='eventual')
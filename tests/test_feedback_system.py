@@ -111,3 +111,140 @@ def test_feedback_trends(feedback_system, sample_feedback):
     assert isinstance(trend, dict)
     assert 'trend_direction' in trend
     assert 'trend_strength' in trend
+
+def test_columnar_store(feedback_system, sample_feedback):
+    """Test feedback is stored in typed, dictionary-encoded columns."""
+    for i in range(3000):
+        feedback = sample_feedback.copy()
+        feedback['satisfaction'] = 1 + i % 5
+        feedback['category'] = ['System_Usability', 'Transparency'][i % 2]
+        feedback_system.collect_feedback(['HR', 'Manager', 'Candidate'][i % 3], feedback)
+    
+    store = feedback_system.store
+    assert len(store) == 3000
+    assert store.user_types == ['HR', 'Manager', 'Candidate']
+    assert store.categories == ['System_Usability', 'Transparency']
+    assert store.columns()['satisfaction'].dtype == 'float64'
+    assert store.columns()['user_type'].tolist()[:4] == [0, 1, 2, 0]
+    
+    entry = feedback_system.feedback_data[-1]
+    assert dict(entry) == {
+        'user_type': 'Candidate',
+        'timestamp': entry['timestamp'],
+        'satisfaction': 5,
+        'category': 'Transparency',
+        'comments': 'System works well',
+        'issues': None
+    }
+    
+    analysis = feedback_system.analyze_feedback()
+    assert analysis['user_type_analysis']['feedback_by_user_type'] == {
+        'HR': 1000, 'Manager': 1000, 'Candidate': 1000
+    }
+    assert analysis['category_analysis']['satisfaction_by_category']['Transparency'] == 3.0
+    
+    entry['satisfaction'] = 1
+    assert feedback_system.feedback_data[-1]['satisfaction'] == 1
+
+def test_analysis_cache(feedback_system, sample_feedback):
+    """Test cached analyses and their selective invalidation."""
+    feedback_system.collect_feedback('HR', sample_feedback)
+    feedback_system.collect_feedback('Manager', {**sample_feedback, 'satisfaction': 2})
+    
+    recent = feedback_system.analyze_feedback(timeframe_days=30)
+    overall = feedback_system.analyze_feedback()
+    assert set(feedback_system.analysis_cache) == {30, None}
+    assert feedback_system.analyze_feedback(timeframe_days=30)['overall_metrics'] == recent['overall_metrics']
+    
+    # Backfilled feedback only invalidates timeframes that include it
+    feedback_system.collect_feedback('HR', {
+        **sample_feedback, 'timestamp': datetime.now() - timedelta(days=60)
+    })
+    assert set(feedback_system.analysis_cache) == {30}
+    assert feedback_system.analyze_feedback()['overall_metrics']['total_feedback'] == 3
+    assert feedback_system.analyze_feedback(timeframe_days=30)['overall_metrics']['total_feedback'] == 2
+    
+    # Edits update the running aggregates; entries are ordered by day
+    feedback_system.feedback_data[-1]['satisfaction'] = 5
+    assert feedback_system.analysis_cache == {}
+    analysis = feedback_system.analyze_feedback()
+    assert analysis['overall_metrics']['average_satisfaction'] == pytest.approx(13 / 3)
+    assert analysis['user_type_analysis']['satisfaction_by_user_type'] == {'HR': 4.0, 'Manager': 5.0}
+    assert overall['overall_metrics']['total_feedback'] == 2
+
+def test_partitioned_retention(feedback_system, sample_feedback):
+    """Test day partitions, timeframe aggregates and retention."""
+    for days_ago in (400, 10, 10, 2, 0):
+        feedback_system.collect_feedback('HR', {
+            **sample_feedback,
+            'satisfaction': 1 + days_ago % 5,
+            'timestamp': datetime.now() - timedelta(days=days_ago)
+        })
+    
+    # Feedback past the retention period is dropped with its day
+    assert len(feedback_system.feedback_data) == 4
+    assert len(feedback_system.store.days) == 3
+    
+    analysis = feedback_system.analyze_feedback(timeframe_days=5)
+    assert analysis['overall_metrics']['total_feedback'] == 2
+    assert analysis['overall_metrics']['average_satisfaction'] == pytest.approx(2.0)
+    
+    # Moving an entry to another day moves it between partitions
+    feedback_system.feedback_data[-1]['timestamp'] = datetime.now() - timedelta(days=10)
+    oldest_day = feedback_system.store.partitions[feedback_system.store.days[0]]
+    assert oldest_day.size == 3
+    assert oldest_day.aggregates.count == 3
+    assert feedback_system.analyze_feedback(timeframe_days=5)['overall_metrics']['total_feedback'] == 1
+
+def test_streaming_trend(feedback_system, sample_feedback):
+    """Test rolling-mean, EWMA and slope trends maintained as feedback arrives."""
+    now = datetime.now()
+    for days_ago, satisfaction in [(40, 1), (20, 2), (3, 3), (2, 4), (1, 5)]:
+        feedback_system.collect_feedback('HR', {
+            **sample_feedback,
+            'satisfaction': satisfaction,
+            'timestamp': now - timedelta(days=days_ago)
+        })
+    
+    trend = feedback_system.analyze_feedback()['overall_metrics']['feedback_trend']
+    assert trend['trend_direction'] == trend['direction'] == 'improving'
+    assert trend['strength'] == pytest.approx(2.0)
+    assert trend['slope_per_day'] > 0
+    assert 3 < trend['ewma'] < 5
+    
+    # Only the entries of the last 30 days count for a timeframe
+    analysis = feedback_system.analyze_feedback(timeframe_days=30)
+    assert analysis['overall_metrics']['feedback_trend']['strength'] == pytest.approx(1.5)
+    by_user_type = analysis['user_type_analysis']['satisfaction_trend_by_user_type']
+    assert by_user_type['HR']['slope_per_day'] == pytest.approx(
+        analysis['overall_metrics']['feedback_trend']['slope_per_day']
+    )
+    
+    # Removing one of the newest entries refills the trend buffer
+    feedback_system.feedback_data[-1]['satisfaction'] = 1
+    trend = feedback_system.analyze_feedback()['overall_metrics']['feedback_trend']
+    assert trend['strength'] == pytest.approx(1.2)
+
+def test_entry_views(feedback_system, sample_feedback):
+    """Test locating entries across days and refreshing entry views after changes."""
+    for days_ago, satisfaction in ((3, 1), (1, 2), (2, 3), (0, 4), (3, 5)):
+        feedback_system.collect_feedback('HR', {
+            **sample_feedback,
+            'satisfaction': satisfaction,
+            'timestamp': datetime.now() - timedelta(days=days_ago)
+        })
+    
+    # Entries are ordered by day, oldest first
+    assert [entry['satisfaction'] for entry in feedback_system.feedback_data] == [1, 5, 3, 2, 4]
+    
+    entry = feedback_system.feedback_data[0]
+    assert dict(entry)['satisfaction'] == 1
+    assert len(list(entry.items())) == len(sample_feedback) + 2
+    
+    # Moving an entry to the newest day shifts the indexes after it
+    entry['timestamp'] = datetime.now()
+    assert [entry['satisfaction'] for entry in feedback_system.feedback_data] == [5, 3, 2, 4, 1]
+    assert entry['satisfaction'] == 5
+    
+    feedback_system.feedback_data[-1]['satisfaction'] = 2
+    assert dict(feedback_system.feedback_data[-1])['satisfaction'] == 2
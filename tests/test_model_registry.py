@@ -0,0 +1,82 @@
+import pytest
+import pandas as pd
+import numpy as np
+from abdmf import ABDMF
+from abdmf.decision_analyzer import DecisionAnalyzer
+from abdmf.model_registry import ModelRegistry
+
+@pytest.fixture
+def sample_data():
+    """Generate sample data for testing."""
+    np.random.seed(42)
+    n_samples = 500
+    
+    features = pd.DataFrame({
+        'experience': np.random.randint(0, 30, n_samples),
+        'education_level': np.random.choice(['BS', 'MS', 'PhD'], n_samples),
+        'interview_score': np.random.uniform(0, 100, n_samples)
+    })
+    
+    decisions = pd.Series(np.random.choice([0, 1], n_samples))
+    
+    return features, decisions
+
+@pytest.fixture
+def registry(tmp_path):
+    """Create ModelRegistry instance for testing."""
+    return ModelRegistry(str(tmp_path))
+
+def test_register_versions(registry, sample_data):
+    """Test registering versions with schema and training metadata."""
+    features, decisions = sample_data
+    analyzer = DecisionAnalyzer()
+    analyzer.train(features, decisions)
+    
+    assert registry.register(analyzer, {'rows': len(features)}) == 1
+    assert registry.register(analyzer) == 2
+    
+    versions = registry.versions()
+    assert [v['version'] for v in versions] == [1, 2]
+    assert versions[0]['training'] == {'rows': len(features)}
+    assert versions[0]['feature_schema']['categorical'] == ['education_level']
+    assert registry.production_version is None
+    
+    with pytest.raises(RuntimeError):
+        registry.load()
+    with pytest.raises(ValueError):
+        registry.get(3)
+
+def test_promote_and_rollback(registry, sample_data):
+    """Test promoting versions and rolling back."""
+    features, decisions = sample_data
+    analyzer = DecisionAnalyzer()
+    
+    analyzer.train(features, decisions)
+    first = registry.register(analyzer, promote=True)
+    analyzer.train(features.iloc[:250], decisions.iloc[:250])
+    second = registry.register(analyzer, promote=True)
+    
+    assert registry.production_version == second
+    loaded = registry.load()
+    assert loaded.analyze_decision(features.iloc[[0]])['prediction'] == \
+        analyzer.analyze_decision(features.iloc[[0]])['prediction']
+        
+    assert registry.rollback() == first
+    assert registry.production_version == first
+    with pytest.raises(RuntimeError):
+        registry.rollback()
+
+def test_bin_edges(registry, sample_data):
+    """Test bin edges are stored with the model and restored for monitoring."""
+    features, decisions = sample_data
+    analyzer = DecisionAnalyzer()
+    analyzer.train(features, decisions)
+    analyzer.bin_edges = {'age': np.array([30.0, 45.0])}
+    
+    version = registry.register(analyzer)
+    assert registry.get(version)['feature_schema']['bin_edges'] == {'age': [30.0, 45.0]}
+    
+    system = ABDMF()
+    system.bias_detector.config['binning'] = {'age': {'quantiles': 3}}
+    system.use_analyzer(registry.load(version))
+    assert system.bias_detector.bin_value('age', 40) == '30-45'
@@ -0,0 +1,76 @@
+import pytest
+import pandas as pd
+import numpy as np
+from abdmf.bias_detector import BiasDetector
+from abdmf.decision_analyzer import DecisionAnalyzer
+from abdmf.model_selection import CrossValidator
+
+@pytest.fixture
+def sample_data():
+    """Generate sample data for testing."""
+    np.random.seed(42)
+    n_samples = 600
+    
+    features = pd.DataFrame({
+        'experience': np.random.randint(0, 30, n_samples),
+        'education_level': np.random.choice(['BS', 'MS', 'PhD'], n_samples),
+        'interview_score': np.random.uniform(0, 100, n_samples)
+    })
+    decisions = pd.Series(
+        ((features['interview_score'] > 50) ^ (features['experience'] > 15)).astype(int)
+    )
+    protected = pd.DataFrame({
+        'gender': np.random.choice(['M', 'F'], n_samples),
+        'race': np.random.choice(['A', 'B', 'C'], n_samples)
+    })
+    
+    return features, decisions, protected
+
+@pytest.fixture
+def validator():
+    """Create CrossValidator instance for testing."""
+    analyzer = DecisionAnalyzer()
+    analyzer.config['model_params']['n_estimators'] = 10
+    detector = BiasDetector()
+    detector.config['minimum_sample_size'] = 10
+    return CrossValidator(analyzer, detector, n_folds=3, n_jobs=1)
+
+def test_cross_validate(validator, sample_data):
+    """Test per-fold accuracy and disparate impact."""
+    features, decisions, protected = sample_data
+    result = validator.cross_validate(features, decisions, protected)
+    
+    assert len(result['folds']) == 3
+    assert result['mean_accuracy'] > 0.9
+    for fold in result['folds']:
+        assert 0 <= fold['accuracy'] <= 1
+        assert set(fold['disparate_impact']) == {'gender', 'race'}
+        assert all(0 <= v <= 1 for v in fold['disparate_impact'].values())
+        
+    # Workers in a process pool produce the same folds
+    validator.n_jobs = 2
+    assert validator.cross_validate(features, decisions, protected) == result
+    
+    # The analyzer's model is not fitted by cross-validation
+    assert not hasattr(validator.decision_analyzer.model, 'estimators_')
+
+def test_successive_halving(validator, sample_data):
+    """Test successive halving search over model parameters."""
+    features, decisions, protected = sample_data
+    search = validator.successive_halving(
+        features, decisions,
+        {'max_depth': [1, 3, None], 'min_samples_split': [2, 20]},
+        protected
+    )
+    
+    assert len(search['rounds'][0]['results']) == 6
+    assert search['rounds'][-1]['rows'] == len(features)
+    assert len(search['rounds'][-1]['results']) < 6
+    assert search['best_params']['max_depth'] != 1
+    assert validator.decision_analyzer.model.get_params()['max_depth'] == search['best_params']['max_depth']
+    
+    # No round after the first starts once the time budget is spent
+    search = validator.successive_halving(
+        features, decisions, {'max_depth': [1, 3, None]}, time_budget=0
+    )
+    assert len(search['rounds']) == 1
@@ -0,0 +1,48 @@
+import pytest
+import pandas as pd
+import numpy as np
+from abdmf.bias_detector import BiasDetector
+from abdmf.parallel_scan import ParallelBiasScanner
+
+@pytest.fixture
+def sample_data():
+    """Generate sample data for testing."""
+    np.random.seed(42)
+    n_samples = 2000
+    
+    return pd.DataFrame({
+        'gender': np.random.choice(['M', 'F'], n_samples),
+        'race': np.random.choice(['A', 'B', 'C'], n_samples),
+        'age': np.random.randint(22, 65, n_samples),
+        'business_unit': np.random.choice(['Sales', 'Engineering'], n_samples),
+        'selected': np.random.choice([0, 1], n_samples)
+    })
+
+def _without_timestamp(report):
+    return {k: v for k, v in report.items() if k != 'timestamp'}
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_parallel_report_matches_serial(sample_data, n_jobs):
+    """Test parallel reports are identical to the serial report."""
+    scanner = ParallelBiasScanner(BiasDetector(), n_jobs=n_jobs, rows_per_task=300)
+    parallel = scanner.generate_bias_report(sample_data)
+    serial = BiasDetector().generate_bias_report(sample_data)
+    
+    assert _without_timestamp(parallel) == _without_timestamp(serial)
+
+def test_partitioned_reports(sample_data):
+    """Test one report per business unit."""
+    scanner = ParallelBiasScanner(BiasDetector(), n_jobs=2, rows_per_task=500)
+    reports = scanner.generate_partitioned_reports(sample_data, 'business_unit')
+    
+    assert set(reports) == {'Sales', 'Engineering'}
+    for unit, report in reports.items():
+        serial = BiasDetector().generate_bias_report(
+            sample_data[sample_data['business_unit'] == unit]
+        )
+        assert _without_timestamp(report) == _without_timestamp(serial)
+
+def test_invalid_partition(sample_data):
+    """Test handling of an unknown partition column."""
+    with pytest.raises(ValueError):
+        ParallelBiasScanner(n_jobs=1).generate_partitioned_reports(sample_data, 'region')
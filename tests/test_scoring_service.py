@@ -0,0 +1,135 @@
+import json
+import time
+import asyncio
+import pytest
+import pandas as pd
+import numpy as np
+from abdmf import ABDMF
+from abdmf.scoring_service import ScoringService, serve_http
+
+@pytest.fixture(scope='module')
+def system():
+    """Create an ABDMF instance trained on sample data."""
+    np.random.seed(42)
+    n_samples = 500
+    
+    data = pd.DataFrame({
+        'gender': np.random.choice(['M', 'F'], n_samples),
+        'experience': np.random.randint(0, 30, n_samples),
+        'education_score': np.random.uniform(0, 100, n_samples),
+        'selected': np.random.choice([0, 1], n_samples)
+    })
+    system = ABDMF()
+    system.scan_historical_data(data)
+    system.candidates = data.drop(columns='selected').iloc[:10]
+    
+    return system
+
+def test_micro_batching(system):
+    """Test concurrent requests are coalesced and resolved individually."""
+    async def run():
+        async with ScoringService(system, max_batch_size=4, max_wait_ms=50) as service:
+            results = await asyncio.gather(*[
+                service.evaluate(system.candidates.iloc[[i]])
+                for i in range(len(system.candidates))
+            ])
+        return results, service.stats
+    
+    results, stats = asyncio.run(run())
+    expected = system.evaluate_candidates(system.candidates)
+    
+    assert [r['decision_analysis'] for r in results] == [e['decision_analysis'] for e in expected]
+    assert stats == {'requests': 10, 'batches': 3}
+
+def test_failing_request_is_isolated(system):
+    """Test an invalid request does not fail the rest of its batch."""
+    async def run():
+        async with ScoringService(system, max_batch_size=8, max_wait_ms=50) as service:
+            return await asyncio.gather(
+                service.evaluate(system.candidates.iloc[[0]]),
+                service.evaluate(system.candidates.iloc[[1]].assign(experience='n/a')),
+                return_exceptions=True
+            )
+    
+    good, bad = asyncio.run(run())
+    assert 'decision_analysis' in good
+    assert isinstance(bad, Exception)
+
+def test_http_endpoint(system):
+    """Test the local HTTP stand-in endpoint."""
+    async def run():
+        async with ScoringService(system) as service:
+            server = await serve_http(service, port=0)
+            port = server.sockets[0].getsockname()[1]
+            
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            body = json.dumps({'gender': 'F', 'experience': 5, 'education_score': 80}).encode()
+            writer.write(
+                f"POST /evaluate HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n".encode() + body
+            )
+            response = await reader.read()
+            writer.close()
+            
+            server.close()
+            await server.wait_closed()
+        return response
+    
+    status, _, body = asyncio.run(run()).partition(b'\r\n\r\n')
+    assert status.startswith(b'HTTP/1.1 200')
+    result = json.loads(body)
+    assert result['protected_attributes'] == {'gender': 'F'}
+    assert isinstance(result['decision_analysis']['prediction'], bool)
+
+def test_stop_with_request_in_flight(system):
+    """Test stop finishes an in-flight request and refuses new ones."""
+    class SlowSystem:
+        def evaluate_candidates(self, candidates):
+            time.sleep(0.3)
+            return system.evaluate_candidates(candidates)
+    
+    async def run():
+        service = ScoringService(SlowSystem(), max_wait_ms=1)
+        await service.start()
+        request = asyncio.ensure_future(service.evaluate(system.candidates.iloc[[0]]))
+        await asyncio.sleep(0.05)
+        
+        await asyncio.wait_for(service.stop(), timeout=5)
+        result = await asyncio.wait_for(request, timeout=1)
+        
+        with pytest.raises(RuntimeError):
+            await service.evaluate(system.candidates.iloc[[1]])
+        return result
+    
+    assert 'decision_analysis' in asyncio.run(run())
+
+def test_cancelled_stop_cancels_requests(system):
+    """Test requests taken off the queue are cancelled if the worker is."""
+    class SlowSystem:
+        def evaluate_candidates(self, candidates):
+            time.sleep(0.3)
+            return system.evaluate_candidates(candidates)
+    
+    async def run():
+        service = ScoringService(SlowSystem(), max_wait_ms=1)
+        await service.start()
+        request = asyncio.ensure_future(service.evaluate(system.candidates.iloc[[0]]))
+        await asyncio.sleep(0.05)
+        
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(service.stop(), timeout=0.01)
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(request, timeout=1)
+    
+    asyncio.run(run())
+
+def test_configured_service(system):
+    """Test the service factory reads the scoring_service settings."""
+    system.config['scoring_service'] = {'max_batch_size': 16, 'max_wait_ms': 2}
+    try:
+        service = system.scoring_service()
+    finally:
+        del system.config['scoring_service']
+    
+    assert service.system is system
+    assert (service.max_batch_size, service.max_wait_ms) == (16, 2)
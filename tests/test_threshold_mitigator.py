@@ -0,0 +1,90 @@
+import itertools
+import pytest
+import pandas as pd
+import numpy as np
+from abdmf import ABDMF
+from abdmf.threshold_mitigator import ThresholdMitigator
+
+@pytest.fixture
+def sample_data():
+    """Generate biased validation scores for testing."""
+    np.random.seed(42)
+    n_samples = 2000
+    
+    groups = np.random.choice(['A', 'B', 'C'], n_samples)
+    scores = np.random.uniform(0, 1, n_samples) * np.where(groups == 'A', 1.0, 0.6)
+    labels = np.random.uniform(0, 1, n_samples) < scores
+    
+    return scores, labels, groups
+
+@pytest.fixture
+def mitigator():
+    """Create ThresholdMitigator instance for testing."""
+    return ThresholdMitigator(target_disparate_impact=0.8)
+
+def test_target_disparate_impact(mitigator, sample_data):
+    """Test fitted thresholds reach the target ratio."""
+    scores, labels, groups = sample_data
+    baseline = pd.Series(scores >= 0.5).groupby(groups).mean()
+    assert baseline.min() / baseline.max() < 0.8
+    
+    mitigator.fit(scores, labels, groups)
+    decisions = mitigator.predict(scores, groups)
+    rates = pd.Series(decisions).groupby(groups).mean()
+    
+    assert rates.min() / rates.max() >= 0.8
+    assert mitigator.fit_summary['disparate_impact'] == pytest.approx(rates.min() / rates.max())
+    assert mitigator.fit_summary['accuracy'] == pytest.approx(np.mean(decisions == labels))
+    
+    # Unseen and missing groups use the default threshold
+    assert mitigator.predict([0.6, 0.4], ['D', None]).tolist() == [True, False]
+
+def test_optimal_thresholds(mitigator):
+    """Test the sweep finds the most accurate feasible thresholds."""
+    rng = np.random.RandomState(0)
+    for _ in range(20):
+        scores = np.round(rng.uniform(0, 1, 12), 1)
+        labels = rng.uniform(0, 1, 12) < scores
+        groups = rng.choice(['A', 'B'], 12)
+        
+        mitigator.fit(scores, labels, groups)
+        accuracy = np.mean(mitigator.predict(scores, groups) == labels)
+        
+        # Exhaustive search over every pair of thresholds
+        candidates = np.concatenate([[np.inf], np.unique(scores)])
+        best = 0
+        for a, b in itertools.product(candidates, repeat=2):
+            decisions = scores >= np.where(groups == 'A', a, b)
+            rates = [decisions[groups == g].mean() for g in ['A', 'B']]
+            if max(rates) == 0 or min(rates) / max(rates) >= 0.8:
+                best = max(best, np.mean(decisions == labels))
+                
+        assert accuracy == pytest.approx(best)
+
+def test_mitigated_evaluation():
+    """Test thresholds are applied when evaluating candidates."""
+    np.random.seed(42)
+    n_samples = 1000
+    data = pd.DataFrame({
+        'gender': np.random.choice(['M', 'F'], n_samples),
+        'experience': np.random.randint(0, 30, n_samples),
+        'interview_score': np.random.uniform(0, 100, n_samples)
+    })
+    data['selected'] = (
+        (data['interview_score'] > 50) & ((data['gender'] == 'M') | (data['experience'] > 20))
+    ).astype(int)
+    
+    system = ABDMF()
+    system.scan_historical_data(data.iloc[:600])
+    summary = system.fit_mitigation(data.iloc[600:], 'gender')
+    assert summary['disparate_impact'] >= 0.8
+    assert set(summary['thresholds']) == {'M', 'F'}
+    
+    results = system.evaluate_candidates(data.iloc[600:])
+    decisions = pd.Series([r['decision_analysis']['prediction'] for r in results])
+    rates = decisions.groupby(data['gender'].iloc[600:].to_numpy()).mean()
+    assert rates.min() / rates.max() >= 0.8
+    assert any(r['decision_analysis']['mitigated'] for r in results)
+    
+    single = system.evaluate_candidate(data.iloc[[600]])
+    assert single['decision_analysis']['prediction'] == results[0]['decision_analysis']['prediction']
@@ -0,0 +1,52 @@
+import pytest
+import pandas as pd
+import numpy as np
+from abdmf.utils import iter_data_chunks, ReservoirSample, map_in_workers, worker_state
+
+def scaled(task):
+    return worker_state['scale'] * task
+
+@pytest.fixture
+def sample_data():
+    """Generate sample data for testing."""
+    np.random.seed(42)
+    n_samples = 1000
+    
+    return pd.DataFrame({
+        'gender': np.random.choice(['M', 'F'], n_samples),
+        'experience': np.random.randint(0, 30, n_samples),
+        'selected': np.random.choice([0, 1], n_samples)
+    })
+
+def test_csv_chunks(sample_data, tmp_path):
+    """Test reading a CSV file in chunks."""
+    path = tmp_path / "history.csv"
+    sample_data.to_csv(path, index=False)
+    
+    chunks = list(iter_data_chunks(str(path), chunksize=300))
+    assert [len(c) for c in chunks] == [300, 300, 300, 100]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), sample_data)
+
+def test_invalid_chunks():
+    """Test handling of iterables that do not yield DataFrames."""
+    with pytest.raises(ValueError):
+        list(iter_data_chunks([[1, 2, 3]]))
+
+def test_reservoir_sample(sample_data):
+    """Test reservoir sampling keeps a bounded sample of distinct rows."""
+    reservoir = ReservoirSample(100, random_state=42)
+    for chunk in iter_data_chunks(sample_data, chunksize=128):
+        reservoir.update(chunk)
+    
+    assert reservoir.rows_seen == len(sample_data)
+    assert len(reservoir.sample) == 100
+    
+    small = ReservoirSample(2000)
+    small.update(sample_data)
+    assert len(small.sample) == len(sample_data)
+
+def test_map_in_workers():
+    """Test mapping tasks in this process and over a pool share worker state."""
+    assert map_in_workers(scaled, [1, 2, 3], {'scale': 10}, n_jobs=1) == [10, 20, 30]
+    assert worker_state == {}
+    assert map_in_workers(scaled, [1, 2, 3], {'scale': 10}, n_jobs=2) == [10, 20, 30]